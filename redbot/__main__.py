@@ -499,6 +499,10 @@ def main():
 
         data_manager.load_basic_configuration(cli_flags.instance_name)
 
+        # needs to be enabled before the first Config instance gets created
+        loop.run_until_complete(
+            _drivers.CachingDriver.initialize(max_size=cli_flags.config_cache_size * 1024**2)
+        )
         red = Red(cli_flags=cli_flags, description="Red V3", dm_help=None)
 
         if os.name != "nt":
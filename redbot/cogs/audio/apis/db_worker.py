@@ -0,0 +1,305 @@
+import asyncio
+import bisect
+import collections
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from red_commons.logging import getLogger
+
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+
+log = getLogger("red.cogs.Audio.api.DatabaseWorker")
+
+# Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Request kinds
+_EXECUTE = 0
+_FETCHONE = 1
+_FETCHALL = 2
+_WRITE = 3
+_WRITEMANY = 4
+
+
+class _Request:
+    __slots__ = ("kind", "sql", "bindings", "loop", "future", "enqueued")
+
+    def __init__(
+        self,
+        kind: int,
+        sql: str,
+        bindings: Any,
+        loop: asyncio.AbstractEventLoop,
+        future: asyncio.Future,
+    ):
+        self.kind = kind
+        self.sql = sql
+        self.bindings = bindings
+        self.loop = loop
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+    @property
+    def is_write(self) -> bool:
+        return self.kind in (_WRITE, _WRITEMANY)
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        # Upper bound of the bucket the percentile falls into.
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip((*LATENCY_BUCKETS, float("inf")), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": dict(zip((*LATENCY_BUCKETS, float("inf")), self.counts)),
+            "count": self.count,
+            "sum": self.total,
+            "p95": self.percentile(0.95),
+        }
+
+
+def _set_result(future: asyncio.Future, result: Any, exc: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+class DatabaseWorker:
+    """Runs all queries on an APSW connection in one dedicated thread.
+
+    Queries are queued and awaited from the event loop, so slow disk I/O never
+    blocks it. The worker reuses a single cursor, which lets the statement cache
+    of the connection reuse the prepared statements of the fixed set of queries
+    Audio runs.
+
+    Writes that are queued back-to-back are committed in a single transaction,
+    each in its own savepoint so that a failing write doesn't undo the others.
+    Statements which can't run in a transaction (e.g. ``PRAGMA journal_mode``)
+    should be run with `execute()` instead.
+
+    Parameters
+    ----------
+    connection : APSWConnectionWrapper
+        The connection to take over. It must not be used by anything else
+        until the worker is closed.
+    max_batch_size : int
+        Maximum number of requests taken off the queue at once.
+    """
+
+    def __init__(self, connection: APSWConnectionWrapper, *, max_batch_size: int = 500):
+        self.connection = connection
+        self.max_batch_size = max_batch_size
+        self._queue: Deque[Optional[_Request]] = collections.deque()
+        self._ready = threading.Condition()
+        self._closed = False
+        self._closed_event = threading.Event()
+        self._max_queue_depth = 0
+        self._batches = 0
+        self._transactions = 0
+        self._errors = 0
+        self._wait_latency = _Histogram()
+        self._read_latency = _Histogram()
+        self._write_latency = _Histogram()
+        self._thread = threading.Thread(
+            target=self._run, name="Audio database worker", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for the worker."""
+        return len(self._queue)
+
+    def _submit(self, kind: int, sql: str, bindings: Any) -> asyncio.Future:
+        if self._closed:
+            raise RuntimeError("The database worker is closed.")
+        loop = asyncio.get_running_loop()
+        request = _Request(kind, sql, bindings, loop, loop.create_future())
+        with self._ready:
+            self._queue.append(request)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._ready.notify()
+        return request.future
+
+    async def execute(self, sql: str, bindings: Any = None) -> None:
+        """Run a statement on its own, outside of any transaction."""
+        await self._submit(_EXECUTE, sql, bindings)
+
+    async def fetchone(self, sql: str, bindings: Any = None) -> Optional[tuple]:
+        """Run a query and return its first row, or ``None`` if it has none."""
+        return await self._submit(_FETCHONE, sql, bindings)
+
+    async def fetchall(self, sql: str, bindings: Any = None) -> List[tuple]:
+        """Run a query and return all of its rows."""
+        return await self._submit(_FETCHALL, sql, bindings)
+
+    async def write(self, sql: str, bindings: Any = None) -> None:
+        """Run a statement as part of the next batch of writes."""
+        await self._submit(_WRITE, sql, bindings)
+
+    async def writemany(self, sql: str, sequence_of_bindings: Iterable[Any]) -> None:
+        """Run a statement for each of the bindings as part of the next batch of writes."""
+        await self._submit(_WRITEMANY, sql, list(sequence_of_bindings))
+
+    async def close(self) -> None:
+        """Finish the queued requests and close the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._ready:
+            self._queue.append(None)
+            self._ready.notify()
+        await asyncio.get_running_loop().run_in_executor(None, self._closed_event.wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the counters of the worker.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary with the current and maximum ``queue_depth``,
+            the number of ``batches`` taken off the queue, write ``transactions``
+            and failed requests (``errors``), and ``latency`` histograms of the time
+            requests spent waiting in the queue (``wait``) and running (``read``
+            and ``write``). Histogram buckets are keyed by their upper bound in seconds,
+            and ``p95`` is the upper bound of the bucket of the 95th percentile.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "batches": self._batches,
+            "transactions": self._transactions,
+            "errors": self._errors,
+            "latency": {
+                "wait": self._wait_latency.to_dict(),
+                "read": self._read_latency.to_dict(),
+                "write": self._write_latency.to_dict(),
+            },
+        }
+
+    def _run(self) -> None:
+        cursor = self.connection.cursor()
+        try:
+            while True:
+                with self._ready:
+                    while not self._queue:
+                        self._ready.wait()
+                    batch = []
+                    while self._queue and len(batch) < self.max_batch_size:
+                        batch.append(self._queue.popleft())
+                self._batches += 1
+                closing = None in batch
+                requests = [request for request in batch if request is not None]
+                started = time.perf_counter()
+                for request in requests:
+                    self._wait_latency.observe(started - request.enqueued)
+
+                # Run consecutive writes in a single transaction, and the rest one by one.
+                idx = 0
+                while idx < len(requests):
+                    if requests[idx].is_write:
+                        end = idx
+                        while end < len(requests) and requests[end].is_write:
+                            end += 1
+                        self._run_writes(cursor, requests[idx:end])
+                        idx = end
+                    else:
+                        self._run_read(cursor, requests[idx])
+                        idx += 1
+                if closing:
+                    break
+        finally:
+            try:
+                cursor.close()
+                self.connection.close()
+            except Exception as exc:
+                log.verbose("Failed to close the database connection", exc_info=exc)
+            self._closed_event.set()
+
+    def _run_read(self, cursor, request: _Request) -> None:
+        started = time.perf_counter()
+        try:
+            cursor.execute(request.sql, request.bindings)
+            if request.kind == _FETCHONE:
+                result = cursor.fetchone()
+            elif request.kind == _FETCHALL:
+                result = cursor.fetchall()
+            else:
+                # Exhaust the statements so that all of them run.
+                for __ in cursor:
+                    pass
+                result = None
+        except Exception as exc:
+            self._errors += 1
+            self._resolve(request, None, exc)
+        else:
+            self._resolve(request, result, None)
+        self._read_latency.observe(time.perf_counter() - started)
+
+    def _run_writes(self, cursor, requests: List[_Request]) -> None:
+        started = time.perf_counter()
+        results: List[Tuple[_Request, Optional[BaseException]]] = []
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            for request in requests:
+                cursor.execute("SAVEPOINT request")
+                try:
+                    if request.kind == _WRITEMANY:
+                        if request.bindings:
+                            cursor.executemany(request.sql, request.bindings)
+                    else:
+                        cursor.execute(request.sql, request.bindings)
+                except Exception as exc:
+                    cursor.execute("ROLLBACK TO SAVEPOINT request")
+                    results.append((request, exc))
+                else:
+                    results.append((request, None))
+                cursor.execute("RELEASE SAVEPOINT request")
+            cursor.execute("COMMIT TRANSACTION")
+        except Exception as exc:
+            # The transaction itself failed, none of the writes were committed.
+            try:
+                if not self.connection.getautocommit():
+                    cursor.execute("ROLLBACK TRANSACTION")
+            except Exception as rollback_exc:
+                log.verbose("Failed to roll back a transaction", exc_info=rollback_exc)
+            results = [(request, exc) for request in requests]
+        self._transactions += 1
+        elapsed = time.perf_counter() - started
+        for request, exc in results:
+            self._write_latency.observe(elapsed)
+            if exc is not None:
+                self._errors += 1
+            self._resolve(request, None, exc)
+
+    @staticmethod
+    def _resolve(request: _Request, result: Any, exc: Optional[BaseException]) -> None:
+        try:
+            request.loop.call_soon_threadsafe(_set_result, request.future, result, exc)
+        except RuntimeError:
+            # The event loop which made the request is closed, there's no one to tell.
+            pass
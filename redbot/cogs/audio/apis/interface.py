@@ -1,13 +1,24 @@
 import asyncio
 import contextlib
 import datetime
+import itertools
 import json
 import random
 import time
 
-from collections import namedtuple
+from collections import deque, namedtuple
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp
 import discord
@@ -20,18 +31,20 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog, Context
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 from ..audio_dataclasses import Query
 from ..errors import DatabaseError, SpotifyFetchError, TrackEnqueueError, YouTubeApiError
 from ..utils import CacheLevel, Notifier
 from .api_utils import LavalinkCacheFetchForGlobalResult
+from .db_worker import DatabaseWorker
 from .global_db import GlobalCacheWrapper
 from .local_db import LocalCacheWrapper
+from .local_tracks_wrapper import LocalTracksWrapper
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
 from .playlist_wrapper import PlaylistWrapper
 from .spotify import SpotifyWrapper
+from .track_cache import TrackCache
 from .youtube import YouTubeWrapper
 
 if TYPE_CHECKING:
@@ -42,6 +55,13 @@ log = getLogger("red.cogs.Audio.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
 # TODO: Get random from global Cache
 
+# Number of tracks of a Spotify playlist that are resolved at the same time.
+_SPOTIFY_ENQUEUE_CONCURRENCY = 10
+# Limits for concurrent calls made while resolving Spotify tracks, shared by all guilds.
+_YOUTUBE_API_CONCURRENCY = 4
+_GLOBAL_API_CONCURRENCY = 4
+_LAVALINK_CONCURRENCY = 4
+
 
 class AudioAPIInterface:
     """Handles music queries.
@@ -54,30 +74,41 @@ class AudioAPIInterface:
         bot: Red,
         config: Config,
         session: aiohttp.ClientSession,
-        conn: APSWConnectionWrapper,
+        database: DatabaseWorker,
         cog: Union["Audio", Cog],
     ):
         self.bot = bot
         self.config = config
-        self.conn = conn
+        self.database = database
         self.cog = cog
         self.spotify_api: SpotifyWrapper = SpotifyWrapper(self.bot, self.config, session, self.cog)
         self.youtube_api: YouTubeWrapper = YouTubeWrapper(self.bot, self.config, session, self.cog)
-        self.local_cache_api = LocalCacheWrapper(self.bot, self.config, self.conn, self.cog)
+        self.local_cache_api = LocalCacheWrapper(self.bot, self.config, self.database, self.cog)
         self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, session, self.cog)
-        self.persistent_queue_api = QueueInterface(self.bot, self.config, self.conn, self.cog)
+        self.persistent_queue_api = QueueInterface(self.bot, self.config, self.database, self.cog)
+        self.local_tracks_api = LocalTracksWrapper(self.bot, self.config, self.database)
+        self.track_cache = TrackCache()
         self._session: aiohttp.ClientSession = session
         self._tasks: MutableMapping = {}
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._youtube_api_semaphore = asyncio.Semaphore(_YOUTUBE_API_CONCURRENCY)
+        self._global_api_semaphore = asyncio.Semaphore(_GLOBAL_API_CONCURRENCY)
+        self._lavalink_semaphore = asyncio.Semaphore(_LAVALINK_CONCURRENCY)
 
     async def initialize(self) -> None:
         """Initialises the Local Cache connection."""
         await self.local_cache_api.lavalink.init()
         await self.persistent_queue_api.init()
+        await self.local_tracks_api.init()
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Closes the Local Cache connection."""
-        self.local_cache_api.lavalink.close()
+        await self.local_cache_api.lavalink.close()
+
+    async def _get_cache_maxage(self) -> int:
+        """Get the timestamp at or before which cached entries are expired."""
+        cache_age = datetime.timedelta(days=await self.config.cache_age())
+        return int((datetime.datetime.now(datetime.timezone.utc) - cache_age).timestamp())
 
     async def get_random_track_from_db(self, tries=0) -> Optional[MutableMapping]:
         """Get a random track from the local database and return it."""
@@ -117,22 +148,27 @@ class AudioAPIInterface:
 
         if not data:
             return
+        tables = {
+            "lavalink": self.local_cache_api.lavalink,
+            "youtube": self.local_cache_api.youtube,
+            "spotify": self.local_cache_api.spotify,
+        }
         if action_type == "insert" and isinstance(data, list):
+            # One transaction per table, however many rows were queued.
+            rows: MutableMapping[str, List[MutableMapping]] = {}
             for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.insert(d)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.insert(d)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.insert(d)
-        elif action_type == "update" and isinstance(data, dict):
+                rows.setdefault(table, []).extend(d)
+            await asyncio.gather(
+                *(tables[table].upsert_many(d) for table, d in rows.items() if table in tables)
+            )
+        elif action_type == "update" and isinstance(data, list):
+            # One statement per table, however many entries were fetched.
+            keys: MutableMapping[str, List[str]] = {}
             for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.update(data)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.update(data)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.update(data)
+                keys.setdefault(table, []).extend(d.values())
+            await asyncio.gather(
+                *(tables[table].update_many(k) for table, k in keys.items() if table in tables)
+            )
         elif action_type == "global" and isinstance(data, list):
             await asyncio.gather(*[self.global_cache_api.update_global(**d) for d in data])
 
@@ -168,7 +204,7 @@ class AudioAPIInterface:
                 tasks: MutableMapping = {"update": [], "insert": [], "global": []}
                 async for k, task in AsyncIter(self._tasks.items()):
                     async for t, args in AsyncIter(task.items()):
-                        tasks[t].append(args)
+                        tasks[t].extend(args)
                 self._tasks = {}
                 coro_tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
 
@@ -235,17 +271,15 @@ class AudioAPIInterface:
                     "last_fetched": time_now,
                 }
             )
+        if youtube_cache and skip_youtube is False:
+            cached_urls = await self.fetch_youtube_cache(
+                [entry["track_info"] for entry in database_entries]
+            )
+        else:
+            cached_urls = [None] * len(database_entries)
+        async for entry, val in AsyncIter(zip(database_entries, cached_urls)):
+            track_info = entry["track_info"]
             if skip_youtube is False:
-                val = None
-                if youtube_cache:
-                    try:
-                        (val, last_update) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to fetch %r from YouTube table", track_info, exc_info=exc
-                        )
                 if val is None:
                     try:
                         val = await self.fetch_youtube_query(
@@ -451,7 +485,8 @@ class AudioAPIInterface:
         track_list: List = []
         has_not_allowed = False
         youtube_api_error = None
-        skip_youtube_api = False
+        # Playlist index of the first track that failed on the YouTube API.
+        youtube_api_error_index: Optional[int] = None
         try:
             current_cache_level = CacheLevel(await self.config.cache_level())
             guild_data = await self.config.guild(ctx.guild).all()
@@ -474,10 +509,11 @@ class AudioAPIInterface:
 
                 return track_list
             database_entries = []
+            spotify_tracks = []
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
             spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
-            async for track_count, track in AsyncIter(tracks_from_spotify).enumerate(start=1):
+            async for track in AsyncIter(tracks_from_spotify):
                 (
                     song_url,
                     track_info,
@@ -501,131 +537,173 @@ class AudioAPIInterface:
                         "last_fetched": time_now,
                     }
                 )
-                val = None
+                spotify_tracks.append((track_info, track_name, artist_name))
+            if youtube_cache:
+                cached_urls = await self.fetch_youtube_cache([t[0] for t in spotify_tracks])
+            else:
+                cached_urls = [None] * len(spotify_tracks)
+
+            async def resolve(
+                index: int, track_info: str, track_name: str, artist_name: str, val: Optional[str]
+            ) -> Tuple[List[lavalink.Track], Optional[str]]:
+                nonlocal youtube_api_error_index
                 llresponse = None
-                if youtube_cache:
-                    try:
-                        (val, last_updated) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to fetch %r from YouTube table", track_info, exc_info=exc
-                        )
-                should_query_global = globaldb_toggle and query_global and val is None
+                should_query_global = global_entry and val is None
                 if should_query_global:
-                    llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
+                    async with self._global_api_semaphore:
+                        llresponse = await self.global_cache_api.get_spotify(
+                            track_name, artist_name
+                        )
                     if llresponse:
                         if llresponse.get("loadType") == "V2_COMPACT":
                             llresponse["loadType"] = "V2_COMPAT"
                         llresponse = LoadResult(llresponse)
                     val = llresponse or None
-                if val is None and not skip_youtube_api:
+                if val is None and (
+                    youtube_api_error_index is None or index < youtube_api_error_index
+                ):
                     try:
-                        val = await self.fetch_youtube_query(
-                            ctx, track_info, current_cache_level=current_cache_level
-                        )
+                        async with self._youtube_api_semaphore:
+                            val = await self.fetch_youtube_query(
+                                ctx, track_info, current_cache_level=current_cache_level
+                            )
                     except YouTubeApiError as exc:
-                        val = None
-                        youtube_api_error = exc.message
-                        skip_youtube_api = True
-                if not youtube_api_error:
-                    if youtube_cache and val and llresponse is None:
-                        task = ("update", ("youtube", {"track": track_info}))
-                        self.append_task(ctx, *task)
-
-                    if isinstance(llresponse, LoadResult):
-                        track_object = llresponse.tracks
-                    elif val:
-                        result = None
-                        if should_query_global:
-                            llresponse = await self.global_cache_api.get_call(val)
-                            if llresponse:
-                                if llresponse.get("loadType") == "V2_COMPACT":
-                                    llresponse["loadType"] = "V2_COMPAT"
-                                llresponse = LoadResult(llresponse)
-                            result = llresponse or None
-                        if not result:
-                            try:
-                                (result, called_api) = await self.fetch_track(
-                                    ctx,
-                                    player,
-                                    Query.process_input(val, self.cog.local_folder_current_path),
-                                    forced=forced,
-                                    should_query_global=not should_query_global,
-                                )
-                            except (RuntimeError, aiohttp.ServerDisconnectedError):
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title=_(
-                                        "The connection was reset while loading the playlist."
-                                    ),
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                            except asyncio.TimeoutError:
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title=_("Player timeout, skipping remaining tracks."),
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                        track_object = result.tracks
-                    else:
-                        track_object = []
-                else:
-                    track_object = []
-                if (track_count % 2 == 0) or (track_count == total_tracks):
-                    key = "lavalink"
-                    seconds = "???"
-                    second_key = None
-                    if notifier is not None:
-                        await notifier.notify_user(
-                            current=track_count,
-                            total=total_tracks,
-                            key=key,
-                            seconds_key=second_key,
-                            seconds=seconds,
+                        # Only the tracks after this one stop calling the YouTube API,
+                        # the earlier ones are still enqueued before the error is raised.
+                        if youtube_api_error_index is None or index < youtube_api_error_index:
+                            youtube_api_error_index = index
+                        return [], exc.message
+                if youtube_cache and val and llresponse is None:
+                    task = ("update", ("youtube", {"track": track_info}))
+                    self.append_task(ctx, *task)
+
+                if isinstance(llresponse, LoadResult):
+                    return llresponse.tracks, None
+                if not val:
+                    return [], None
+                result = None
+                if should_query_global:
+                    async with self._global_api_semaphore:
+                        llresponse = await self.global_cache_api.get_call(val)
+                    if llresponse:
+                        if llresponse.get("loadType") == "V2_COMPACT":
+                            llresponse["loadType"] = "V2_COMPAT"
+                        llresponse = LoadResult(llresponse)
+                    result = llresponse or None
+                if not result:
+                    async with self._lavalink_semaphore:
+                        (result, called_api) = await self.fetch_track(
+                            ctx,
+                            player,
+                            Query.process_input(val, self.cog.local_folder_current_path),
+                            forced=forced,
+                            should_query_global=not should_query_global,
                         )
+                return result.tracks, None
 
-                if (youtube_api_error and not global_entry) or consecutive_fails >= (
-                    20 if global_entry else 10
-                ):
-                    error_embed = discord.Embed(
-                        colour=await ctx.embed_colour(),
-                        title=_("Failing to get tracks, skipping remaining."),
-                    )
-                    if notifier is not None:
-                        await notifier.update_embed(error_embed)
-                    if youtube_api_error:
+            # Tracks are resolved concurrently, a few ahead of the one being enqueued,
+            # and enqueued in playlist order as they complete.
+            to_resolve = enumerate(zip(spotify_tracks, cached_urls))
+            pending: Deque[asyncio.Task] = deque()
+            try:
+                for track_count in range(1, total_tracks + 1):
+                    for index, ((track_info, track_name, artist_name), val) in itertools.islice(
+                        to_resolve, _SPOTIFY_ENQUEUE_CONCURRENCY - len(pending)
+                    ):
+                        pending.append(
+                            asyncio.create_task(
+                                resolve(index, track_info, track_name, artist_name, val)
+                            )
+                        )
+                    try:
+                        track_object, error = await pending.popleft()
+                    except (RuntimeError, aiohttp.ServerDisconnectedError):
                         lock(ctx, False)
-                        raise SpotifyFetchError(message=youtube_api_error)
-                    break
-                if not track_object:
-                    consecutive_fails += 1
-                    continue
-                consecutive_fails = 0
-                single_track = track_object[0]
-                query = Query.process_input(single_track, self.cog.local_folder_current_path)
-                if not await self.cog.is_query_allowed(
-                    self.config,
-                    ctx,
-                    f"{single_track.title} {single_track.author} {single_track.uri} {query}",
-                    query_obj=query,
-                ):
-                    has_not_allowed = True
-                    log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
-                    continue
-                track_list.append(single_track)
-                if enqueue:
-                    if len(player.queue) >= 10000:
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("The connection was reset while loading the playlist."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        break
+                    except asyncio.TimeoutError:
+                        lock(ctx, False)
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("Player timeout, skipping remaining tracks."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        break
+                    if youtube_api_error is None:
+                        youtube_api_error = error
+                    if youtube_api_error:
+                        track_object = []
+                    if (track_count % 2 == 0) or (track_count == total_tracks):
+                        key = "lavalink"
+                        seconds = "???"
+                        second_key = None
+                        if notifier is not None:
+                            await notifier.notify_user(
+                                current=track_count,
+                                total=total_tracks,
+                                key=key,
+                                seconds_key=second_key,
+                                seconds=seconds,
+                            )
+
+                    if (youtube_api_error and not global_entry) or consecutive_fails >= (
+                        20 if global_entry else 10
+                    ):
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("Failing to get tracks, skipping remaining."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        if youtube_api_error:
+                            lock(ctx, False)
+                            raise SpotifyFetchError(message=youtube_api_error)
+                        break
+                    if not track_object:
+                        consecutive_fails += 1
                         continue
-                    if guild_data["maxlength"] > 0:
-                        if self.cog.is_track_length_allowed(single_track, guild_data["maxlength"]):
+                    consecutive_fails = 0
+                    single_track = track_object[0]
+                    query = Query.process_input(single_track, self.cog.local_folder_current_path)
+                    if not await self.cog.is_query_allowed(
+                        self.config,
+                        ctx,
+                        f"{single_track.title} {single_track.author} {single_track.uri} {query}",
+                        query_obj=query,
+                    ):
+                        has_not_allowed = True
+                        log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
+                        continue
+                    track_list.append(single_track)
+                    if enqueue:
+                        if len(player.queue) >= 10000:
+                            continue
+                        if guild_data["maxlength"] > 0:
+                            if self.cog.is_track_length_allowed(
+                                single_track, guild_data["maxlength"]
+                            ):
+                                enqueued_tracks += 1
+                                single_track.extras.update(
+                                    {
+                                        "enqueue_time": int(time.time()),
+                                        "vc": player.channel.id,
+                                        "requester": ctx.author.id,
+                                    }
+                                )
+                                player.add(ctx.author, single_track)
+                                self.bot.dispatch(
+                                    "red_audio_track_enqueue",
+                                    player.guild,
+                                    single_track,
+                                    ctx.author,
+                                )
+                        else:
                             enqueued_tracks += 1
                             single_track.extras.update(
                                 {
@@ -641,25 +719,13 @@ class AudioAPIInterface:
                                 single_track,
                                 ctx.author,
                             )
-                    else:
-                        enqueued_tracks += 1
-                        single_track.extras.update(
-                            {
-                                "enqueue_time": int(time.time()),
-                                "vc": player.channel.id,
-                                "requester": ctx.author.id,
-                            }
-                        )
-                        player.add(ctx.author, single_track)
-                        self.bot.dispatch(
-                            "red_audio_track_enqueue",
-                            player.guild,
-                            single_track,
-                            ctx.author,
-                        )
 
-                    if not player.current:
-                        await player.play()
+                        if not player.current:
+                            await player.play()
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
             if enqueue and tracks_from_spotify:
                 if total_tracks > enqueued_tracks:
                     maxlength_msg = _(" {bad_tracks} tracks cannot be queued.").format(
@@ -707,6 +773,15 @@ class AudioAPIInterface:
             lock(ctx, False)
         return track_list
 
+    async def fetch_youtube_cache(self, tracks_info: List[str]) -> List[Optional[str]]:
+        """Look up the YouTube URLs of many track queries in the local cache at once."""
+        try:
+            cached = await self.local_cache_api.youtube.fetch_many(tracks_info)
+        except Exception as exc:
+            log.verbose("Failed to fetch %r from YouTube table", tracks_info, exc_info=exc)
+            cached = {}
+        return [cached.get(track_info, (None, None))[0] for track_info in tracks_info]
+
     async def fetch_youtube_query(
         self,
         ctx: commands.Context,
@@ -801,16 +876,24 @@ class AudioAPIInterface:
         valid_global_entry = False
         results = None
         called_api = False
+        cached_in_memory = False
         prefer_lyrics = await self.cog.get_lyrics_status(ctx)
         if prefer_lyrics and query.is_youtube and query.is_search:
             query_string = f"{query} - lyrics"
         if cache_enabled and not forced and not query.is_local:
-            try:
-                (val, last_updated) = await self.local_cache_api.lavalink.fetch_one(
-                    {"query": query_string}
-                )
-            except Exception as exc:
-                log.verbose("Failed to fetch %r from Lavalink table", query_string, exc_info=exc)
+            val = self.track_cache.get(query_string, await self._get_cache_maxage())
+            if val is not None:
+                log.trace("Found %r in the track cache", query_string)
+                cached_in_memory = True
+            else:
+                try:
+                    (val, last_updated) = await self.local_cache_api.lavalink.fetch_one(
+                        {"query": query_string}
+                    )
+                except Exception as exc:
+                    log.verbose(
+                        "Failed to fetch %r from Lavalink table", query_string, exc_info=exc
+                    )
 
             if val and isinstance(val, dict):
                 log.trace("Updating Local Database with %r", query_string)
@@ -889,6 +972,7 @@ class AudioAPIInterface:
                 self.append_task(ctx, *global_task)
         if (
             cache_enabled
+            and not cached_in_memory
             and results.load_type
             and not results.has_error
             and not query.is_local
@@ -898,6 +982,7 @@ class AudioAPIInterface:
                 time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
                 data = json.dumps(results._raw)
                 if all(k in data for k in ["loadType", "playlistInfo", "isSeekable", "isStream"]):
+                    self.track_cache.put(query_string, data, time_now)
                     task = (
                         "insert",
                         (
@@ -921,6 +1006,80 @@ class AudioAPIInterface:
                 )
         return results, called_api
 
+    async def fetch_cached_tracks(
+        self, ctx: commands.Context, queries: List[Query]
+    ) -> List[Optional[LoadResult]]:
+        """Get the Load results of many queries from the local cache with a single query.
+
+        Parameters
+        ----------
+        ctx: commands.Context
+            The context this method is being called under.
+        queries: List[audio_dataclasses.Query]
+            The Query objects for the queries in question.
+
+        Returns
+        -------
+        List[Optional[lavalink.LoadResult]]
+            The Load result for each of the queries, or ``None`` for the queries which
+            weren't found in the cache. Those should be loaded with `fetch_track()`.
+        """
+        current_cache_level = CacheLevel(await self.config.cache_level())
+        if not CacheLevel.set_lavalink().is_subset(current_cache_level):
+            return [None] * len(queries)
+        prefer_lyrics = await self.cog.get_lyrics_status(ctx)
+        query_strings: List[Optional[str]] = []
+        for query in queries:
+            if query.is_local:
+                query_strings.append(None)
+            elif prefer_lyrics and query.is_youtube and query.is_search:
+                query_strings.append(f"{query} - lyrics")
+            else:
+                query_strings.append(str(query))
+        maxage = await self._get_cache_maxage()
+        in_memory = {q: self.track_cache.get(q, maxage) for q in query_strings if q is not None}
+        try:
+            cached = await self.local_cache_api.lavalink.fetch_many(
+                [q for q, val in in_memory.items() if val is None]
+            )
+        except Exception as exc:
+            log.verbose("Failed to fetch %r from Lavalink table", query_strings, exc_info=exc)
+            cached = {}
+
+        results: List[Optional[LoadResult]] = []
+        for query_string in query_strings:
+            val = in_memory.get(query_string) if query_string else None
+            if val is not None:
+                data = val
+                data["query"] = query_string
+                if data.get("loadType") == "V2_COMPACT":
+                    data["loadType"] = "V2_COMPAT"
+                results.append(LoadResult(data))
+                task = ("update", ("lavalink", {"query": query_string}))
+                self.append_task(ctx, *task)
+                continue
+            val, updated_on = cached.get(query_string, (None, None))
+            if not val:
+                results.append(None)
+                continue
+            data = val
+            data["query"] = query_string
+            if data.get("loadType") == "V2_COMPACT":
+                data["loadType"] = "V2_COMPAT"
+            result = LoadResult(data)
+            if result.has_error:
+                # Let `fetch_track()` replace the invalid entry.
+                results.append(None)
+                continue
+            results.append(result)
+            if updated_on is not None:
+                self.track_cache.put(
+                    query_string, json.dumps(result._raw), int(updated_on.timestamp())
+                )
+            task = ("update", ("lavalink", {"query": query_string}))
+            self.append_task(ctx, *task)
+        return results
+
     async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
         """Enqueue a random track."""
         autoplaylist = await self.config.guild(player.guild).autoplaylist()
@@ -1,11 +1,22 @@
-import concurrent
+import asyncio
 import contextlib
 import datetime
+import json
 import random
 import time
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from red_commons.logging import getLogger
 
@@ -14,7 +25,6 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 from ..sql_statements import (
     LAVALINK_CREATE_INDEX,
@@ -23,24 +33,30 @@ from ..sql_statements import (
     LAVALINK_FETCH_ALL_ENTRIES_GLOBAL,
     LAVALINK_QUERY,
     LAVALINK_QUERY_ALL,
+    LAVALINK_QUERY_MANY,
     LAVALINK_QUERY_LAST_FETCHED_RANDOM,
     LAVALINK_UPDATE,
+    LAVALINK_UPDATE_MANY,
     LAVALINK_UPSERT,
     SPOTIFY_CREATE_INDEX,
     SPOTIFY_CREATE_TABLE,
     SPOTIFY_DELETE_OLD_ENTRIES,
     SPOTIFY_QUERY,
     SPOTIFY_QUERY_ALL,
+    SPOTIFY_QUERY_MANY,
     SPOTIFY_QUERY_LAST_FETCHED_RANDOM,
     SPOTIFY_UPDATE,
+    SPOTIFY_UPDATE_MANY,
     SPOTIFY_UPSERT,
     YOUTUBE_CREATE_INDEX,
     YOUTUBE_CREATE_TABLE,
     YOUTUBE_DELETE_OLD_ENTRIES,
     YOUTUBE_QUERY,
     YOUTUBE_QUERY_ALL,
+    YOUTUBE_QUERY_MANY,
     YOUTUBE_QUERY_LAST_FETCHED_RANDOM,
     YOUTUBE_UPDATE,
+    YOUTUBE_UPDATE_MANY,
     YOUTUBE_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
@@ -54,6 +70,7 @@ from .api_utils import (
     SpotifyCacheFetchResult,
     YouTubeCacheFetchResult,
 )
+from .db_worker import DatabaseWorker
 
 if TYPE_CHECKING:
     from .. import Audio
@@ -66,11 +83,11 @@ _SCHEMA_VERSION = 3
 
 class BaseWrapper:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, database: DatabaseWorker, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
-        self.database = conn
+        self.database = database
         self.statement = SimpleNamespace()
         self.statement.pragma_temp_store = PRAGMA_SET_temp_store
         self.statement.pragma_journal_mode = PRAGMA_SET_journal_mode
@@ -82,23 +99,22 @@ class BaseWrapper:
 
     async def init(self) -> None:
         """Initialize the local cache"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.maybe_migrate)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_INDEX)
-            await self.clean_up_old_entries()
-
-    def close(self) -> None:
+        await self.database.execute(self.statement.pragma_temp_store)
+        await self.database.execute(self.statement.pragma_journal_mode)
+        await self.database.execute(self.statement.pragma_read_uncommitted)
+        await self.maybe_migrate()
+        await self.database.execute(LAVALINK_CREATE_TABLE)
+        await self.database.execute(LAVALINK_CREATE_INDEX)
+        await self.database.execute(YOUTUBE_CREATE_TABLE)
+        await self.database.execute(YOUTUBE_CREATE_INDEX)
+        await self.database.execute(SPOTIFY_CREATE_TABLE)
+        await self.database.execute(SPOTIFY_CREATE_INDEX)
+        await self.clean_up_old_entries()
+
+    async def close(self) -> None:
         """Close the connection with the local cache"""
         with contextlib.suppress(Exception):
-            self.database.close()
+            await self.database.close()
 
     async def clean_up_old_entries(self) -> None:
         """Delete entries older than x in the local cache tables"""
@@ -106,39 +122,38 @@ class BaseWrapper:
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
         maxage_int = int(time.mktime(maxage.timetuple()))
         values = {"maxage": maxage_int}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, YOUTUBE_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, SPOTIFY_DELETE_OLD_ENTRIES, values)
+        try:
+            await asyncio.gather(
+                self.database.write(LAVALINK_DELETE_OLD_ENTRIES, values),
+                self.database.write(YOUTUBE_DELETE_OLD_ENTRIES, values),
+                self.database.write(SPOTIFY_DELETE_OLD_ENTRIES, values),
+            )
+        except Exception as exc:
+            log.verbose("Failed to clean up old entries from database", exc_info=exc)
 
-    def maybe_migrate(self) -> None:
+    async def maybe_migrate(self) -> None:
         """Maybe migrate Database schema for the local cache"""
         current_version = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_user_version)]
-            ):
-                try:
-                    row_result = future.result()
-                    current_version = row_result.fetchone()
-                    break
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
-            if isinstance(current_version, tuple):
-                current_version = current_version[0]
-            if current_version == _SCHEMA_VERSION:
-                return
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.set_user_version,
-                {"version": _SCHEMA_VERSION},
-            )
+        try:
+            current_version = await self.database.fetchone(self.statement.get_user_version)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+        if isinstance(current_version, tuple):
+            current_version = current_version[0]
+        if current_version == _SCHEMA_VERSION:
+            return
+        await self.database.execute(self.statement.set_user_version, {"version": _SCHEMA_VERSION})
 
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
+        await self.upsert_many(values)
+
+    async def upsert_many(self, values: List[MutableMapping]) -> None:
+        """Insert or update many entries of the local cache in a single transaction"""
+        if not values:
+            return
         try:
-            with self.database.transaction() as transaction:
-                transaction.executemany(self.statement.upsert, values)
+            await self.database.writemany(self.statement.upsert, values)
         except Exception as exc:
             log.trace("Error during table insert", exc_info=exc)
 
@@ -148,8 +163,20 @@ class BaseWrapper:
         try:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values["last_fetched"] = time_now
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                executor.submit(self.database.cursor().execute, self.statement.update, values)
+            await self.database.write(self.statement.update, values)
+        except Exception as exc:
+            log.verbose("Error during table update", exc_info=exc)
+
+    async def update_many(self, keys: Iterable[str]) -> None:
+        """Update many entries of the local cache with a single statement"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        try:
+            time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            await self.database.write(
+                self.statement.update_many, {"keys": json.dumps(keys), "last_fetched": time_now}
+            )
         except Exception as exc:
             log.verbose("Error during table update", exc_info=exc)
 
@@ -164,21 +191,42 @@ class BaseWrapper:
         maxage_int = int(time.mktime(maxage.timetuple()))
         values.update({"maxage": maxage_int})
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
-            ):
-                try:
-                    row_result = future.result()
-                    row = row_result.fetchone()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row = await self.database.fetchone(self.statement.get_one, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         if not row:
             return None
         if self.fetch_result is None:
             return None
         return self.fetch_result(*row)
 
+    async def _fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[
+        str, Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]
+    ]:
+        """Get the entries for many keys from the local cache with a single query"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or self.fetch_result is None:
+            return {}
+        max_age = await self.config.cache_age()
+        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
+        maxage_int = int(time.mktime(maxage.timetuple()))
+        rows = []
+        try:
+            rows = await self.database.fetchall(
+                self.statement.get_many, {"keys": json.dumps(keys), "maxage": maxage_int}
+            )
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+        output = {}
+        async for key, *row in AsyncIter(rows):
+            # Like `_fetch_one()`, use the first entry if a key has many.
+            if key not in output:
+                output[key] = self.fetch_result(*row)
+        return output
+
     async def _fetch_all(
         self, values: MutableMapping
     ) -> List[Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]]:
@@ -187,14 +235,10 @@ class BaseWrapper:
         row_result = []
         if self.fetch_result is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_result(*row))
         return output
@@ -206,23 +250,12 @@ class BaseWrapper:
     ]:
         """Get a random entry from the local cache"""
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                    rows = row_result.fetchall()
-                    if rows:
-                        row = random.choice(rows)
-                    else:
-                        row = None
-                except Exception as exc:
-                    log.verbose("Failed to completed random fetch from database", exc_info=exc)
+        try:
+            rows = await self.database.fetchall(self.statement.get_random, values)
+            if rows:
+                row = random.choice(rows)
+        except Exception as exc:
+            log.verbose("Failed to completed random fetch from database", exc_info=exc)
         if not row:
             return None
         if self.fetch_result is None:
@@ -232,12 +265,14 @@ class BaseWrapper:
 
 class YouTubeTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, database: DatabaseWorker, cog: Union["Audio", Cog]
     ):
-        super().__init__(bot, config, conn, cog)
+        super().__init__(bot, config, database, cog)
         self.statement.upsert = YOUTUBE_UPSERT
         self.statement.update = YOUTUBE_UPDATE
+        self.statement.update_many = YOUTUBE_UPDATE_MANY
         self.statement.get_one = YOUTUBE_QUERY
+        self.statement.get_many = YOUTUBE_QUERY_MANY
         self.statement.get_all = YOUTUBE_QUERY_ALL
         self.statement.get_random = YOUTUBE_QUERY_LAST_FETCHED_RANDOM
         self.fetch_result = YouTubeCacheFetchResult
@@ -251,6 +286,16 @@ class YouTubeTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[str, Optional[datetime.datetime]]]:
+        """Get the entries for many keys from the Youtube table"""
+        return {
+            key: (result.query, result.updated_on)
+            for key, result in (await self._fetch_many(keys)).items()
+            if isinstance(result.query, str)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[YouTubeCacheFetchResult]:
         """Get all entries from the Youtube table"""
         result = await self._fetch_all(values)
@@ -268,12 +313,14 @@ class YouTubeTableWrapper(BaseWrapper):
 
 class SpotifyTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, database: DatabaseWorker, cog: Union["Audio", Cog]
     ):
-        super().__init__(bot, config, conn, cog)
+        super().__init__(bot, config, database, cog)
         self.statement.upsert = SPOTIFY_UPSERT
         self.statement.update = SPOTIFY_UPDATE
+        self.statement.update_many = SPOTIFY_UPDATE_MANY
         self.statement.get_one = SPOTIFY_QUERY
+        self.statement.get_many = SPOTIFY_QUERY_MANY
         self.statement.get_all = SPOTIFY_QUERY_ALL
         self.statement.get_random = SPOTIFY_QUERY_LAST_FETCHED_RANDOM
         self.fetch_result = SpotifyCacheFetchResult
@@ -287,6 +334,16 @@ class SpotifyTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[str, Optional[datetime.datetime]]]:
+        """Get the entries for many keys from the Spotify table"""
+        return {
+            key: (result.query, result.updated_on)
+            for key, result in (await self._fetch_many(keys)).items()
+            if isinstance(result.query, str)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[SpotifyCacheFetchResult]:
         """Get all entries from the Spotify table"""
         result = await self._fetch_all(values)
@@ -304,12 +361,14 @@ class SpotifyTableWrapper(BaseWrapper):
 
 class LavalinkTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, database: DatabaseWorker, cog: Union["Audio", Cog]
     ):
-        super().__init__(bot, config, conn, cog)
+        super().__init__(bot, config, database, cog)
         self.statement.upsert = LAVALINK_UPSERT
         self.statement.update = LAVALINK_UPDATE
+        self.statement.update_many = LAVALINK_UPDATE_MANY
         self.statement.get_one = LAVALINK_QUERY
+        self.statement.get_many = LAVALINK_QUERY_MANY
         self.statement.get_all = LAVALINK_QUERY_ALL
         self.statement.get_random = LAVALINK_QUERY_LAST_FETCHED_RANDOM
         self.statement.get_all_global = LAVALINK_FETCH_ALL_ENTRIES_GLOBAL
@@ -325,6 +384,16 @@ class LavalinkTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[MutableMapping, Optional[datetime.datetime]]]:
+        """Get the entries for many keys from the Lavalink table"""
+        return {
+            key: (result.query, result.updated_on)
+            for key, result in (await self._fetch_many(keys)).items()
+            if isinstance(result.query, dict)
+        }
+
     async def fetch_all(self, values: MutableMapping) -> List[LavalinkCacheFetchResult]:
         """Get all entries from the Lavalink table"""
         result = await self._fetch_all(values)
@@ -345,14 +414,10 @@ class LavalinkTableWrapper(BaseWrapper):
         row_result = []
         if self.fetch_for_global is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all_global)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_for_global(*row))
         return output
@@ -362,12 +427,12 @@ class LocalCacheWrapper:
     """Wraps all table apis into 1 object representing the local cache"""
 
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, database: DatabaseWorker, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
-        self.database = conn
+        self.database = database
         self.cog = cog
-        self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(bot, config, conn, self.cog)
-        self.spotify: SpotifyTableWrapper = SpotifyTableWrapper(bot, config, conn, self.cog)
-        self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(bot, config, conn, self.cog)
+        self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(bot, config, database, self.cog)
+        self.spotify: SpotifyTableWrapper = SpotifyTableWrapper(bot, config, database, self.cog)
+        self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(bot, config, database, self.cog)
@@ -0,0 +1,260 @@
+import asyncio
+import functools
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
+
+import rapidfuzz
+from red_commons.logging import getLogger
+
+from redbot.core import Config
+from redbot.core.bot import Red
+from redbot.core.i18n import Translator
+
+from ..audio_dataclasses import LocalPath
+from ..sql_statements import (
+    LOCAL_TRACKS_CREATE_FOLDERS_TABLE,
+    LOCAL_TRACKS_CREATE_INDEX,
+    LOCAL_TRACKS_CREATE_TRACKS_TABLE,
+    LOCAL_TRACKS_DELETE_FOLDER,
+    LOCAL_TRACKS_DELETE_FOLDER_TRACKS,
+    LOCAL_TRACKS_DELETE_OTHER_ROOTS,
+    LOCAL_TRACKS_DELETE_OTHER_ROOTS_FOLDERS,
+    LOCAL_TRACKS_FETCH_FOLDERS,
+    LOCAL_TRACKS_FETCH_SUBFOLDERS_IN_TREE,
+    LOCAL_TRACKS_FETCH_TRACKS_IN_TREE,
+    LOCAL_TRACKS_INSERT_TRACK,
+    LOCAL_TRACKS_UPSERT_FOLDER,
+)
+from .db_worker import DatabaseWorker
+
+log = getLogger("red.cogs.Audio.api.LocalTracks")
+_ = Translator("Audio", Path(__file__))
+
+# Minimum score of fuzzy search matches, out of 100.
+_SEARCH_CUTOFF = 85
+
+
+class _ScannedFolder:
+    __slots__ = ("parent", "mtime", "subfolders", "tracks")
+
+    def __init__(
+        self, parent: Optional[str], mtime: int, subfolders: List[str], tracks: List[str]
+    ):
+        self.parent = parent
+        self.mtime = mtime
+        self.subfolders = subfolders
+        self.tracks = tracks
+
+
+def _scan_tree(
+    root: str,
+    known_folders: MutableMapping[str, Tuple[int, List[str]]],
+    extensions: Tuple[str, ...],
+) -> Tuple[Dict[str, _ScannedFolder], Set[str]]:
+    """Walk the folder tree, only listing the folders which changed since the last scan.
+
+    A folder's modification time changes whenever an entry is added to,
+    removed from or renamed in it. For the unchanged folders, the subfolders
+    known from the last scan are visited instead.
+
+    Folder paths are relative to the root, which itself is the empty path.
+    Hidden files and folders are skipped, like `glob` does.
+
+    Returns
+    -------
+    Tuple[Dict[str, _ScannedFolder], Set[str]]
+        The folders which changed, and all folders that were found.
+    """
+    changed: Dict[str, _ScannedFolder] = {}
+    found: Set[str] = set()
+    visited: Set[Tuple[int, int]] = set()
+    stack: List[Tuple[str, Optional[str]]] = [("", None)]
+    while stack:
+        rel_path, parent = stack.pop()
+        path = os.path.join(root, rel_path) if rel_path else root
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        # Symlinks are followed, guard against loops.
+        if (stat.st_dev, stat.st_ino) in visited:
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+
+        known = known_folders.get(rel_path)
+        if known is not None and known[0] == stat.st_mtime_ns:
+            found.add(rel_path)
+            stack.extend((subfolder, rel_path) for subfolder in known[1])
+            continue
+
+        subfolders = []
+        tracks = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            subfolders.append(os.path.join(rel_path, entry.name))
+                        elif entry.is_file() and os.path.splitext(entry.name)[1] in extensions:
+                            tracks.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as exc:
+            log.verbose("Failed to list %r", path, exc_info=exc)
+            continue
+        found.add(rel_path)
+        changed[rel_path] = _ScannedFolder(parent, stat.st_mtime_ns, subfolders, tracks)
+        stack.extend((subfolder, rel_path) for subfolder in subfolders)
+    return changed, found
+
+
+def _search(search_words: str, names: Iterable[str], limit: int) -> List[Tuple[str, float, int]]:
+    return rapidfuzz.process.extract(
+        search_words, names, limit=limit, processor=rapidfuzz.utils.default_process
+    )
+
+
+class LocalTracksWrapper:
+    """Index of the tracks in the localtracks folder.
+
+    The index is kept in the Audio database and brought up to date with
+    `refresh()`, which only lists the folders that changed since the last
+    refresh. The folder tree is walked in a separate thread.
+    """
+
+    def __init__(self, bot: Red, config: Config, database: DatabaseWorker):
+        self.bot = bot
+        self.config = config
+        self.database = database
+        self.statement = SimpleNamespace()
+        self.statement.create_folders_table = LOCAL_TRACKS_CREATE_FOLDERS_TABLE
+        self.statement.create_tracks_table = LOCAL_TRACKS_CREATE_TRACKS_TABLE
+        self.statement.create_index = LOCAL_TRACKS_CREATE_INDEX
+
+        self.statement.delete_other_roots = LOCAL_TRACKS_DELETE_OTHER_ROOTS
+        self.statement.delete_other_roots_folders = LOCAL_TRACKS_DELETE_OTHER_ROOTS_FOLDERS
+        self.statement.delete_folder = LOCAL_TRACKS_DELETE_FOLDER
+        self.statement.delete_folder_tracks = LOCAL_TRACKS_DELETE_FOLDER_TRACKS
+        self.statement.upsert_folder = LOCAL_TRACKS_UPSERT_FOLDER
+        self.statement.insert_track = LOCAL_TRACKS_INSERT_TRACK
+
+        self.statement.get_folders = LOCAL_TRACKS_FETCH_FOLDERS
+        self.statement.get_tracks_in_tree = LOCAL_TRACKS_FETCH_TRACKS_IN_TREE
+        self.statement.get_subfolders_in_tree = LOCAL_TRACKS_FETCH_SUBFOLDERS_IN_TREE
+        self._lock = asyncio.Lock()
+
+    async def init(self) -> None:
+        """Initialize the local tracks tables."""
+        await self.database.execute(self.statement.create_folders_table)
+        await self.database.execute(self.statement.create_tracks_table)
+        await self.database.execute(self.statement.create_index)
+
+    async def refresh(self, localtrack_folder: Path) -> None:
+        """Bring the index of the given localtracks folder up to date.
+
+        Indexes of other localtracks folders are dropped.
+        """
+        root = str(localtrack_folder)
+        async with self._lock:
+            rows = await self.database.fetchall(self.statement.get_folders, {"root": root})
+            children: Dict[str, List[str]] = {}
+            for path, parent, mtime in rows:
+                if parent is not None:
+                    children.setdefault(parent, []).append(path)
+            known_folders = {path: (mtime, children.get(path, [])) for path, __, mtime in rows}
+
+            changed, found = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    _scan_tree, root, known_folders, tuple(LocalPath._all_music_ext)
+                ),
+            )
+            removed = [{"root": root, "path": path} for path in known_folders if path not in found]
+            if not (changed or removed):
+                return
+            folders = [
+                {"root": root, "path": path, "parent": folder.parent, "mtime": folder.mtime}
+                for path, folder in changed.items()
+            ]
+            tracks = [
+                {"root": root, "path": os.path.join(path, name), "folder": path, "name": name}
+                for path, folder in changed.items()
+                for name in folder.tracks
+            ]
+            log.debug(
+                "Updating the index of %r: %s changed and %s removed folders",
+                root,
+                len(folders),
+                len(removed),
+            )
+            # Folders are saved last, so that they're listed again
+            # by the next refresh if any of the other writes fail.
+            await self.database.write(self.statement.delete_other_roots, {"root": root})
+            await self.database.write(self.statement.delete_other_roots_folders, {"root": root})
+            await self.database.writemany(self.statement.delete_folder_tracks, removed + folders)
+            await self.database.writemany(self.statement.insert_track, tracks)
+            await self.database.writemany(self.statement.delete_folder, removed)
+            await self.database.writemany(self.statement.upsert_folder, folders)
+
+    @staticmethod
+    def _tree_bindings(localtrack_folder: Path, folder: Path) -> MutableMapping:
+        rel_path = os.path.relpath(folder, localtrack_folder)
+        if rel_path == os.curdir:
+            rel_path = ""
+        return {
+            "root": str(localtrack_folder),
+            "folder": rel_path,
+            "prefix": os.path.join(rel_path, "") if rel_path else "",
+        }
+
+    async def tracks_in_tree(self, localtrack_folder: Path, folder: Path) -> List[Path]:
+        """Get the tracks in the folder and its subfolders.
+
+        Like `LocalPath.tracks_in_tree()`, tracks directly in
+        the localtracks folder are left out.
+        """
+        rows = await self.database.fetchall(
+            self.statement.get_tracks_in_tree, self._tree_bindings(localtrack_folder, folder)
+        )
+        return [localtrack_folder / path for path, name in rows]
+
+    async def subfolders_in_tree(self, localtrack_folder: Path, folder: Path) -> List[Path]:
+        """Get the folder and all of its subfolders, except for the localtracks folder."""
+        rows = await self.database.fetchall(
+            self.statement.get_subfolders_in_tree, self._tree_bindings(localtrack_folder, folder)
+        )
+        return [localtrack_folder / path for (path,) in rows]
+
+    async def search(
+        self, localtrack_folder: Path, search_words: str, limit: int = 50
+    ) -> List[Path]:
+        """Search for tracks by file name.
+
+        Tracks whose names start with the search words come first,
+        followed by the tracks whose names fuzzily match the search words.
+        """
+        rows = await self.database.fetchall(
+            self.statement.get_tracks_in_tree,
+            self._tree_bindings(localtrack_folder, localtrack_folder),
+        )
+        tracks_by_name: Dict[str, List[str]] = {}
+        for path, name in rows:
+            tracks_by_name.setdefault(name, []).append(path)
+
+        prefix = search_words.casefold()
+        matches = sorted(name for name in tracks_by_name if name.casefold().startswith(prefix))
+        search_results = await asyncio.get_running_loop().run_in_executor(
+            None, _search, search_words, list(tracks_by_name), limit
+        )
+        matches.extend(
+            name
+            for name, score, __ in search_results
+            if score > _SEARCH_CUTOFF and name not in matches
+        )
+        return [
+            localtrack_folder / path for name in matches[:limit] for path in tracks_by_name[name]
+        ]
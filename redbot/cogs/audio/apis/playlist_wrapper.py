@@ -1,4 +1,3 @@
-import concurrent
 import json
 from pathlib import Path
 
@@ -11,7 +10,6 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 from ..sql_statements import (
     HANDLE_DISCORD_DATA_DELETION_QUERY,
@@ -33,15 +31,16 @@ from ..sql_statements import (
 )
 from ..utils import PlaylistScope
 from .api_utils import PlaylistFetchResult
+from .db_worker import DatabaseWorker
 
 log = getLogger("red.cogs.Audio.api.Playlists")
 _ = Translator("Audio", Path(__file__))
 
 
 class PlaylistWrapper:
-    def __init__(self, bot: Red, config: Config, conn: APSWConnectionWrapper):
+    def __init__(self, bot: Red, config: Config, database: DatabaseWorker):
         self.bot = bot
-        self.database = conn
+        self.database = database
         self.config = config
         self.statement = SimpleNamespace()
         self.statement.pragma_temp_store = PRAGMA_SET_temp_store
@@ -66,12 +65,11 @@ class PlaylistWrapper:
 
     async def init(self) -> None:
         """Initialize the Playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        await self.database.execute(self.statement.pragma_temp_store)
+        await self.database.execute(self.statement.pragma_journal_mode)
+        await self.database.execute(self.statement.pragma_read_uncommitted)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
 
     @staticmethod
     def get_scope_type(scope: str) -> int:
@@ -89,31 +87,16 @@ class PlaylistWrapper:
     ) -> Optional[PlaylistFetchResult]:
         """Fetch a single playlist."""
         scope_type = self.get_scope_type(scope)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_one,
-                        (
-                            {
-                                "playlist_id": playlist_id,
-                                "scope_id": scope_id,
-                                "scope_type": scope_type,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
-                    return None
-            row = row_result.fetchone()
-            if row:
-                row = PlaylistFetchResult(*row)
+        try:
+            row = await self.database.fetchone(
+                self.statement.get_one,
+                {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return None
+        if row:
+            row = PlaylistFetchResult(*row)
         return row
 
     async def fetch_all(
@@ -122,47 +105,19 @@ class PlaylistWrapper:
         """Fetch all playlists."""
         scope_type = self.get_scope_type(scope)
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        try:
             if author_id is not None:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all_with_filter,
-                            (
-                                {
-                                    "scope_type": scope_type,
-                                    "scope_id": scope_id,
-                                    "author_id": author_id,
-                                }
-                            ),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
+                row_result = await self.database.fetchall(
+                    self.statement.get_all_with_filter,
+                    {"scope_type": scope_type, "scope_id": scope_id, "author_id": author_id},
+                )
             else:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all,
-                            ({"scope_type": scope_type, "scope_id": scope_id}),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
+                row_result = await self.database.fetchall(
+                    self.statement.get_all, {"scope_type": scope_type, "scope_id": scope_id}
+                )
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return []
         async for row in AsyncIter(row_result):
             output.append(PlaylistFetchResult(*row))
         return output
@@ -179,61 +134,43 @@ class PlaylistWrapper:
             playlist_id = -1
 
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all_converter,
-                        (
-                            {
-                                "scope_type": scope_type,
-                                "playlist_name": playlist_name,
-                                "playlist_id": playlist_id,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete fetch from database", exc_info=exc)
-                    return []
+        try:
+            row_result = await self.database.fetchall(
+                self.statement.get_all_converter,
+                {
+                    "scope_type": scope_type,
+                    "playlist_name": playlist_name,
+                    "playlist_id": playlist_id,
+                },
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete fetch from database", exc_info=exc)
+            return []
 
-            async for row in AsyncIter(row_result):
-                output.append(PlaylistFetchResult(*row))
+        async for row in AsyncIter(row_result):
+            output.append(PlaylistFetchResult(*row))
         return output
 
     async def delete(self, scope: str, playlist_id: int, scope_id: int):
         """Deletes a single playlists."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete,
-                ({"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type}),
-            )
+        await self._write(
+            self.statement.delete,
+            {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+        )
 
     async def delete_scheduled(self):
         """Clean up database from all deleted playlists."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.delete_scheduled)
+        await self._write(self.statement.delete_scheduled)
 
     async def drop(self, scope: str):
         """Delete all playlists in a scope."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete_scope,
-                ({"scope_type": scope_type}),
-            )
+        await self._write(self.statement.delete_scope, {"scope_type": scope_type})
 
     async def create_table(self):
         """Create the playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PLAYLIST_CREATE_TABLE)
+        await self.database.execute(PLAYLIST_CREATE_TABLE)
 
     async def upsert(
         self,
@@ -247,25 +184,24 @@ class PlaylistWrapper:
     ):
         """Insert or update a playlist into the database."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.upsert,
-                {
-                    "scope_type": str(scope_type),
-                    "playlist_id": int(playlist_id),
-                    "playlist_name": str(playlist_name),
-                    "scope_id": int(scope_id),
-                    "author_id": int(author_id),
-                    "playlist_url": playlist_url,
-                    "tracks": json.dumps(tracks),
-                },
-            )
+        await self._write(
+            self.statement.upsert,
+            {
+                "scope_type": str(scope_type),
+                "playlist_id": int(playlist_id),
+                "playlist_name": str(playlist_name),
+                "scope_id": int(scope_id),
+                "author_id": int(author_id),
+                "playlist_url": playlist_url,
+                "tracks": json.dumps(tracks),
+            },
+        )
 
     async def handle_playlist_user_id_deletion(self, user_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.drop_user_playlists,
-                {"user_id": user_id},
-            )
+        await self._write(self.statement.drop_user_playlists, {"user_id": user_id})
+
+    async def _write(self, statement: str, values: Optional[MutableMapping] = None) -> None:
+        try:
+            await self.database.write(statement, values)
+        except Exception as exc:
+            log.verbose("Failed to complete playlist write to database", exc_info=exc)
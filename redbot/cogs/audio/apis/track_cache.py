@@ -0,0 +1,88 @@
+import json
+from collections import OrderedDict
+from typing import MutableMapping, Optional, Tuple
+
+# Maximum number of load results kept in memory.
+DEFAULT_TRACK_CACHE_SIZE = 1024
+
+
+class TrackCache:
+    """Size-bounded LRU cache of Lavalink load results, shared by all guilds.
+
+    It sits in front of the Lavalink table of the local cache, so popular
+    queries are resolved without a database query. Entries are kept as JSON
+    and every lookup returns a fresh copy, since players modify the tracks
+    they are given.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries, the least recently used entries
+        are dropped when it's exceeded.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TRACK_CACHE_SIZE):
+        self.maxsize = maxsize
+        # query -> (data, last updated timestamp)
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Ratio of the lookups which were hits, or ``None`` if there weren't any lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def get(self, query: str, maxage: int) -> Optional[MutableMapping]:
+        """Get the load result data of a query.
+
+        Parameters
+        ----------
+        query : str
+            The query string, as stored in the Lavalink table.
+        maxage : int
+            Entries last updated at or before this POSIX timestamp are expired,
+            like they are in the Lavalink table.
+
+        Returns
+        -------
+        Optional[MutableMapping]
+            The load result data, or ``None`` if the query isn't cached.
+        """
+        entry = self._entries.get(query)
+        if entry is not None and entry[1] <= maxage:
+            del self._entries[query]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(query)
+        return json.loads(entry[0])
+
+    def put(self, query: str, data: str, last_updated: int) -> None:
+        """Cache the load result data of a query.
+
+        Parameters
+        ----------
+        query : str
+            The query string, as stored in the Lavalink table.
+        data : str
+            The load result data, serialized as JSON.
+        last_updated : int
+            When the data was fetched from Lavalink, as a POSIX timestamp.
+        """
+        self._entries[query] = (data, last_updated)
+        self._entries.move_to_end(query)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -53,6 +53,7 @@ class Audio(
         self.playlist_api = None
         self.local_folder_current_path = None
         self.db_conn = None
+        self.db_worker = None
 
         self._error_counter = Counter()
         self._error_timer = {}
@@ -30,6 +30,7 @@ from redbot.core.utils.antispam import AntiSpam
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 if TYPE_CHECKING:
+    from ..apis.db_worker import DatabaseWorker
     from ..apis.interface import AudioAPIInterface
     from ..apis.playlist_interface import Playlist
     from ..apis.playlist_wrapper import PlaylistWrapper
@@ -51,6 +52,7 @@ class MixinMeta(ABC):
     playlist_api: Optional["PlaylistWrapper"]
     local_folder_current_path: Optional[Path]
     db_conn: Optional[APSWConnectionWrapper]
+    db_worker: Optional["DatabaseWorker"]
     session: aiohttp.ClientSession
     antispam: Dict[int, Dict[str, AntiSpam]]
     llset_captcha_intervals: List[Tuple[datetime.timedelta, int]]
@@ -479,6 +481,18 @@ class MixinMeta(ABC):
     ) -> List[str]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _refresh_local_tracks_index(self) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _local_tracks_in_tree(self, folder: "LocalPath") -> List["Query"]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _search_local_tracks_index(self, search_words: str) -> List[str]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def command_stop(self, ctx: commands.Context):
         raise NotImplementedError()
@@ -560,6 +574,14 @@ class MixinMeta(ABC):
     def format_time(self, time: int) -> str:
         raise NotImplementedError()
 
+    @abstractmethod
+    def format_track_cache_stats(self) -> str:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def format_database_stats(self) -> str:
+        raise NotImplementedError()
+
     @abstractmethod
     async def get_lyrics_status(self, ctx: Context) -> bool:
         raise NotImplementedError()
@@ -1096,11 +1096,15 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 + _("Local Spotify cache:    [{spotify_status}]\n")
                 + _("Local Youtube cache:    [{youtube_status}]\n")
                 + _("Local Lavalink cache:   [{lavalink_status}]\n")
+                + _("Track cache:            [{track_cache_stats}]\n")
+                + _("Database:               [{database_stats}]\n")
             ).format(
                 max_age=str(await self.config.cache_age()) + " " + _("days"),
                 spotify_status=_("Enabled") if has_spotify_cache else _("Disabled"),
                 youtube_status=_("Enabled") if has_youtube_cache else _("Disabled"),
                 lavalink_status=_("Enabled") if has_lavalink_cache else _("Disabled"),
+                track_cache_stats=self.format_track_cache_stats(),
+                database_stats=self.format_database_stats(),
             )
         msg += (
             "\n---"
@@ -1375,11 +1379,15 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 + _("Spotify cache:    [{spotify_status}]\n")
                 + _("Youtube cache:    [{youtube_status}]\n")
                 + _("Lavalink cache:   [{lavalink_status}]\n")
+                + _("Track cache:      [{track_cache_stats}]\n")
+                + _("Database:         [{database_stats}]\n")
             ).format(
                 max_age=str(await self.config.cache_age()) + " " + _("days"),
                 spotify_status=_("Enabled") if has_spotify_cache else _("Disabled"),
                 youtube_status=_("Enabled") if has_youtube_cache else _("Disabled"),
                 lavalink_status=_("Enabled") if has_lavalink_cache else _("Disabled"),
+                track_cache_stats=self.format_track_cache_stats(),
+                database_stats=self.format_database_stats(),
             )
             await self.send_embed_msg(
                 ctx, title=_("Cache Settings"), description=box(msg, lang="ini")
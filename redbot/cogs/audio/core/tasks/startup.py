@@ -13,6 +13,7 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
+from ...apis.db_worker import DatabaseWorker
 from ...apis.interface import AudioAPIInterface
 from ...apis.playlist_wrapper import PlaylistWrapper
 from ...errors import DatabaseError, TrackEnqueueError
@@ -38,10 +39,11 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
             self.db_conn = APSWConnectionWrapper(
                 str(cog_data_path(self.bot.get_cog("Audio")) / "Audio.db")
             )
+            self.db_worker = DatabaseWorker(self.db_conn)
             self.api_interface = AudioAPIInterface(
-                self.bot, self.config, self.session, self.db_conn, self.bot.get_cog("Audio")
+                self.bot, self.config, self.session, self.db_worker, self.bot.get_cog("Audio")
             )
-            self.playlist_api = PlaylistWrapper(self.bot, self.config, self.db_conn)
+            self.playlist_api = PlaylistWrapper(self.bot, self.config, self.db_worker)
             await self.playlist_api.init()
             await self.api_interface.initialize()
             self.global_api_user = await self.api_interface.global_cache_api.get_perms()
@@ -29,11 +29,18 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if not await self.localtracks_folder_exists(ctx):
             return []
 
-        return (
-            await audio_data.subfolders_in_tree()
-            if search_subfolders
-            else await audio_data.subfolders()
-        )
+        if not search_subfolders:
+            return await audio_data.subfolders()
+        if not await self._refresh_local_tracks_index():
+            return await audio_data.subfolders_in_tree()
+        localtrack_folder = audio_data.localtrack_folder.absolute()
+        folders = [
+            LocalPath(str(path), self.local_folder_current_path)
+            for path in await self.api_interface.local_tracks_api.subfolders_in_tree(
+                localtrack_folder, localtrack_folder
+            )
+        ]
+        return sorted(folders, key=lambda x: x.to_string_user().lower())
 
     async def get_localtrack_folder_list(self, ctx: commands.Context, query: Query) -> List[Query]:
         """Return a list of folders per the provided query."""
@@ -45,7 +52,7 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if not query.local_track_path.exists():
             return []
         return (
-            await query.local_track_path.tracks_in_tree()
+            await self._local_tracks_in_tree(query.local_track_path)
             if query.search_subfolders
             else await query.local_track_path.tracks_in_folder()
         )
@@ -93,11 +100,50 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if not await self.localtracks_folder_exists(ctx) or query.local_track_path is None:
             return []
         return (
-            await query.local_track_path.tracks_in_tree()
+            await self._local_tracks_in_tree(query.local_track_path)
             if query.search_subfolders
             else await query.local_track_path.tracks_in_folder()
         )
 
+    async def _refresh_local_tracks_index(self) -> bool:
+        """Bring the index of the localtracks folder up to date.
+
+        Returns ``False`` if the index can't be used,
+        in which case the localtracks folder has to be searched directly.
+        """
+        if self.api_interface is None:
+            return False
+        localtrack_folder = LocalPath(None, self.local_folder_current_path).localtrack_folder
+        try:
+            await self.api_interface.local_tracks_api.refresh(localtrack_folder.absolute())
+        except Exception as exc:
+            log.verbose("Failed to refresh the index of %s", localtrack_folder, exc_info=exc)
+            return False
+        return True
+
+    async def _local_tracks_in_tree(self, folder: LocalPath) -> List[Query]:
+        if not await self._refresh_local_tracks_index():
+            return await folder.tracks_in_tree()
+        tracks = [
+            Query.process_input(
+                LocalPath(str(path), self.local_folder_current_path),
+                self.local_folder_current_path,
+            )
+            for path in await self.api_interface.local_tracks_api.tracks_in_tree(
+                folder.localtrack_folder.absolute(), folder.path.absolute()
+            )
+        ]
+        return sorted(tracks, key=lambda x: x.to_string_user().lower())
+
+    async def _search_local_tracks_index(self, search_words: str) -> List[str]:
+        localtrack_folder = LocalPath(None, self.local_folder_current_path).localtrack_folder
+        return [
+            LocalPath(str(path), self.local_folder_current_path).to_string_user()
+            for path in await self.api_interface.local_tracks_api.search(
+                localtrack_folder.absolute(), search_words
+            )
+        ]
+
     async def localtracks_folder_exists(self, ctx: commands.Context) -> bool:
         folder = LocalPath(None, self.local_folder_current_path)
         if folder.localtrack_folder is None:
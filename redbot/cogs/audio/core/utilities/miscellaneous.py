@@ -18,6 +18,7 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter, can_user_send_messages_in
 from redbot.core.utils.chat_formatting import humanize_number
 
+from ...apis.db_worker import LATENCY_BUCKETS
 from ...apis.playlist_interface import get_all_playlist_for_migration23
 from ...utils import PlaylistScope
 from ..abc import MixinMeta
@@ -115,7 +116,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _close_database(self) -> None:
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
-            self.api_interface.close()
+            await self.api_interface.close()
 
     async def _check_api_tokens(self) -> MutableMapping:
         spotify = await self.bot.get_shared_api_tokens("spotify")
@@ -277,6 +278,46 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
         sec = "%02d" % seconds
         return f"{day}{hour}{minutes}{sec}"
 
+    def format_track_cache_stats(self) -> str:
+        """Formats the hit ratio and size of the in-memory track cache."""
+        if self.api_interface is None:
+            return _("Unavailable")
+        track_cache = self.api_interface.track_cache
+        hit_ratio = track_cache.hit_ratio
+        return _("{hit_ratio} hits, {size} tracks").format(
+            hit_ratio=_("N/A") if hit_ratio is None else f"{hit_ratio:.1%}",
+            size=humanize_number(len(track_cache)),
+        )
+
+    def format_database_stats(self) -> str:
+        """Formats the queue depth and query latencies of the database worker."""
+        if self.db_worker is None:
+            return _("Unavailable")
+        stats = self.db_worker.get_stats()
+
+        def _latency(histogram: Mapping[str, Any]) -> str:
+            if not histogram["count"]:
+                return _("N/A")
+            p95 = histogram["p95"]
+            return _("{average:.1f} ms avg, p95 {p95}").format(
+                average=histogram["sum"] / histogram["count"] * 1000,
+                p95=(
+                    f"<= {p95 * 1000:g} ms"
+                    if p95 != float("inf")
+                    else f"> {LATENCY_BUCKETS[-1] * 1000:g} ms"
+                ),
+            )
+
+        return _(
+            "queue {depth} (max {max_depth}), reads {read}, writes {write}, {errors} errors"
+        ).format(
+            depth=humanize_number(stats["queue_depth"]),
+            max_depth=humanize_number(stats["max_queue_depth"]),
+            read=_latency(stats["latency"]["read"]),
+            write=_latency(stats["latency"]["write"]),
+            errors=humanize_number(stats["errors"]),
+        )
+
     async def get_lyrics_status(self, ctx: Context) -> bool:
         global _prefer_lyrics_cache
         prefer_lyrics = _prefer_lyrics_cache.setdefault(
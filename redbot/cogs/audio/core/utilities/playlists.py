@@ -412,12 +412,20 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         embed1 = discord.Embed(title=_("Please wait, adding tracks..."))
         playlist_msg = await self.send_embed_msg(ctx, embed=embed1)
         notifier = Notifier(ctx, playlist_msg, {"playlist": _("Loading track {num}/{total}...")})
-        async for track_count, song_url in AsyncIter(uploaded_track_list).enumerate(start=1):
+        queries = [
+            Query.process_input(song_url, self.local_folder_current_path)
+            async for song_url in AsyncIter(uploaded_track_list)
+        ]
+        cached_results = await self.api_interface.fetch_cached_tracks(ctx, queries)
+        async for track_count, (query, result) in AsyncIter(
+            zip(queries, cached_results)
+        ).enumerate(start=1):
             try:
                 try:
-                    result, called_api = await self.api_interface.fetch_track(
-                        ctx, player, Query.process_input(song_url, self.local_folder_current_path)
-                    )
+                    if result is None:
+                        result, called_api = await self.api_interface.fetch_track(
+                            ctx, player, query
+                        )
                 except TrackEnqueueError:
                     self.update_player_lock(ctx, False)
                     return await self.send_embed_msg(
@@ -434,7 +442,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
                 track = result.tracks[0]
             except Exception as exc:
-                log.verbose("Failed to get track for %r", song_url, exc_info=exc)
+                log.verbose("Failed to get track for %r", query, exc_info=exc)
                 continue
             try:
                 track_obj = self.get_track_json(player, other_track=track)
@@ -29,7 +29,9 @@ __all__ = [
     "YOUTUBE_CREATE_INDEX",
     "YOUTUBE_UPSERT",
     "YOUTUBE_UPDATE",
+    "YOUTUBE_UPDATE_MANY",
     "YOUTUBE_QUERY",
+    "YOUTUBE_QUERY_MANY",
     "YOUTUBE_QUERY_ALL",
     "YOUTUBE_DELETE_OLD_ENTRIES",
     "YOUTUBE_QUERY_LAST_FETCHED_RANDOM",
@@ -39,8 +41,10 @@ __all__ = [
     "SPOTIFY_CREATE_TABLE",
     "SPOTIFY_UPSERT",
     "SPOTIFY_QUERY",
+    "SPOTIFY_QUERY_MANY",
     "SPOTIFY_QUERY_ALL",
     "SPOTIFY_UPDATE",
+    "SPOTIFY_UPDATE_MANY",
     "SPOTIFY_DELETE_OLD_ENTRIES",
     "SPOTIFY_QUERY_LAST_FETCHED_RANDOM",
     # Lavalink table statements
@@ -49,7 +53,9 @@ __all__ = [
     "LAVALINK_CREATE_INDEX",
     "LAVALINK_UPSERT",
     "LAVALINK_UPDATE",
+    "LAVALINK_UPDATE_MANY",
     "LAVALINK_QUERY",
+    "LAVALINK_QUERY_MANY",
     "LAVALINK_QUERY_ALL",
     "LAVALINK_QUERY_LAST_FETCHED_RANDOM",
     "LAVALINK_DELETE_OLD_ENTRIES",
@@ -63,6 +69,19 @@ __all__ = [
     "PERSIST_QUEUE_FETCH_ALL",
     "PERSIST_QUEUE_UPSERT",
     "PERSIST_QUEUE_BULK_PLAYED",
+    # Local tracks index statements
+    "LOCAL_TRACKS_CREATE_FOLDERS_TABLE",
+    "LOCAL_TRACKS_CREATE_TRACKS_TABLE",
+    "LOCAL_TRACKS_CREATE_INDEX",
+    "LOCAL_TRACKS_DELETE_OTHER_ROOTS",
+    "LOCAL_TRACKS_DELETE_OTHER_ROOTS_FOLDERS",
+    "LOCAL_TRACKS_DELETE_FOLDER",
+    "LOCAL_TRACKS_DELETE_FOLDER_TRACKS",
+    "LOCAL_TRACKS_UPSERT_FOLDER",
+    "LOCAL_TRACKS_INSERT_TRACK",
+    "LOCAL_TRACKS_FETCH_FOLDERS",
+    "LOCAL_TRACKS_FETCH_TRACKS_IN_TREE",
+    "LOCAL_TRACKS_FETCH_SUBFOLDERS_IN_TREE",
 ]
 
 # PRAGMA Statements
@@ -334,6 +353,13 @@ UPDATE youtube
 SET last_fetched=:last_fetched
 WHERE track_info=:track;
 """
+YOUTUBE_UPDATE_MANY: Final[
+    str
+] = """
+UPDATE youtube
+SET last_fetched=:last_fetched
+WHERE track_info IN (SELECT value FROM json_each(:keys));
+"""
 YOUTUBE_QUERY: Final[
     str
 ] = """
@@ -344,6 +370,15 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+YOUTUBE_QUERY_MANY: Final[
+    str
+] = """
+SELECT track_info, youtube_url, last_updated
+FROM youtube
+WHERE
+    track_info IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage;
+"""
 YOUTUBE_QUERY_ALL: Final[
     str
 ] = """
@@ -431,6 +466,13 @@ UPDATE spotify
 SET last_fetched=:last_fetched
 WHERE uri=:uri;
 """
+SPOTIFY_UPDATE_MANY: Final[
+    str
+] = """
+UPDATE spotify
+SET last_fetched=:last_fetched
+WHERE uri IN (SELECT value FROM json_each(:keys));
+"""
 SPOTIFY_QUERY: Final[
     str
 ] = """
@@ -441,6 +483,15 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+SPOTIFY_QUERY_MANY: Final[
+    str
+] = """
+SELECT uri, track_info, last_updated
+FROM spotify
+WHERE
+    uri IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage;
+"""
 SPOTIFY_QUERY_ALL: Final[
     str
 ] = """
@@ -523,6 +574,13 @@ UPDATE lavalink
 SET last_fetched=:last_fetched
 WHERE query=:query;
 """
+LAVALINK_UPDATE_MANY: Final[
+    str
+] = """
+UPDATE lavalink
+SET last_fetched=:last_fetched
+WHERE query IN (SELECT value FROM json_each(:keys));
+"""
 LAVALINK_QUERY: Final[
     str
 ] = """
@@ -533,6 +591,15 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+LAVALINK_QUERY_MANY: Final[
+    str
+] = """
+SELECT query, data, last_updated
+FROM lavalink
+WHERE
+    query IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage;
+"""
 LAVALINK_QUERY_ALL: Final[
     str
 ] = """
@@ -644,3 +711,105 @@ UPDATE
     SET
         time = excluded.time
 """
+
+# Local tracks index statements
+LOCAL_TRACKS_CREATE_FOLDERS_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_tracks_folders(
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    parent TEXT,
+    mtime INTEGER NOT NULL,
+    PRIMARY KEY (root, path)
+);
+"""
+LOCAL_TRACKS_CREATE_TRACKS_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_tracks(
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (root, path)
+);
+"""
+LOCAL_TRACKS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_local_tracks_folder
+ON local_tracks (root, folder);
+"""
+LOCAL_TRACKS_DELETE_OTHER_ROOTS: Final[
+    str
+] = """
+DELETE FROM local_tracks
+WHERE root != :root;
+"""
+LOCAL_TRACKS_DELETE_OTHER_ROOTS_FOLDERS: Final[
+    str
+] = """
+DELETE FROM local_tracks_folders
+WHERE root != :root;
+"""
+LOCAL_TRACKS_DELETE_FOLDER: Final[
+    str
+] = """
+DELETE FROM local_tracks_folders
+WHERE root = :root AND path = :path;
+"""
+LOCAL_TRACKS_DELETE_FOLDER_TRACKS: Final[
+    str
+] = """
+DELETE FROM local_tracks
+WHERE root = :root AND folder = :path;
+"""
+LOCAL_TRACKS_UPSERT_FOLDER: Final[
+    str
+] = """
+INSERT INTO
+    local_tracks_folders (root, path, parent, mtime)
+VALUES
+    (:root, :path, :parent, :mtime)
+ON CONFLICT (root, path) DO
+UPDATE
+    SET
+        parent = excluded.parent,
+        mtime = excluded.mtime;
+"""
+LOCAL_TRACKS_INSERT_TRACK: Final[
+    str
+] = """
+INSERT OR REPLACE INTO
+    local_tracks (root, path, folder, name)
+VALUES
+    (:root, :path, :folder, :name);
+"""
+LOCAL_TRACKS_FETCH_FOLDERS: Final[
+    str
+] = """
+SELECT path, parent, mtime
+FROM local_tracks_folders
+WHERE root = :root;
+"""
+LOCAL_TRACKS_FETCH_TRACKS_IN_TREE: Final[
+    str
+] = """
+SELECT path, name
+FROM local_tracks
+WHERE
+    root = :root
+    AND folder != ''
+    AND (folder = :folder OR substr(folder, 1, length(:prefix)) = :prefix);
+"""
+LOCAL_TRACKS_FETCH_SUBFOLDERS_IN_TREE: Final[
+    str
+] = """
+SELECT path
+FROM local_tracks_folders
+WHERE
+    root = :root
+    AND path != ''
+    AND (path = :folder OR substr(path, 1, length(:prefix)) = :prefix);
+"""
@@ -1,8 +1,9 @@
 import asyncio
+import logging
+import time
 import discord
-import re
 from datetime import timezone
-from typing import Union, Set, Literal, Optional
+from typing import Any, Dict, Iterable, List, Union, Set, Literal, Optional, Sequence, Tuple
 
 from redbot.core import Config, modlog, commands
 from redbot.core.bot import Red
@@ -11,7 +12,13 @@ from redbot.core.utils.predicates import MessagePredicate
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import pagify, humanize_list
 
+from .matcher import WordMatcher
+
 _ = Translator("Filter", __file__)
+log = logging.getLogger("red.filter")
+
+# How often the in-memory filter hit counters are written to Config, in seconds.
+_COUNTER_FLUSH_INTERVAL = 60
 
 
 @cog_i18n(_)
@@ -39,7 +46,14 @@ class Filter(commands.Cog):
         self.config.register_guild(**default_guild_settings)
         self.config.register_member(**default_member_settings)
         self.config.register_channel(**default_channel_settings)
-        self.pattern_cache = {}
+        # (guild ID, channel ID or None for the server-wide filter) -> matcher
+        self.matcher_cache: Dict[Tuple[int, Optional[int]], WordMatcher] = {}
+        # guild ID -> guild settings, without the word list (that's in `matcher_cache`)
+        self.settings_cache: Dict[int, Dict[str, Any]] = {}
+        # (guild ID, member ID) -> member settings, written to Config in batches
+        self.member_counters: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._dirty_counters: Set[Tuple[int, int]] = set()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def red_delete_data_for_user(
         self,
@@ -50,6 +64,10 @@ class Filter(commands.Cog):
         if requester != "discord_deleted_user":
             return
 
+        for key in [key for key in self.member_counters if key[1] == user_id]:
+            del self.member_counters[key]
+            self._dirty_counters.discard(key)
+
         all_members = await self.config.all_members()
 
         async for guild_id, guild_data in AsyncIter(all_members.items(), steps=100):
@@ -58,6 +76,61 @@ class Filter(commands.Cog):
 
     async def cog_load(self) -> None:
         await self.register_casetypes()
+        self._flush_task = asyncio.create_task(self._flush_counters_task())
+
+    async def cog_unload(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush_member_counters()
+
+    async def _flush_counters_task(self) -> None:
+        while True:
+            await asyncio.sleep(_COUNTER_FLUSH_INTERVAL)
+            try:
+                await self.flush_member_counters()
+            except Exception:
+                log.exception("Failed to save the filter hit counters.")
+
+    async def flush_member_counters(self) -> None:
+        """Write the modified filter hit counters to Config."""
+        dirty, self._dirty_counters = self._dirty_counters, set()
+        if dirty:
+            try:
+                await self.config.set_many(
+                    (
+                        self.config.member_from_ids(*key),
+                        self.member_counters[key].copy(),
+                    )
+                    for key in dirty
+                    if key in self.member_counters
+                )
+            except BaseException:  # including cancellation on unload
+                self._dirty_counters |= dirty
+                raise
+        # Counters past their reset time will be zeroed on the next message anyway,
+        # don't keep them around for members who aren't active anymore.
+        now = time.time()
+        for key, counters in list(self.member_counters.items()):
+            if key not in self._dirty_counters and counters["next_reset_time"] <= now:
+                del self.member_counters[key]
+
+    async def get_guild_settings(self, guild: discord.Guild) -> Dict[str, Any]:
+        try:
+            return self.settings_cache[guild.id]
+        except KeyError:
+            pass
+        settings = await self.config.guild(guild).all()
+        del settings["filter"]
+        return self.settings_cache.setdefault(guild.id, settings)
+
+    async def get_member_counters(self, member: discord.Member) -> Dict[str, Any]:
+        key = (member.guild.id, member.id)
+        try:
+            return self.member_counters[key]
+        except KeyError:
+            pass
+        counters = await self.config.member(member).all()
+        return self.member_counters.setdefault(key, counters)
 
     @staticmethod
     async def register_casetypes() -> None:
@@ -103,6 +176,7 @@ class Filter(commands.Cog):
         """
         guild = ctx.guild
         await self.config.guild(guild).filter_default_name.set(name)
+        self.settings_cache.pop(guild.id, None)
         await ctx.send(_("The name to use on filtered names has been set."))
 
     @filterset.command(name="ban")
@@ -135,11 +209,13 @@ class Filter(commands.Cog):
             async with self.config.guild(ctx.guild).all() as guild_data:
                 guild_data["filterban_count"] = 0
                 guild_data["filterban_time"] = 0
+            self.settings_cache.pop(ctx.guild.id, None)
             await ctx.send(_("Autoban disabled."))
         else:
             async with self.config.guild(ctx.guild).all() as guild_data:
                 guild_data["filterban_count"] = count
                 guild_data["filterban_time"] = timeframe
+            self.settings_cache.pop(ctx.guild.id, None)
             await ctx.send(_("Count and time have been set."))
 
     @commands.group(name="filter")
@@ -274,7 +350,6 @@ class Filter(commands.Cog):
         """
         added = await self.add_to_filter(channel, words)
         if added:
-            self.invalidate_cache(ctx.guild, ctx.channel)
             await ctx.send(_("Words added to filter."))
         else:
             await ctx.send(_("Words already in the filter."))
@@ -304,7 +379,6 @@ class Filter(commands.Cog):
         removed = await self.remove_from_filter(channel, words)
         if removed:
             await ctx.send(_("Words removed from filter."))
-            self.invalidate_cache(ctx.guild, ctx.channel)
         else:
             await ctx.send(_("Those words weren't in the filter."))
 
@@ -325,7 +399,6 @@ class Filter(commands.Cog):
         server = ctx.guild
         added = await self.add_to_filter(server, words)
         if added:
-            self.invalidate_cache(ctx.guild)
             await ctx.send(_("Words successfully added to filter."))
         else:
             await ctx.send(_("Those words were already in the filter."))
@@ -347,7 +420,6 @@ class Filter(commands.Cog):
         server = ctx.guild
         removed = await self.remove_from_filter(server, words)
         if removed:
-            self.invalidate_cache(ctx.guild)
             await ctx.send(_("Words successfully removed from filter."))
         else:
             await ctx.send(_("Those words weren't in the filter."))
@@ -363,6 +435,7 @@ class Filter(commands.Cog):
         async with self.config.guild(guild).all() as guild_data:
             current_setting = guild_data["filter_names"]
             guild_data["filter_names"] = not current_setting
+        self.settings_cache.pop(guild.id, None)
         if current_setting:
             await ctx.send(_("Names and nicknames will no longer be filtered."))
         else:
@@ -380,12 +453,36 @@ class Filter(commands.Cog):
             ]
         ] = None,
     ) -> None:
-        """Invalidate a cached pattern"""
-        self.pattern_cache.pop((guild.id, channel and channel.id), None)
+        """Invalidate a cached matcher"""
+        self.matcher_cache.pop((guild.id, channel and channel.id), None)
         if channel is None:
-            for keyset in list(self.pattern_cache.keys()):  # cast needed, no remove
+            for keyset in list(self.matcher_cache.keys()):  # cast needed, no remove
                 if guild.id == keyset[0]:
-                    self.pattern_cache.pop(keyset, None)
+                    self.matcher_cache.pop(keyset, None)
+
+    async def _get_matcher(
+        self,
+        guild: discord.Guild,
+        channel: Optional[
+            Union[
+                discord.TextChannel,
+                discord.VoiceChannel,
+                discord.StageChannel,
+                discord.ForumChannel,
+            ]
+        ] = None,
+    ) -> WordMatcher:
+        key = (guild.id, channel and channel.id)
+        try:
+            return self.matcher_cache[key]
+        except KeyError:
+            pass
+        if channel is None:
+            word_list = await self.config.guild(guild).filter()
+        else:
+            word_list = await self.config.channel(channel).filter()
+        # another task may have created it in the meantime
+        return self.matcher_cache.setdefault(key, WordMatcher(word_list))
 
     async def add_to_filter(
         self,
@@ -398,22 +495,28 @@ class Filter(commands.Cog):
         ],
         words: list,
     ) -> bool:
-        added = False
+        added = []
         if isinstance(server_or_channel, discord.Guild):
+            key = (server_or_channel.id, None)
             async with self.config.guild(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() not in cur_list and w:
                         cur_list.append(w.lower())
-                        added = True
+                        added.append(w.lower())
 
         else:
+            key = (server_or_channel.guild.id, server_or_channel.id)
             async with self.config.channel(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() not in cur_list and w:
                         cur_list.append(w.lower())
-                        added = True
+                        added.append(w.lower())
 
-        return added
+        # Update the cached matcher in place rather than rebuilding it.
+        if (matcher := self.matcher_cache.get(key)) is not None:
+            for w in added:
+                matcher.add(w)
+        return bool(added)
 
     async def remove_from_filter(
         self,
@@ -426,24 +529,30 @@ class Filter(commands.Cog):
         ],
         words: list,
     ) -> bool:
-        removed = False
+        removed = []
         if isinstance(server_or_channel, discord.Guild):
+            key = (server_or_channel.id, None)
             async with self.config.guild(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() in cur_list:
                         cur_list.remove(w.lower())
-                        removed = True
+                        removed.append(w.lower())
 
         else:
+            key = (server_or_channel.guild.id, server_or_channel.id)
             async with self.config.channel(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() in cur_list:
                         cur_list.remove(w.lower())
-                        removed = True
+                        removed.append(w.lower())
 
-        return removed
+        # Update the cached matcher in place rather than rebuilding it.
+        if (matcher := self.matcher_cache.get(key)) is not None:
+            for w in removed:
+                matcher.remove(w)
+        return bool(removed)
 
-    async def filter_hits(
+    async def _get_matchers(
         self,
         server_or_channel: Union[
             discord.Guild,
@@ -452,8 +561,7 @@ class Filter(commands.Cog):
             discord.StageChannel,
             discord.Thread,
         ],
-        *texts: str,
-    ) -> Set[str]:
+    ) -> List[WordMatcher]:
         if isinstance(server_or_channel, discord.Guild):
             guild = server_or_channel
             channel = None
@@ -464,48 +572,52 @@ class Filter(commands.Cog):
             else:
                 channel = server_or_channel
 
-        hits: Set[str] = set()
+        matchers = [await self._get_matcher(guild)]
+        if channel:
+            matchers.append(await self._get_matcher(guild, channel))
+        return matchers
 
-        try:
-            pattern = self.pattern_cache[(guild.id, channel and channel.id)]
-        except KeyError:
-            word_list = set(await self.config.guild(guild).filter())
-            if channel:
-                word_list |= set(await self.config.channel(channel).filter())
-
-            if word_list:
-                pattern = re.compile(
-                    "|".join(rf"\b{re.escape(w)}\b" for w in word_list), flags=re.I
-                )
-            else:
-                pattern = None
-
-            self.pattern_cache[(guild.id, channel and channel.id)] = pattern
+    async def filter_hits(
+        self,
+        server_or_channel: Union[
+            discord.Guild,
+            discord.TextChannel,
+            discord.VoiceChannel,
+            discord.StageChannel,
+            discord.Thread,
+        ],
+        *texts: str,
+    ) -> Set[str]:
+        return self._find_hits(await self._get_matchers(server_or_channel), texts)
 
-        if pattern:
-            for text in texts:
-                hits |= set(pattern.findall(text))
+    @staticmethod
+    def _find_hits(matchers: Iterable[WordMatcher], texts: Sequence[str]) -> Set[str]:
+        hits: Set[str] = set()
+        for matcher in matchers:
+            if matcher:
+                for text in texts:
+                    hits |= matcher.find_all(text)
         return hits
 
     async def check_filter(self, message: discord.Message):
         guild = message.guild
         author = message.author
-        guild_data = await self.config.guild(guild).all()
-        member_data = await self.config.member(author).all()
+        matchers = await self._get_matchers(message.channel)
+        if not any(matchers):
+            return
+
+        guild_data = await self.get_guild_settings(guild)
         filter_count = guild_data["filterban_count"]
         filter_time = guild_data["filterban_time"]
-        user_count = member_data["filter_count"]
-        next_reset_time = member_data["next_reset_time"]
         created_at = message.created_at
 
         if filter_count > 0 and filter_time > 0:
-            if created_at.timestamp() >= next_reset_time:
-                next_reset_time = created_at.timestamp() + filter_time
-                async with self.config.member(author).all() as member_data:
-                    member_data["next_reset_time"] = next_reset_time
-                    if user_count > 0:
-                        user_count = 0
-                        member_data["filter_count"] = user_count
+            member_key = (guild.id, author.id)
+            member_data = await self.get_member_counters(author)
+            if created_at.timestamp() >= member_data["next_reset_time"]:
+                member_data["next_reset_time"] = created_at.timestamp() + filter_time
+                member_data["filter_count"] = 0
+                self._dirty_counters.add(member_key)
 
         texts = [message.content]
         poll = message.poll
@@ -515,7 +627,7 @@ class Filter(commands.Cog):
                 texts.append(answer.text or "")
         for attachment in message.attachments:
             texts.append(attachment.description or "")
-        hits = await self.filter_hits(message.channel, *texts)
+        hits = self._find_hits(matchers, texts)
 
         if hits:
             # modlog doesn't accept PartialMessageable
@@ -545,9 +657,12 @@ class Filter(commands.Cog):
             else:
                 self.bot.dispatch("filter_message_delete", message, hits)
                 if filter_count > 0 and filter_time > 0:
-                    user_count += 1
-                    await self.config.member(author).filter_count.set(user_count)
-                    if user_count >= filter_count and created_at.timestamp() < next_reset_time:
+                    member_data["filter_count"] += 1
+                    self._dirty_counters.add(member_key)
+                    if (
+                        member_data["filter_count"] >= filter_count
+                        and created_at.timestamp() < member_data["next_reset_time"]
+                    ):
                         reason = _("Autoban (too many filtered messages.)")
                         try:
                             await guild.ban(author, reason=reason)
@@ -610,7 +725,7 @@ class Filter(commands.Cog):
             return  # Discord Hierarchy applies to nicks
         if await self.bot.is_automod_immune(member):
             return
-        guild_data = await self.config.guild(member.guild).all()
+        guild_data = await self.get_guild_settings(member.guild)
         if not guild_data["filter_names"]:
             return
 
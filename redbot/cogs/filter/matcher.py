@@ -0,0 +1,120 @@
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+__all__ = ("WordMatcher",)
+
+# Key marking the end of a word in a trie node. Can't collide with a character.
+_END = ""
+
+
+def _fold(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # Some characters lower-case to multiple characters (e.g. "İ"),
+    # keep those as-is so that indices in the folded text match the original text.
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _is_word(char: str) -> bool:
+    # Same as `\w` in a `str` pattern.
+    return char.isalnum() or char == "_"
+
+
+class WordMatcher:
+    """Finds which of a set of words occur in a text.
+
+    Words are matched case-insensitively and with the same semantics as
+    a ``\\bword\\b`` regex. Words are stored in a trie, so they can be
+    added and removed in time proportional to the word's length.
+    Matching walks the trie from each word boundary in the text. Those are
+    the only places a match can start, so the cost doesn't depend on
+    the number of words.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        node = self._root
+        for char in _fold(word):
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def add(self, word: str) -> bool:
+        """Add a word. Returns ``False`` if it was already added or is empty."""
+        folded = _fold(word)
+        if not folded:
+            return False
+        node = self._root
+        for char in folded:
+            node = node.setdefault(char, {})
+        if _END in node:
+            return False
+        node[_END] = True
+        self._size += 1
+        return True
+
+    def remove(self, word: str) -> bool:
+        """Remove a word. Returns ``False`` if it wasn't added."""
+        path: List[Tuple[Dict[str, Any], str]] = []
+        node = self._root
+        for char in _fold(word):
+            child = node.get(char)
+            if child is None:
+                return False
+            path.append((node, char))
+            node = child
+        if _END not in node:
+            return False
+        del node[_END]
+        self._size -= 1
+        # Prune the nodes which no longer lead to any word.
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+        return True
+
+    def find_all(self, text: str) -> Set[str]:
+        """Get all occurrences of the words in the text, as they're written in the text."""
+        root = self._root
+        hits: Set[str] = set()
+        if not root:
+            return hits
+        folded = _fold(text)
+        length = len(folded)
+        for start, char in enumerate(folded):
+            node = root.get(char)
+            if node is None:
+                continue
+            # There must be a word boundary before the match.
+            start_is_word = _is_word(char)
+            if start_is_word == (start > 0 and _is_word(folded[start - 1])):
+                continue
+            end = start + 1
+            while True:
+                if _END in node:
+                    # ...and after it.
+                    end_is_word = _is_word(folded[end - 1])
+                    if end == length:
+                        if end_is_word:
+                            hits.add(text[start:end])
+                    elif end_is_word != _is_word(folded[end]):
+                        hits.add(text[start:end])
+                if end == length:
+                    break
+                node = node.get(folded[end])
+                if node is None:
+                    break
+                end += 1
+        return hits
@@ -167,6 +167,7 @@ class KickBanMixin(MixinMeta):
                 if user.id in tempbans:
                     async with self.config.guild(guild).current_tempbans() as tempbans:
                         tempbans.remove(user.id)
+                    await self._forget_tempban(guild.id, user.id)
                     removed_temp = True
                 else:
                     return (
@@ -229,62 +230,97 @@ class KickBanMixin(MixinMeta):
 
         return True, success_message
 
-    async def tempban_expirations_task(self) -> None:
-        while True:
-            try:
-                await self._check_tempban_expirations()
-            except Exception:
-                log.exception("Something went wrong in check_tempban_expirations:")
+    async def _load_tempban_expirations(self) -> None:
+        """Schedule the unbans of all current tempbans, from the persisted due-time index."""
+        expirations = await self.config.tempban_expirations()
+        for guild_id, members in expirations.items():
+            for user_id, unban_time in members.items():
+                self.tempban_scheduler.schedule((int(guild_id), int(user_id)), unban_time)
 
-            await asyncio.sleep(60)
+    async def _add_tempban(self, guild: discord.Guild, user_id: int, unban_time: float) -> None:
+        await self.config.member_from_ids(guild.id, user_id).banned_until.set(unban_time)
+        async with self.config.guild(guild).current_tempbans() as current_tempbans:
+            current_tempbans.append(user_id)
+        await self.config.set_raw(
+            "tempban_expirations", str(guild.id), str(user_id), value=unban_time
+        )
+        self.tempban_scheduler.schedule((guild.id, user_id), unban_time)
+
+    async def _forget_tempban(self, guild_id: int, user_id: int) -> None:
+        """Remove a tempban, which is no longer in ``current_tempbans``, from the index."""
+        self.tempban_scheduler.cancel((guild_id, user_id))
+        await self.config.clear_raw("tempban_expirations", str(guild_id), str(user_id))
+
+    async def _handle_expired_tempbans(self, keys: List[Tuple[int, int]]) -> None:
+        await self.bot.wait_until_red_ready()
+        by_guild: Dict[int, List[int]] = {}
+        for guild_id, user_id in keys:
+            by_guild.setdefault(guild_id, []).append(user_id)
+        await asyncio.gather(
+            *(
+                self._handle_guild_expired_tempbans(guild_id, user_ids)
+                for guild_id, user_ids in by_guild.items()
+            )
+        )
 
-    async def _check_tempban_expirations(self) -> None:
-        guilds_data = await self.config.all_guilds()
-        async for guild_id, guild_data in AsyncIter(guilds_data.items(), steps=100):
-            if not (guild := self.bot.get_guild(guild_id)):
-                continue
-            if guild.unavailable or not guild.me.guild_permissions.ban_members:
-                continue
+    async def _handle_guild_expired_tempbans(self, guild_id: int, user_ids: List[int]) -> None:
+        guild = self.bot.get_guild(guild_id)
+        retry = user_ids
+        try:
+            if guild is None or guild.unavailable or not guild.me.guild_permissions.ban_members:
+                return
             if await self.bot.cog_disabled_in_guild(self, guild):
-                continue
-
-            guild_tempbans = guild_data["current_tempbans"]
-            if not guild_tempbans:
-                continue
+                return
             async with self.config.guild(guild).current_tempbans.get_lock():
-                if await self._check_guild_tempban_expirations(guild, guild_tempbans):
+                guild_tempbans = await self.config.guild(guild).current_tempbans()
+                retry = await self._check_guild_tempban_expirations(
+                    guild, guild_tempbans, user_ids
+                )
+                done = [uid for uid in user_ids if uid not in retry]
+                if done:
                     await self.config.guild(guild).current_tempbans.set(guild_tempbans)
+                    for uid in done:
+                        await self.config.clear_raw("tempban_expirations", str(guild_id), str(uid))
+        except Exception:
+            log.exception("Something went wrong while handling the expired tempbans:")
+        finally:
+            # Try again later, the guild may become available or the bot may get permissions.
+            retry_at = datetime.now(timezone.utc).timestamp() + 60
+            for uid in retry:
+                if (guild_id, uid) not in self.tempban_scheduler:
+                    self.tempban_scheduler.schedule((guild_id, uid), retry_at)
 
     async def _check_guild_tempban_expirations(
-        self, guild: discord.Guild, guild_tempbans: List[int]
-    ) -> bool:
-        changed = False
-        for uid in guild_tempbans.copy():
-            unban_time = datetime.fromtimestamp(
-                await self.config.member_from_ids(guild.id, uid).banned_until(),
-                timezone.utc,
-            )
-            if datetime.now(timezone.utc) > unban_time:
-                try:
-                    await guild.unban(discord.Object(id=uid), reason=_("Tempban finished"))
-                except discord.NotFound:
-                    # user is not banned anymore
-                    guild_tempbans.remove(uid)
-                    changed = True
-                except discord.HTTPException as e:
-                    # 50013: Missing permissions error code or 403: Forbidden status
-                    if e.code == 50013 or e.status == 403:
-                        log.info(
-                            f"Failed to unban ({uid}) user from "
-                            f"{guild.name}({guild.id}) guild due to permissions."
-                        )
-                        break  # skip the rest of this guild
-                    log.info(f"Failed to unban member: error code: {e.code}")
-                else:
-                    # user unbanned successfully
-                    guild_tempbans.remove(uid)
-                    changed = True
-        return changed
+        self, guild: discord.Guild, guild_tempbans: List[int], user_ids: List[int]
+    ) -> List[int]:
+        """Unban the given users, whose tempbans expired.
+
+        Removes the unbanned users from ``guild_tempbans``
+        and returns the IDs of users that should be tried again later.
+        """
+        for idx, uid in enumerate(user_ids):
+            if uid not in guild_tempbans:
+                # the tempban was upgraded to a permaban or lifted in the meantime
+                continue
+            try:
+                await guild.unban(discord.Object(id=uid), reason=_("Tempban finished"))
+            except discord.NotFound:
+                # user is not banned anymore
+                guild_tempbans.remove(uid)
+            except discord.HTTPException as e:
+                # 50013: Missing permissions error code or 403: Forbidden status
+                if e.code == 50013 or e.status == 403:
+                    log.info(
+                        f"Failed to unban ({uid}) user from "
+                        f"{guild.name}({guild.id}) guild due to permissions."
+                    )
+                    return user_ids[idx:]  # skip the rest of this guild
+                log.info(f"Failed to unban member: error code: {e.code}")
+                return user_ids[idx:]
+            else:
+                # user unbanned successfully
+                guild_tempbans.remove(uid)
+        return []
 
     @commands.command()
     @commands.guild_only()
@@ -547,6 +583,7 @@ class KickBanMixin(MixinMeta):
             async with self.config.guild(guild).current_tempbans() as tempbans:
                 if user_id in tempbans:
                     tempbans.remove(user_id)
+                    await self._forget_tempban(guild.id, user_id)
                     upgrades.append(str(user_id))
                     log.info(
                         "%s (%s) upgraded the tempban for %s to a permaban.",
@@ -652,9 +689,7 @@ class KickBanMixin(MixinMeta):
             return
         invite = await self.get_invite_for_reinvite(ctx, int(duration.total_seconds() + 86400))
 
-        await self.config.member(member).banned_until.set(unban_time.timestamp())
-        async with self.config.guild(guild).current_tempbans() as current_tempbans:
-            current_tempbans.append(member.id)
+        await self._add_tempban(guild, member.id, unban_time.timestamp())
 
         with contextlib.suppress(discord.HTTPException):
             # We don't want blocked DMs preventing us from banning
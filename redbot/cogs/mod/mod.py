@@ -3,7 +3,7 @@ import logging
 import re
 from abc import ABC
 from collections import defaultdict
-from typing import Literal
+from typing import Literal, Tuple
 
 from redbot.core import Config, commands
 from redbot.core.bot import Red
@@ -11,6 +11,7 @@ from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils import AsyncIter
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
 from redbot.core.utils.chat_formatting import inline
+from redbot.core.utils.scheduler import ExpiryScheduler
 from .events import Events
 from .kickban import KickBanMixin
 from .names import ModInfo
@@ -46,6 +47,8 @@ class Mod(
     default_global_settings = {
         "version": "",
         "track_all_names": True,
+        # guild ID -> member ID -> unban timestamp, for all `current_tempbans`
+        "tempban_expirations": {},
     }
 
     default_guild_settings = {
@@ -80,7 +83,10 @@ class Mod(
         self.config.register_member(**self.default_member_settings)
         self.config.register_user(**self.default_user_settings)
         self.cache: dict = {}
-        self.tban_expiry_task = asyncio.create_task(self.tempban_expirations_task())
+        # keys are (guild ID, member ID)
+        self.tempban_scheduler: ExpiryScheduler[Tuple[int, int]] = ExpiryScheduler(
+            self._handle_expired_tempbans
+        )
         self.last_case: dict = defaultdict(dict)
 
     async def red_delete_data_for_user(
@@ -110,12 +116,15 @@ class Mod(
                     except ValueError:
                         pass
                     # possible with a context switch between here and getting all guilds
+                await self._forget_tempban(guild_id, user_id)
 
     async def cog_load(self) -> None:
         await self._maybe_update_config()
+        await self._load_tempban_expirations()
+        self.tempban_scheduler.start()
 
     def cog_unload(self):
-        self.tban_expiry_task.cancel()
+        self.tempban_scheduler.stop()
 
     async def _maybe_update_config(self):
         """Maybe update `delete_delay` value set by Config prior to Mod 1.0.0."""
@@ -170,6 +179,22 @@ class Mod(
                             guild_data["mention_spam"] = {}
                         guild_data["mention_spam"]["ban"] = current_state
             await self.config.version.set("1.3.0")
+        if await self.config.version() < "1.4.0":
+            # Build the due-time index of tempbans from the per-member unban times.
+            all_members = await self.config.all_members()
+            expirations = {}
+            async for guild_id, guild_data in AsyncIter(
+                (await self.config.all_guilds()).items(), steps=100
+            ):
+                members = all_members.get(guild_id, {})
+                guild_expirations = {
+                    str(user_id): members.get(user_id, {}).get("banned_until") or 0
+                    for user_id in guild_data["current_tempbans"]
+                }
+                if guild_expirations:
+                    expirations[str(guild_id)] = guild_expirations
+            await self.config.tempban_expirations.set(expirations)
+            await self.config.version.set("1.4.0")
 
     @commands.command(hidden=True)
     @commands.is_owner()
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import logging
+import time
 from abc import ABC
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Literal, Optional, Tuple, Union, cast
@@ -21,6 +22,7 @@ from redbot.core.utils.mod import get_audit_reason
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.views import SimpleMenu
 from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
+from redbot.core.utils.scheduler import ExpiryScheduler
 
 from .converters import MuteTime
 from .models import ChannelMuteResponse, MuteResponse
@@ -73,6 +75,12 @@ log = logging.getLogger("red.cogs.mutes")
 
 __version__ = "1.0.0"
 
+# Mutes which expire up to this many seconds after another one are unmuted along with it.
+_UNMUTE_LEEWAY = 1
+# How long to wait before retrying unmutes in guilds that are unavailable
+# or have the cog disabled, in seconds.
+_UNMUTE_RETRY_DELAY = 30
+
 
 class CompositeMetaClass(type(commands.Cog), type(ABC)):
     """
@@ -106,8 +114,10 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         self.config.register_channel(muted_users={})
         self._server_mutes: Dict[int, Dict[int, dict]] = {}
         self._channel_mutes: Dict[int, Dict[int, dict]] = {}
-        self._unmute_tasks: Dict[str, asyncio.Task] = {}
-        self._unmute_task: Optional[asyncio.Task] = None
+        # keys are ("server", guild ID, user ID) and ("channel", channel ID, user ID)
+        self._unmute_scheduler: ExpiryScheduler[Tuple[str, int, int]] = ExpiryScheduler(
+            self._handle_expired_mutes, leeway=_UNMUTE_LEEWAY
+        )
         self.mute_role_cache: Dict[int, int] = {}
         # this is a dict of guild ID's and asyncio.Events
         # to wait for a guild to finish channel unmutes before
@@ -155,11 +165,12 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             raise RuntimeError(
                 "Mutes cog is in a bad state, can't proceed with data deletion request."
             )
-        all_members = await self.config.all_members()
-        for g_id, data in all_members.items():
-            for m_id, mutes in data.items():
-                if m_id == user_id:
-                    await self.config.member_from_ids(g_id, m_id).clear()
+        all_members = await self.config.all_members(copy=False)
+        await self.config.clear_many(
+            self.config.member_from_ids(g_id, user_id)
+            for g_id, data in all_members.items()
+            if user_id in data
+        )
 
     async def initialize(self):
         await self.bot.wait_until_red_ready()
@@ -172,12 +183,14 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 self.mute_role_cache[g_id] = mutes["mute_role"]
             for user_id, mute in mutes["muted_users"].items():
                 self._server_mutes[g_id][int(user_id)] = mute
+                self._update_server_unmute(g_id, int(user_id))
         channel_data = await self.config.all_channels()
         for c_id, mutes in channel_data.items():
             self._channel_mutes[c_id] = {}
             for user_id, mute in mutes["muted_users"].items():
                 self._channel_mutes[c_id][int(user_id)] = mute
-        self._unmute_task = asyncio.create_task(self._handle_automatic_unmute())
+                self._update_channel_unmute(c_id, int(user_id))
+        self._unmute_scheduler.start()
         self._ready.set()
 
     async def _maybe_update_config(self):
@@ -227,10 +240,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
     def cog_unload(self):
         if self._init_task is not None:
             self._init_task.cancel()
-        if self._unmute_task is not None:
-            self._unmute_task.cancel()
-        for task in self._unmute_tasks.values():
-            task.cancel()
+        self._unmute_scheduler.stop()
 
     async def is_allowed_by_hierarchy(
         self, guild: discord.Guild, mod: discord.Member, user: discord.Member
@@ -238,74 +248,84 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         is_special = mod == guild.owner or await self.bot.is_owner(mod)
         return mod.top_role > user.top_role or is_special
 
-    async def _handle_automatic_unmute(self):
-        """This is the core task creator and loop
-        for automatic unmutes
+    def _update_server_unmute(self, guild_id: int, user_id: int) -> None:
+        """Schedule or cancel the automatic unmute of the given server mute."""
+        key = ("server", guild_id, user_id)
+        data = self._server_mutes.get(guild_id, {}).get(user_id)
+        if data and data["until"]:
+            self._unmute_scheduler.schedule(key, data["until"])
+        else:
+            self._unmute_scheduler.cancel(key)
+
+    def _update_channel_unmute(self, channel_id: int, user_id: int) -> None:
+        """Schedule or cancel the automatic unmute of the given channel mute."""
+        key = ("channel", channel_id, user_id)
+        data = self._channel_mutes.get(channel_id, {}).get(user_id)
+        if data and data["until"]:
+            self._unmute_scheduler.schedule(key, data["until"])
+        else:
+            self._unmute_scheduler.cancel(key)
+
+    async def _handle_expired_mutes(self, keys: List[Tuple[str, int, int]]) -> None:
+        """Unmute the mutes which expired, concurrently for each guild."""
+        now = time.time()
+        # guild ID -> (server mutes, {user ID: {channel ID: channel mute}})
+        by_guild: Dict[int, Tuple[List[dict], Dict[int, Dict[int, dict]]]] = {}
+        for kind, location_id, user_id in keys:
+            if kind == "server":
+                data = self._server_mutes.get(location_id, {}).get(user_id)
+            else:
+                data = self._channel_mutes.get(location_id, {}).get(user_id)
+            if not data or not data["until"]:
+                continue
+            if data["until"] > now + _UNMUTE_LEEWAY:
+                self._unmute_scheduler.schedule((kind, location_id, user_id), data["until"])
+                continue
+            if kind == "server":
+                by_guild.setdefault(location_id, ([], {}))[0].append(data)
+            else:
+                users = by_guild.setdefault(data["guild"], ([], {}))[1]
+                users.setdefault(user_id, {})[location_id] = data
 
-        A resolution of 30 seconds seems appropriate
-        to allow for decent resolution on low timed
-        unmutes and without being too busy on our event loop
-        """
-        await self.bot.wait_until_red_ready()
-        await self._ready.wait()
-        if self._ready_raised:
-            raise RuntimeError("Mutes cog is in a bad state, cancelling automatic unmute task.")
-        while True:
-            await self._clean_tasks()
-            try:
-                await self._handle_server_unmutes()
-            except Exception:
-                log.error("error checking server unmutes", exc_info=True)
-            await asyncio.sleep(0.1)
-            try:
-                await self._handle_channel_unmutes()
-            except Exception:
-                log.error("error checking channel unmutes", exc_info=True)
-            await asyncio.sleep(30)
+        await asyncio.gather(
+            *(
+                self._handle_guild_unmutes(guild_id, server_mutes, channel_mutes)
+                for guild_id, (server_mutes, channel_mutes) in by_guild.items()
+            )
+        )
 
-    async def _clean_tasks(self):
-        """This is here to cleanup our tasks
-        and log when we have something going wrong
-        inside our tasks.
-        """
-        log.debug("Cleaning unmute tasks")
-        for task_id in list(self._unmute_tasks.keys()):
-            task = self._unmute_tasks[task_id]
+    async def _handle_guild_unmutes(
+        self,
+        guild_id: int,
+        server_mutes: List[dict],
+        channel_mutes: Dict[int, Dict[int, dict]],
+    ) -> None:
+        guild = self.bot.get_guild(guild_id)
+        if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
+            # Try again later, the guild may become available or have the cog enabled.
+            retry_at = time.time() + _UNMUTE_RETRY_DELAY
+            for data in server_mutes:
+                self._unmute_scheduler.schedule(("server", guild_id, data["member"]), retry_at)
+            for user_id, channels in channel_mutes.items():
+                for channel_id in channels:
+                    self._unmute_scheduler.schedule(("channel", channel_id, user_id), retry_at)
+            return
 
-            if task.cancelled():
-                self._unmute_tasks.pop(task_id, None)
-                continue
+        await i18n.set_contextual_locales_from_guild(self.bot, guild)
+        tasks = [self._auto_unmute_user(guild, data) for data in server_mutes]
+        for user_id, channels in channel_mutes.items():
+            if len(channels) > 1:
+                member = guild.get_member(user_id)
+                tasks.append(self._auto_channel_unmute_user_multi(member, guild, channels))
+            else:
+                for channel_id, mute_data in channels.items():
+                    if guild_channel := guild.get_channel(channel_id):
+                        tasks.append(self._auto_channel_unmute_user(guild_channel, mute_data))
 
-            if task.done():
-                try:
-                    r = task.result()
-                except Exception as exc:
-                    log.error("An unexpected error occurred in the unmute task", exc_info=exc)
-                self._unmute_tasks.pop(task_id, None)
-
-    async def _handle_server_unmutes(self):
-        """This is where the logic for role unmutes is taken care of"""
-        log.debug("Checking server unmutes")
-        for g_id in self._server_mutes:
-            guild = self.bot.get_guild(g_id)
-            if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
-                continue
-            await i18n.set_contextual_locales_from_guild(self.bot, guild)
-            for u_id in self._server_mutes[guild.id]:
-                if self._server_mutes[guild.id][u_id]["until"] is None:
-                    continue
-                time_to_unmute = (
-                    self._server_mutes[guild.id][u_id]["until"]
-                    - datetime.now(timezone.utc).timestamp()
-                )
-                if time_to_unmute < 60.0:
-                    task_name = f"server-unmute-{g_id}-{u_id}"
-                    if task_name in self._unmute_tasks:
-                        continue
-                    log.debug(f"Creating task: {task_name}")
-                    self._unmute_tasks[task_name] = asyncio.create_task(
-                        self._auto_unmute_user(guild, self._server_mutes[guild.id][u_id])
-                    )
+        results = await bounded_gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("An unexpected error occurred in the unmute task", exc_info=result)
 
     async def _auto_unmute_user(self, guild: discord.Guild, data: dict):
         """
@@ -363,58 +383,6 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 log.info(error_msg)
                 return
 
-    async def _handle_channel_unmutes(self):
-        """This is where the logic for handling channel unmutes is taken care of"""
-        log.debug("Checking channel unmutes")
-        multiple_mutes = {}
-        for c_id, c_data in self._channel_mutes.items():
-            for u_id in self._channel_mutes[c_id]:
-                if (
-                    not self._channel_mutes[c_id][u_id]
-                    or not self._channel_mutes[c_id][u_id]["until"]
-                ):
-                    continue
-                guild = self.bot.get_guild(self._channel_mutes[c_id][u_id]["guild"])
-                if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
-                    continue
-                time_to_unmute = (
-                    self._channel_mutes[c_id][u_id]["until"]
-                    - datetime.now(timezone.utc).timestamp()
-                )
-                if time_to_unmute < 60.0:
-                    if guild not in multiple_mutes:
-                        multiple_mutes[guild] = {}
-                    if u_id not in multiple_mutes[guild]:
-                        multiple_mutes[guild][u_id] = {c_id: self._channel_mutes[c_id][u_id]}
-                    else:
-                        multiple_mutes[guild][u_id][c_id] = self._channel_mutes[c_id][u_id]
-
-        for guild, users in multiple_mutes.items():
-            await i18n.set_contextual_locales_from_guild(self.bot, guild)
-            for user, channels in users.items():
-                if len(channels) > 1:
-                    task_name = f"server-unmute-channels-{guild.id}-{user}"
-                    if task_name in self._unmute_tasks:
-                        continue
-                    log.debug(f"Creating task: {task_name}")
-                    member = guild.get_member(user)
-                    self._unmute_tasks[task_name] = asyncio.create_task(
-                        self._auto_channel_unmute_user_multi(member, guild, channels)
-                    )
-
-                else:
-                    for channel, mute_data in channels.items():
-                        task_name = f"channel-unmute-{channel}-{user}"
-                        log.debug(f"Creating task: {task_name}")
-                        if task_name in self._unmute_tasks:
-                            continue
-                        if guild_channel := guild.get_channel(channel):
-                            self._unmute_tasks[task_name] = asyncio.create_task(
-                                self._auto_channel_unmute_user(guild_channel, mute_data)
-                            )
-
-        del multiple_mutes
-
     async def _auto_channel_unmute_user_multi(
         self, member: discord.Member, guild: discord.Guild, channels: Dict[int, dict]
     ):
@@ -652,6 +620,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                     _("Manually removed mute role"),
                 )
                 del self._server_mutes[guild.id][after.id]
+                self._update_server_unmute(guild.id, after.id)
                 should_save = True
                 await self._send_dm_notification(
                     after, None, guild, _("Server unmute"), _("Manually removed mute role")
@@ -676,6 +645,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                     "member": after.id,
                     "until": None,
                 }
+                self._update_server_unmute(guild.id, after.id)
                 should_save = True
                 await self._send_dm_notification(
                     after, None, guild, _("Server mute"), _("Manually applied mute role")
@@ -758,6 +728,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             if to_del:
                 for u_id in to_del:
                     del self._channel_mutes[after.id][u_id]
+                    self._update_channel_unmute(after.id, u_id)
                 await self.config.channel(after).muted_users.set(self._channel_mutes[after.id])
 
     @commands.Cog.listener()
@@ -1713,12 +1684,14 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 "member": user.id,
                 "until": until.timestamp() if until else None,
             }
+            self._update_server_unmute(guild.id, user.id)
             try:
                 await user.add_roles(role, reason=reason)
                 await self.config.guild(guild).muted_users.set(self._server_mutes[guild.id])
             except discord.errors.Forbidden:
                 if guild.id in self._server_mutes and user.id in self._server_mutes[guild.id]:
                     del self._server_mutes[guild.id][user.id]
+                    self._update_server_unmute(guild.id, user.id)
                 ret.reason = _(MUTE_UNMUTE_ISSUES["permissions_issue_role"])
                 return ret
             if user.voice:
@@ -1771,6 +1744,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             if guild.id in self._server_mutes:
                 if user.id in self._server_mutes[guild.id]:
                     del self._server_mutes[guild.id][user.id]
+                    self._update_server_unmute(guild.id, user.id)
             if not guild.me.guild_permissions.manage_roles or mute_role >= guild.me.top_role:
                 reasons.append(_(MUTE_UNMUTE_ISSUES["permissions_issue_role"]))
             else:
@@ -1879,6 +1853,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             "until": until.timestamp() if until else None,
             "voice_mute": voice_mute,
         }
+        self._update_channel_unmute(channel.id, user.id)
         try:
             await channel.set_permissions(user, overwrite=overwrites, reason=reason)
             async with self.config.channel(channel).muted_users() as muted_users:
@@ -1886,6 +1861,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         except discord.NotFound as e:
             if channel.id in self._channel_mutes and user.id in self._channel_mutes[channel.id]:
                 del self._channel_mutes[channel.id][user.id]
+                self._update_channel_unmute(channel.id, user.id)
             if e.code == 10003:
                 if (
                     channel.id in self._channel_mutes
@@ -1970,6 +1946,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         overwrites.update(**old_values)
         if channel.id in self._channel_mutes and user.id in self._channel_mutes[channel.id]:
             current_mute = self._channel_mutes[channel.id].pop(user.id)
+            self._update_channel_unmute(channel.id, user.id)
         else:
             ret.reason = _(MUTE_UNMUTE_ISSUES["already_unmuted"]).format(location=channel.mention)
             return ret
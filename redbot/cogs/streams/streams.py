@@ -3,12 +3,14 @@ from redbot.core.utils.chat_formatting import humanize_list
 from redbot.core.bot import Red
 from redbot.core import commands, Config
 from redbot.core.i18n import cog_i18n, Translator, set_contextual_locales_from_guild
+from redbot.core.utils import bounded_gather
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
 from redbot.core.utils.chat_formatting import escape, inline, pagify
 
 from .streamtypes import (
     PicartoStream,
     Stream,
+    TwitchHelix,
     TwitchStream,
     YoutubeStream,
 )
@@ -28,11 +30,14 @@ import logging
 import asyncio
 import aiohttp
 import contextlib
+import time
 from datetime import datetime
 from collections import defaultdict
-from typing import Optional, List, Tuple, Union, Dict
+from typing import Any, Optional, List, Tuple, Union, Dict
 
 MAX_RETRY_COUNT = 10
+# How many streams of the providers without batch lookups are checked at once.
+POLL_CONCURRENCY = 10
 
 _ = Translator("Streams", __file__)
 log = logging.getLogger("red.core.cogs.Streams")
@@ -78,6 +83,9 @@ class Streams(commands.Cog):
 
         self.streams: List[Stream] = []
         self.task: Optional[asyncio.Task] = None
+        self.twitch_helix = TwitchHelix()
+        # Duration of the last stream check and of each provider's part in it, in seconds.
+        self.last_check_stats: Dict[str, float] = {}
 
         self.yt_cid_pattern = re.compile("^UC[-_A-Za-z0-9]{21}[AQgw]$")
 
@@ -213,6 +221,7 @@ class Streams(commands.Cog):
             name=channel_name,
             token=token,
             bearer=self.ttv_bearer_cache.get("access_token", None),
+            _helix=self.twitch_helix,
         )
         await self.check_online(ctx, stream)
 
@@ -444,6 +453,7 @@ class Streams(commands.Cog):
                     name=channel_name,
                     token=token.get("client_id"),
                     bearer=self.ttv_bearer_cache.get("access_token", None),
+                    _helix=self.twitch_helix,
                 )
             else:
                 if is_yt:
@@ -789,7 +799,108 @@ class Streams(commands.Cog):
         await self.bot.wait_until_ready()
         while True:
             await self.check_streams()
-            await asyncio.sleep(await self.config.refresh_timer())
+            refresh_timer = await self.config.refresh_timer()
+            duration = self.last_check_stats.get("total", 0)
+            if duration > refresh_timer:
+                log.warning(
+                    "Checking the streams took %.1f seconds,"
+                    " longer than the refresh timer of %s seconds.",
+                    duration,
+                    refresh_timer,
+                )
+            await asyncio.sleep(refresh_timer)
+
+    async def _poll_streams(self) -> Dict[Stream, Any]:
+        """Check which streams are online, concurrently for each provider.
+
+        Returns a mapping of the streams to the result of their `is_online()`
+        or to the exception it raised.
+        """
+        start = time.perf_counter()
+        by_platform: Dict[str, List[Stream]] = defaultdict(list)
+        for stream in self.streams:
+            by_platform[stream.platform_name].append(stream)
+
+        results: Dict[Stream, Any] = {}
+        stats: Dict[str, float] = {}
+
+        async def poll(platform_name: str, streams: List[Stream]) -> None:
+            platform_start = time.perf_counter()
+            try:
+                if platform_name == TwitchStream.platform_name:
+                    results.update(await self._poll_twitch_streams(streams))
+                else:
+                    outcomes = await bounded_gather(
+                        *(stream.is_online() for stream in streams),
+                        return_exceptions=True,
+                        limit=POLL_CONCURRENCY,
+                    )
+                    results.update(zip(streams, outcomes))
+            except Exception as exc:
+                # Reported for each of the streams, like errors of a single stream are.
+                results.update((stream, exc) for stream in streams)
+            stats[platform_name] = time.perf_counter() - platform_start
+
+        await asyncio.gather(*(poll(name, streams) for name, streams in by_platform.items()))
+        stats["total"] = time.perf_counter() - start
+        self.last_check_stats = stats
+        log.debug(
+            "Checked %s streams in %.2f seconds (%s).",
+            len(results),
+            stats["total"],
+            ", ".join(f"{name}: {stats[name]:.2f}s" for name in by_platform),
+        )
+        return results
+
+    async def _poll_twitch_streams(self, streams: List[TwitchStream]) -> Dict[Stream, Any]:
+        await self.maybe_renew_twitch_bearer_token()
+        helix = self.twitch_helix
+        helix.client_id = (await self.bot.get_shared_api_tokens("twitch")).get("client_id")
+        helix.bearer = self.ttv_bearer_cache.get("access_token", None)
+        results: Dict[Stream, Any] = {}
+
+        # Streams that were added before we knew their user ID.
+        unresolved = [stream for stream in streams if stream.id is None]
+        if unresolved:
+            code, profiles = await helix.get_users(logins=[stream.name for stream in unresolved])
+            by_login = {profile["login"].lower(): profile for profile in profiles}
+            for stream in unresolved:
+                try:
+                    TwitchStream.check_users_response(code, {})
+                except StreamsError as exc:
+                    results[stream] = exc
+                    continue
+                if (profile := by_login.get(stream.name.lower())) is None:
+                    results[stream] = StreamNotFound()
+                else:
+                    stream.id = profile["id"]
+
+        online = []
+        pending = [stream for stream in streams if stream not in results]
+        streams_data = await helix.get_streams(stream.id for stream in pending)
+        for stream in pending:
+            code, data = streams_data[stream.id]
+            try:
+                TwitchStream.check_streams_response(code, data)
+            except StreamsError as exc:
+                results[stream] = exc
+                continue
+            if data is None:
+                results[stream] = OfflineStream()
+            else:
+                online.append((stream, data))
+
+        if online:
+            __, profiles = await helix.get_users(ids=[stream.id for stream, _data in online])
+            by_id = {profile["id"]: profile for profile in profiles}
+            followers = await asyncio.gather(
+                *(helix.get_followers(stream.id) for stream, _data in online)
+            )
+            for (stream, data), count in zip(online, followers):
+                results[stream] = stream.online_result(data, by_id.get(stream.id), count)
+
+        helix.prune_cache()
+        return results
 
     async def _send_stream_alert(
         self,
@@ -823,20 +934,27 @@ class Streams(commands.Cog):
 
     async def check_streams(self):
         to_remove = []
+        results = await self._poll_streams()
         for stream in self.streams:
+            if stream not in results:
+                # added while the streams were being checked
+                continue
             try:
                 try:
                     is_rerun = False
                     is_schedule = False
+                    result = results[stream]
+                    if isinstance(result, BaseException):
+                        raise result
+
                     if stream.__class__.__name__ == "TwitchStream":
-                        await self.maybe_renew_twitch_bearer_token()
-                        embed, is_rerun = await stream.is_online()
+                        embed, is_rerun = result
 
                     elif stream.__class__.__name__ == "YoutubeStream":
-                        embed, is_schedule = await stream.is_online()
+                        embed, is_schedule = result
 
                     else:
-                        embed = await stream.is_online()
+                        embed = result
                 except StreamNotFound:
                     if stream.retry_count > MAX_RETRY_COUNT:
                         log.info("Stream with name %s no longer exists. Removing...", stream.name)
@@ -1013,6 +1131,8 @@ class Streams(commands.Cog):
                         raw_stream["config"] = self.config
                     raw_stream["token"] = token
             raw_stream["_bot"] = self.bot
+            if _class.__name__ == "TwitchStream":
+                raw_stream["_helix"] = self.twitch_helix
             streams.append(_class(**raw_stream))
 
         return streams
@@ -1024,6 +1144,7 @@ class Streams(commands.Cog):
 
         await self.config.streams.set(raw_streams)
 
-    def cog_unload(self):
+    async def cog_unload(self):
         if self.task:
             self.task.cancel()
+        await self.twitch_helix.close()
@@ -8,7 +8,7 @@ from random import choice
 from string import ascii_letters
 from datetime import datetime, timedelta, timezone
 import xml.etree.ElementTree as ET
-from typing import ClassVar, Optional, List, Tuple
+from typing import Any, ClassVar, Dict, Iterable, Mapping, Optional, List, Sequence, Tuple, Union
 
 import aiohttp
 import discord
@@ -28,6 +28,11 @@ TWITCH_BASE_URL = "https://api.twitch.tv"
 TWITCH_ID_ENDPOINT = TWITCH_BASE_URL + "/helix/users"
 TWITCH_STREAMS_ENDPOINT = TWITCH_BASE_URL + "/helix/streams/"
 TWITCH_FOLLOWS_ENDPOINT = TWITCH_BASE_URL + "/helix/channels/followers"
+# Maximum number of IDs or logins in a single Helix request.
+TWITCH_BATCH_SIZE = 100
+# How long user profiles and follower counts are cached for, in seconds.
+TWITCH_PROFILE_TTL = 60 * 60
+TWITCH_FOLLOWERS_TTL = 10 * 60
 
 YOUTUBE_BASE_URL = "https://www.googleapis.com/youtube/v3"
 YOUTUBE_CHANNELS_ENDPOINT = YOUTUBE_BASE_URL + "/channels"
@@ -311,8 +316,7 @@ class TwitchStream(Stream):
         self._display_name = None
         self._client_id = kwargs.pop("token", None)
         self._bearer = kwargs.pop("bearer", None)
-        self._rate_limit_resets: set = set()
-        self._rate_limit_remaining: int = 0
+        self._helix: TwitchHelix = kwargs.pop("_helix")
         super().__init__(**kwargs)
 
     @property
@@ -323,53 +327,11 @@ class TwitchStream(Stream):
     def display_name(self, value: str) -> None:
         self._display_name = value
 
-    async def wait_for_rate_limit_reset(self) -> None:
-        """Check rate limits in response header and ensure we're following them.
-
-        From python-twitch-client and adapted to asyncio from Trusty-cogs:
-        https://github.com/tsifrer/python-twitch-client/blob/master/twitch/helix/base.py
-        https://github.com/TrustyJAID/Trusty-cogs/blob/master/twitch/twitch_api.py
-        """
-        current_time = int(time.time())
-        self._rate_limit_resets = {x for x in self._rate_limit_resets if x > current_time}
-
-        if self._rate_limit_remaining == 0:
-            if self._rate_limit_resets:
-                reset_time = next(iter(self._rate_limit_resets))
-                # Calculate wait time and add 0.1s to the wait time to allow Twitch to reset
-                # their counter
-                wait_time = reset_time - current_time + 0.1
-                await asyncio.sleep(wait_time)
-
     async def get_data(self, url: str, params: dict = {}) -> Tuple[Optional[int], dict]:
         header = {"Client-ID": str(self._client_id)}
         if self._bearer is not None:
             header["Authorization"] = f"Bearer {self._bearer}"
-        await self.wait_for_rate_limit_reset()
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=header, params=params, timeout=60) as resp:
-                    remaining = resp.headers.get("Ratelimit-Remaining")
-                    if remaining:
-                        self._rate_limit_remaining = int(remaining)
-                    reset = resp.headers.get("Ratelimit-Reset")
-                    if reset:
-                        self._rate_limit_resets.add(int(reset))
-
-                    if resp.status == 429:
-                        log.info(
-                            "Ratelimited. Trying again at %s.", datetime.fromtimestamp(int(reset))
-                        )
-                        resp.release()
-                        return await self.get_data(url)
-
-                    if resp.status != 200:
-                        return resp.status, {}
-
-                    return resp.status, await resp.json(encoding="utf-8")
-            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
-                log.warning("Connection error occurred when fetching Twitch stream", exc_info=exc)
-                return None, {}
+        return await self._helix.get_data(url, params, headers=header)
 
     async def is_online(self):
         user_profile_data = None
@@ -379,55 +341,72 @@ class TwitchStream(Stream):
         stream_code, stream_data = await self.get_data(
             TWITCH_STREAMS_ENDPOINT, {"user_id": self.id}
         )
-        if stream_code == 200:
-            if not stream_data["data"]:
-                raise OfflineStream()
-
-            if user_profile_data is None:
-                user_profile_data = await self._fetch_user_profile()
-
-            final_data = dict.fromkeys(
-                ("game_name", "followers", "login", "profile_image_url", "view_count")
-            )
-
-            if user_profile_data is not None:
-                final_data["login"] = user_profile_data["login"]
-                final_data["profile_image_url"] = user_profile_data["profile_image_url"]
+        self.check_streams_response(stream_code, stream_data)
+        if not stream_data["data"]:
+            raise OfflineStream()
 
-            stream_data = stream_data["data"][0]
-            final_data["user_name"] = self.display_name = stream_data["user_name"]
-            final_data["game_name"] = stream_data["game_name"]
-            final_data["thumbnail_url"] = stream_data["thumbnail_url"]
-            final_data["title"] = stream_data["title"]
-            final_data["type"] = stream_data["type"]
-            final_data["view_count"] = stream_data["viewer_count"]
+        if user_profile_data is None:
+            user_profile_data = await self._fetch_user_profile()
 
-            __, follows_data = await self.get_data(
-                TWITCH_FOLLOWS_ENDPOINT, {"broadcaster_id": self.id}
-            )
-            if follows_data:
-                final_data["followers"] = follows_data["total"]
+        __, follows_data = await self.get_data(
+            TWITCH_FOLLOWS_ENDPOINT, {"broadcaster_id": self.id}
+        )
+        followers = follows_data["total"] if follows_data else None
 
-            # Reset the retry count since we successfully got information about this
-            # channel's streams
-            self.retry_count = 0
+        return self.online_result(stream_data["data"][0], user_profile_data, followers)
 
-            return self.make_embed(final_data), final_data["type"] == "rerun"
-        elif stream_code == 400:
+    @staticmethod
+    def check_streams_response(code: Optional[int], data: dict) -> None:
+        """Raise the appropriate error for a failed request to the streams endpoint."""
+        if code == 200:
+            return
+        elif code == 400:
             raise InvalidTwitchCredentials()
-        elif stream_code == 404:
+        elif code == 404:
             raise StreamNotFound()
         else:
-            raise APIError(stream_code, stream_data)
+            raise APIError(code, data)
+
+    def online_result(
+        self, stream_data: dict, user_profile_data: Optional[dict], followers: Optional[int]
+    ) -> Tuple[discord.Embed, bool]:
+        """Make the result of `is_online()` for a stream which is live."""
+        final_data = dict.fromkeys(
+            ("game_name", "followers", "login", "profile_image_url", "view_count")
+        )
+
+        if user_profile_data is not None:
+            final_data["login"] = user_profile_data["login"]
+            final_data["profile_image_url"] = user_profile_data["profile_image_url"]
+
+        final_data["user_name"] = self.display_name = stream_data["user_name"]
+        final_data["game_name"] = stream_data["game_name"]
+        final_data["thumbnail_url"] = stream_data["thumbnail_url"]
+        final_data["title"] = stream_data["title"]
+        final_data["type"] = stream_data["type"]
+        final_data["view_count"] = stream_data["viewer_count"]
+        final_data["followers"] = followers
+
+        # Reset the retry count since we successfully got information about this
+        # channel's streams
+        self.retry_count = 0
+
+        return self.make_embed(final_data), final_data["type"] == "rerun"
 
     async def _fetch_user_profile(self):
         code, data = await self.get_data(TWITCH_ID_ENDPOINT, {"login": self.name})
+        self.check_users_response(code, data)
+        if not data["data"]:
+            raise StreamNotFound()
+        if self.id is None:
+            self.id = data["data"][0]["id"]
+        return data["data"][0]
+
+    @staticmethod
+    def check_users_response(code: Optional[int], data: dict) -> None:
+        """Raise the appropriate error for a failed request to the users endpoint."""
         if code == 200:
-            if not data["data"]:
-                raise StreamNotFound()
-            if self.id is None:
-                self.id = data["data"][0]["id"]
-            return data["data"][0]
+            return
         elif code == 400:
             raise StreamNotFound()
         elif code == 401:
@@ -461,6 +440,197 @@ class TwitchStream(Stream):
         return "<{0.__class__.__name__}: {0.name} (ID: {0.id})>".format(self)
 
 
+class TwitchHelix:
+    """Client for Twitch's Helix API, shared by all polled Twitch streams.
+
+    All Twitch requests of the cog, including the ones of `TwitchStream.is_online()`,
+    go through a single HTTP session and share one rate limit budget.
+    Streams are looked up in batches of up to 100 channels, and user profiles
+    and follower counts, which change rarely, are cached for a while.
+    """
+
+    def __init__(self, *, concurrency: int = 4):
+        self.client_id: Optional[str] = None
+        self.bearer: Optional[str] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_limit_resets: set = set()
+        self._rate_limit_remaining: int = 0
+        # user ID -> (expiry time, profile)
+        self._profiles: Dict[str, Tuple[float, dict]] = {}
+        # user ID -> (expiry time, follower count)
+        self._followers: Dict[str, Tuple[float, Optional[int]]] = {}
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def wait_for_rate_limit_reset(self) -> None:
+        """Check rate limits in response header and ensure we're following them.
+
+        From python-twitch-client and adapted to asyncio from Trusty-cogs:
+        https://github.com/tsifrer/python-twitch-client/blob/master/twitch/helix/base.py
+        https://github.com/TrustyJAID/Trusty-cogs/blob/master/twitch/twitch_api.py
+        """
+        current_time = int(time.time())
+        self._rate_limit_resets = {x for x in self._rate_limit_resets if x > current_time}
+
+        if self._rate_limit_remaining == 0:
+            if self._rate_limit_resets:
+                reset_time = next(iter(self._rate_limit_resets))
+                # Calculate wait time and add 0.1s to the wait time to allow Twitch to reset
+                # their counter
+                wait_time = reset_time - current_time + 0.1
+                await asyncio.sleep(wait_time)
+
+    async def get_data(
+        self,
+        url: str,
+        params: Union[Mapping[str, Any], Sequence[Tuple[str, Any]]],
+        *,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[int], dict]:
+        """Make a request to the Helix API, following its rate limits.
+
+        The request is made with the client's credentials, unless other headers are given.
+        """
+        if headers is None:
+            headers = {"Client-ID": str(self.client_id)}
+            if self.bearer is not None:
+                headers["Authorization"] = f"Bearer {self.bearer}"
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with self._semaphore:
+            while True:
+                await self.wait_for_rate_limit_reset()
+                try:
+                    async with self._session.get(
+                        url, headers=headers, params=params, timeout=60
+                    ) as resp:
+                        remaining = resp.headers.get("Ratelimit-Remaining")
+                        if remaining:
+                            self._rate_limit_remaining = int(remaining)
+                        reset = resp.headers.get("Ratelimit-Reset")
+                        if reset:
+                            self._rate_limit_resets.add(int(reset))
+
+                        if resp.status == 429:
+                            if not reset:
+                                return resp.status, {}
+                            log.info(
+                                "Ratelimited. Trying again at %s.",
+                                datetime.fromtimestamp(int(reset)),
+                            )
+                            self._rate_limit_remaining = 0
+                            continue
+
+                        if resp.status != 200:
+                            return resp.status, {}
+
+                        return resp.status, await resp.json(encoding="utf-8")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                    log.warning(
+                        "Connection error occurred when fetching Twitch stream", exc_info=exc
+                    )
+                    return None, {}
+
+    async def get_streams(
+        self, user_ids: Iterable[str]
+    ) -> Dict[str, Tuple[Optional[int], Optional[dict]]]:
+        """Get the live streams of the given users.
+
+        Returns
+        -------
+        Dict[str, Tuple[Optional[int], Optional[dict]]]
+            Mapping of user IDs to the status code of the request for them
+            and the data of their stream, or ``None`` if they're offline.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        chunks = [
+            user_ids[idx : idx + TWITCH_BATCH_SIZE]
+            for idx in range(0, len(user_ids), TWITCH_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.get_data(
+                    TWITCH_STREAMS_ENDPOINT,
+                    [("first", TWITCH_BATCH_SIZE), *(("user_id", i) for i in chunk)],
+                )
+                for chunk in chunks
+            )
+        )
+        ret: Dict[str, Tuple[Optional[int], Optional[dict]]] = {}
+        for chunk, (code, data) in zip(chunks, responses):
+            if code != 200:
+                ret.update((user_id, (code, data)) for user_id in chunk)
+                continue
+            live = {stream["user_id"]: stream for stream in data["data"]}
+            ret.update((user_id, (code, live.get(user_id))) for user_id in chunk)
+        return ret
+
+    async def get_users(
+        self, *, ids: Iterable[str] = (), logins: Iterable[str] = ()
+    ) -> Tuple[Optional[int], List[dict]]:
+        """Get the profiles of the given users.
+
+        Profiles looked up by ID are served from the cache when possible.
+
+        Returns
+        -------
+        Tuple[Optional[int], List[dict]]
+            The status code of the first failed request, or 200,
+            and the profiles of the users which were found.
+        """
+        now = time.monotonic()
+        ret: List[dict] = []
+        params: List[Tuple[str, str]] = []
+        for user_id in dict.fromkeys(ids):
+            cached = self._profiles.get(user_id)
+            if cached is not None and cached[0] > now:
+                ret.append(cached[1])
+            else:
+                params.append(("id", user_id))
+        params.extend(("login", login) for login in dict.fromkeys(logins))
+
+        status = 200
+        responses = await asyncio.gather(
+            *(
+                self.get_data(TWITCH_ID_ENDPOINT, params[idx : idx + TWITCH_BATCH_SIZE])
+                for idx in range(0, len(params), TWITCH_BATCH_SIZE)
+            )
+        )
+        expires_at = time.monotonic() + TWITCH_PROFILE_TTL
+        for code, data in responses:
+            if code != 200:
+                if status == 200:
+                    status = code
+                continue
+            for profile in data["data"]:
+                self._profiles[profile["id"]] = (expires_at, profile)
+                ret.append(profile)
+        return status, ret
+
+    async def get_followers(self, user_id: str) -> Optional[int]:
+        """Get the follower count of the given user, if it can be fetched."""
+        cached = self._followers.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        __, follows_data = await self.get_data(
+            TWITCH_FOLLOWS_ENDPOINT, [("broadcaster_id", user_id)]
+        )
+        followers = follows_data["total"] if follows_data else None
+        self._followers[user_id] = (time.monotonic() + TWITCH_FOLLOWERS_TTL, followers)
+        return followers
+
+    def prune_cache(self) -> None:
+        """Drop expired profiles and follower counts."""
+        now = time.monotonic()
+        for cache in (self._profiles, self._followers):
+            for key in [key for key, (expires_at, _data) in cache.items() if expires_at <= now]:
+                del cache[key]
+
+
 class PicartoStream(Stream):
     token_name = None  # This streaming services don't currently require an API key
     platform_name = "Picarto"
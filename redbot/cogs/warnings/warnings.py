@@ -473,7 +473,6 @@ class Warnings(commands.Cog):
         if reason_type is None:
             return
         member_settings = self.config.member(member)
-        current_point_count = await member_settings.total_points()
         warning_to_add = {
             str(ctx.message.id): {
                 "points": reason_type["points"],
@@ -512,8 +511,7 @@ class Warnings(commands.Cog):
             )
         async with member_settings.warnings() as user_warnings:
             user_warnings.update(warning_to_add)
-        current_point_count += reason_type["points"]
-        await member_settings.total_points.set(current_point_count)
+        current_point_count = await member_settings.total_points.inc(reason_type["points"])
         await warning_points_add_check(self.config, ctx, member, current_point_count)
 
         toggle_channel = guild_settings["toggle_channel"]
@@ -676,8 +674,7 @@ class Warnings(commands.Cog):
             if warn_id not in user_warnings.keys():
                 return await ctx.send(_("That warning doesn't exist!"))
             else:
-                current_point_count -= user_warnings[warn_id]["points"]
-                await member_settings.total_points.set(current_point_count)
+                await member_settings.total_points.inc(-user_warnings[warn_id]["points"])
                 user_warnings.pop(warn_id)
         await modlog.create_case(
             self.bot,
@@ -288,6 +288,15 @@ def parse_cli_flags(args):
     parser.add_argument(
         "--no-message-cache", action="store_true", help="Disable the internal message cache."
     )
+    parser.add_argument(
+        "--config-cache-size",
+        type=non_negative_int,
+        default=0,
+        metavar="MiB",
+        help="Cache up to the given amount of Config reads in memory, in MiB."
+        " Mostly useful with storage backends that need a round-trip for each read,"
+        " such as Postgres. The cache is disabled by default.",
+    )
     parser.add_argument(
         "--disable-intent",
         action="append",
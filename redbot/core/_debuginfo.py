@@ -11,7 +11,7 @@ import pip
 import psutil
 
 from redbot import __version__
-from redbot.core import data_manager
+from redbot.core import _drivers, commands, data_manager
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box
 
@@ -189,6 +189,16 @@ class DebugInfo:
             parts.append(f"Disabled intents: {disabled_intents}")
 
         parts.append(f"Storage type: {data_manager.storage_type()}")
+        if cache_stats := _drivers.CachingDriver.get_stats():
+            parts.append(
+                "Config cache: {hits} hits, {misses} misses, {evictions} evictions,"
+                " {size}/{max_size} bytes".format(**cache_stats)
+            )
+        rule_cache_stats = commands.Requires.get_rule_cache_stats()
+        parts.append(
+            "Permission rule cache: {hits} hits, {misses} misses,"
+            " {invalidations} invalidations".format(**rule_cache_stats)
+        )
         parts.append(f"Data path: {data_manager.basic_config['DATA_PATH']}")
         parts.append(f"Metadata file: {data_manager.config_file}")
 
@@ -3,8 +3,11 @@ from typing import Optional, Type
 
 from .. import data_manager
 from .base import IdentifierData, BaseDriver, ConfigCategory
+from .cache import CachingDriver
 from .json import JsonDriver
 from .postgres import PostgresDriver
+from .sharded_json import ShardedJsonDriver
+from .sqlite import SqliteDriver
 
 __all__ = [
     "get_driver",
@@ -13,8 +16,11 @@ __all__ = [
     "ConfigCategory",
     "IdentifierData",
     "BaseDriver",
+    "CachingDriver",
     "JsonDriver",
     "PostgresDriver",
+    "ShardedJsonDriver",
+    "SqliteDriver",
     "BackendType",
 ]
 
@@ -26,12 +32,21 @@ class BackendType(enum.Enum):
     JSON = "JSON"
     #: Postgres storage backend.
     POSTGRES = "Postgres"
+    #: JSON storage backend with one file per guild/scope.
+    SHARDED_JSON = "ShardedJSON"
+    #: SQLite storage backend.
+    SQLITE = "SQLite"
     # Dead drivers below retained for error handling.
     MONGOV1 = "MongoDB"
     MONGO = "MongoDBV2"
 
 
-_DRIVER_CLASSES = {BackendType.JSON: JsonDriver, BackendType.POSTGRES: PostgresDriver}
+_DRIVER_CLASSES = {
+    BackendType.JSON: JsonDriver,
+    BackendType.POSTGRES: PostgresDriver,
+    BackendType.SHARDED_JSON: ShardedJsonDriver,
+    BackendType.SQLITE: SqliteDriver,
+}
 
 
 def get_driver_class_include_old(storage_type: Optional[BackendType] = None) -> Type[BaseDriver]:
@@ -99,7 +114,8 @@ def get_driver(
     Returns
     -------
     BaseDriver
-        A driver instance.
+        A driver instance. Wrapped in `CachingDriver` if the Config cache
+        is enabled.
 
     Raises
     ------
@@ -126,4 +142,7 @@ def get_driver(
             ) from None
         else:
             raise RuntimeError(f"Invalid driver type: '{storage_type}'") from None
-    return driver_cls(cog_name, identifier, **kwargs)
+    driver = driver_cls(cog_name, identifier, **kwargs)
+    if CachingDriver.is_enabled() and not allow_old:
+        return CachingDriver(driver)
+    return driver
@@ -1,11 +1,14 @@
 import abc
 import enum
-from typing import Tuple, Dict, Any, Union, List, AsyncIterator, Type
+from typing import Tuple, Dict, Any, Union, List, AsyncIterator, Type, Sequence
 
 import rich.progress
 
 from redbot.core.utils._internal_utils import RichIndefiniteBarColumn
 
+from .. import errors
+from .views import freeze
+
 __all__ = ("BaseDriver", "IdentifierData", "ConfigCategory", "MissingExtraRequirements")
 
 
@@ -226,6 +229,27 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def get_view(self, identifier_data: IdentifierData) -> Any:
+        """
+        Finds the value indicated by the given identifiers, without
+        copying it if the driver keeps the data in memory.
+
+        Dicts and lists are returned as read-only views.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses.
+
+        Parameters
+        ----------
+        identifier_data
+
+        Returns
+        -------
+        Any
+            Stored value.
+        """
+        return freeze(await self.get(identifier_data))
+
     @abc.abstractmethod
     async def set(self, identifier_data: IdentifierData, value=None) -> None:
         """
@@ -252,6 +276,139 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def get_many(
+        self, identifiers: Sequence[IdentifierData], default: Any = None
+    ) -> List[Any]:
+        """
+        Finds the values indicated by each of the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses.
+
+        Parameters
+        ----------
+        identifiers
+        default
+            The value returned in place of values which are not stored.
+
+        Returns
+        -------
+        List[Any]
+            Stored values, in the same order as ``identifiers``.
+        """
+        ret = []
+        for identifier_data in identifiers:
+            try:
+                ret.append(await self.get(identifier_data))
+            except KeyError:
+                ret.append(default)
+        return ret
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        """
+        Sets the values of the keys indicated by the given identifiers.
+
+        The values are set in order. If an error is raised, the values
+        preceding the one which failed may or may not have been set,
+        depending on the driver.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses.
+
+        Parameters
+        ----------
+        items
+            Pairs of identifier data and any JSON serializable python object.
+        """
+        for identifier_data, value in items:
+            await self.set(identifier_data, value=value)
+
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        """
+        Clears out the values specified by the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses.
+
+        Parameters
+        ----------
+        identifiers
+        """
+        for identifier_data in identifiers:
+            await self.clear(identifier_data)
+
+    async def inc(
+        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+    ) -> Union[int, float]:
+        """
+        Increments the number indicated by the given identifiers.
+
+        If nothing is stored yet, ``default + value`` is stored.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It is not atomic - drivers should override it with
+        an implementation that reads and writes the value in one step.
+
+        Parameters
+        ----------
+        identifier_data
+        value
+            The amount to increment the stored number by.
+        default
+            The number to increment if nothing is stored yet.
+
+        Returns
+        -------
+        Union[int, float]
+            The new value.
+
+        Raises
+        ------
+        errors.StoredTypeError
+            If the stored value is not a number.
+        """
+        try:
+            current = await self.get(identifier_data)
+        except KeyError:
+            current = default
+        result = _increment(current, value)
+        await self.set(identifier_data, value=result)
+        return result
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        """
+        Toggles the boolean indicated by the given identifiers.
+
+        If nothing is stored yet, ``not default`` is stored.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It is not atomic - drivers should override it with
+        an implementation that reads and writes the value in one step.
+
+        Parameters
+        ----------
+        identifier_data
+        default
+            The boolean to toggle if nothing is stored yet.
+
+        Returns
+        -------
+        bool
+            The new value.
+
+        Raises
+        ------
+        errors.StoredTypeError
+            If the stored value is not a boolean.
+        """
+        try:
+            current = await self.get(identifier_data)
+        except KeyError:
+            current = default
+        result = _toggle(current)
+        await self.set(identifier_data, value=result)
+        return result
+
     @classmethod
     @abc.abstractmethod
     def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
@@ -394,3 +551,19 @@ class BaseDriver(abc.ABC):
                     *ConfigCategory.get_pkey_info(category, custom_group_data),
                 )
                 await self.set(ident_data, data)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _increment(current: Any, value: Union[int, float]) -> Union[int, float]:
+    if not _is_number(current):
+        raise errors.StoredTypeError(f"Cannot increment non-numeric value {current!r}")
+    return current + value
+
+
+def _toggle(current: Any) -> bool:
+    if not isinstance(current, bool):
+        raise errors.StoredTypeError(f"Cannot toggle non-boolean value {current!r}")
+    return not current
@@ -0,0 +1,364 @@
+import pickle
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from .base import BaseDriver, IdentifierData
+
+__all__ = ("CachingDriver",)
+
+# Rough per-entry bookkeeping overhead (node, LRU slot, key tuple), in bytes.
+_ENTRY_OVERHEAD = 200
+
+# Marker for a cached miss, i.e. a path for which the driver raised KeyError.
+_MISSING = object()
+
+
+class _CacheNode:
+    __slots__ = ("parent", "key", "children", "data", "size")
+
+    def __init__(self, parent: Optional["_CacheNode"], key: Optional[str]):
+        self.parent = parent
+        self.key = key
+        self.children: Dict[str, _CacheNode] = {}
+        # Pickled value, `_MISSING`, or None when nothing is cached for this path.
+        self.data: Any = None
+        self.size = 0
+
+
+class _LRUCache:
+    """Byte-bounded LRU cache of driver reads, laid out as a trie.
+
+    Storing entries in a trie keyed on the parts of
+    `IdentifierData.to_tuple()` means that all paths affected by a write
+    are the ancestors and the subtree of the written node.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation, so that reads which were in flight
+        # at that time do not fill the cache with stale data.
+        self.generation = 0
+        self._root = _CacheNode(None, None)
+        self._lru: "OrderedDict[Tuple[str, ...], _CacheNode]" = OrderedDict()
+
+    def _find(self, key: Tuple[str, ...]) -> Optional[_CacheNode]:
+        node = self._root
+        for part in key:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def lookup(self, key: Tuple[str, ...]) -> Any:
+        node = self._find(key)
+        if node is None or node.data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._lru.move_to_end(key)
+        return node.data
+
+    def store(self, key: Tuple[str, ...], data: Any, generation: int) -> None:
+        if generation != self.generation:
+            return
+        size = _ENTRY_OVERHEAD + (len(data) if data is not _MISSING else 0)
+        if size > self.max_size // 4:
+            # Not worth evicting a large part of the cache for a single entry.
+            return
+
+        node = self._root
+        for part in key:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _CacheNode(node, part)
+            node = child
+        if node.data is not None:
+            self.size -= node.size
+        node.data = data
+        node.size = size
+        self.size += size
+        self._lru[key] = node
+        self._lru.move_to_end(key)
+
+        while self.size > self.max_size:
+            old_key, old_node = self._lru.popitem(last=False)
+            self._drop(old_node)
+            self._prune(old_node)
+            self.evictions += 1
+
+    def invalidate(self, key: Tuple[str, ...]) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        node = self._root
+        path = [node]
+        for part in key:
+            node = node.children.get(part)
+            if node is None:
+                break
+            path.append(node)
+        else:
+            # The written path exists in the cache - drop its whole subtree.
+            self._drop_subtree(node, key)
+            if node.parent is not None:
+                del node.parent.children[node.key]
+            path.pop()
+        # Cached values for ancestors include the written path.
+        for depth, ancestor in enumerate(path):
+            if ancestor.data is not None:
+                del self._lru[key[:depth]]
+                self._drop(ancestor)
+        self._prune(path[-1])
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        self._root = _CacheNode(None, None)
+        self._lru.clear()
+        self.size = 0
+
+    def _drop(self, node: _CacheNode) -> None:
+        self.size -= node.size
+        node.data = None
+        node.size = 0
+
+    def _drop_subtree(self, node: _CacheNode, key: Tuple[str, ...]) -> None:
+        stack = [(node, key)]
+        while stack:
+            node, key = stack.pop()
+            if node.data is not None:
+                del self._lru[key]
+                self._drop(node)
+            stack.extend((child, key + (part,)) for part, child in node.children.items())
+
+    def _prune(self, node: _CacheNode) -> None:
+        while node.parent is not None and node.data is None and not node.children:
+            del node.parent.children[node.key]
+            node = node.parent
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._lru),
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+
+_cache: Optional[_LRUCache] = None
+
+
+class CachingDriver(BaseDriver):
+    """Read-through cache in front of any other driver.
+
+    Reads are served from a process-wide, byte-bounded LRU cache keyed on
+    `IdentifierData`, misses (`KeyError`) included. Writes and clears
+    go straight to the wrapped driver, after which the written path, its
+    ancestors and its descendants are invalidated.
+
+    Values are cached in pickled form, so every read still returns a
+    fresh object that the caller is free to mutate.
+
+    The cache does not take any locks of its own, so it can't deadlock
+    with the locks returned by `Value.get_lock()`.
+    """
+
+    def __init__(self, driver: BaseDriver):
+        super().__init__(driver.cog_name, driver.unique_cog_identifier)
+        self.driver = driver
+
+    def __getattr__(self, name: str) -> Any:
+        # Driver-specific extras, e.g. JsonDriver.migrate_identifier()
+        if name == "driver":
+            raise AttributeError(name)
+        return getattr(self.driver, name)
+
+    @classmethod
+    async def initialize(cls, *, max_size: int = 0, **storage_details) -> None:
+        """Enable the cache.
+
+        Parameters
+        ----------
+        max_size : int
+            Memory budget of the cache in bytes. 0 disables the cache.
+
+        """
+        global _cache
+        _cache = _LRUCache(max_size) if max_size > 0 else None
+
+    @classmethod
+    async def teardown(cls) -> None:
+        global _cache
+        _cache = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Whether `get_driver` should wrap drivers in `CachingDriver`."""
+        return _cache is not None
+
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """Get the cache counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionary with the number of ``hits``, ``misses``,
+            ``evictions`` and ``invalidations`` so far, the number of
+            cached ``entries``, and the current and maximum ``size``
+            of the cache in bytes. Empty if the cache is disabled.
+        """
+        if _cache is None:
+            return {}
+        return _cache.get_stats()
+
+    @staticmethod
+    def get_config_details() -> Dict[str, Any]:
+        return {}
+
+    @staticmethod
+    def _get_wrapped_class() -> Type[BaseDriver]:
+        # Avoiding circular imports
+        from . import get_driver_class
+
+        return get_driver_class()
+
+    @classmethod
+    def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
+        return cls._get_wrapped_class().aiter_cogs()
+
+    @classmethod
+    async def migrate_to(
+        cls,
+        new_driver_cls: Type[BaseDriver],
+        all_custom_group_data: Dict[str, Dict[str, Dict[str, int]]],
+    ) -> None:
+        await cls._get_wrapped_class().migrate_to(new_driver_cls, all_custom_group_data)
+
+    @classmethod
+    async def delete_all_data(cls, **kwargs) -> None:
+        try:
+            await cls._get_wrapped_class().delete_all_data(**kwargs)
+        finally:
+            if _cache is not None:
+                _cache.clear()
+
+    async def get(self, identifier_data: IdentifierData):
+        cache = _cache
+        if cache is None:
+            return await self.driver.get(identifier_data)
+
+        key = identifier_data.to_tuple()
+        cached = cache.lookup(key)
+        if cached is _MISSING:
+            raise KeyError(key[-1])
+        if cached is not None:
+            return pickle.loads(cached)
+
+        generation = cache.generation
+        try:
+            value = await self.driver.get(identifier_data)
+        except KeyError:
+            cache.store(key, _MISSING, generation)
+            raise
+        cache.store(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), generation)
+        return value
+
+    async def get_many(
+        self, identifiers: Sequence[IdentifierData], default: Any = None
+    ) -> List[Any]:
+        cache = _cache
+        if cache is None:
+            return await self.driver.get_many(identifiers, default)
+
+        ret = []
+        to_fetch = []
+        for idx, identifier_data in enumerate(identifiers):
+            key = identifier_data.to_tuple()
+            cached = cache.lookup(key)
+            if cached is _MISSING:
+                ret.append(default)
+            elif cached is not None:
+                ret.append(pickle.loads(cached))
+            else:
+                ret.append(default)
+                to_fetch.append((idx, key, identifier_data))
+        if not to_fetch:
+            return ret
+
+        generation = cache.generation
+        fetched = await self.driver.get_many([i for _idx, _key, i in to_fetch], _MISSING)
+        for (idx, key, _identifier_data), value in zip(to_fetch, fetched):
+            if value is _MISSING:
+                cache.store(key, _MISSING, generation)
+            else:
+                cache.store(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), generation)
+                ret[idx] = value
+        return ret
+
+    async def set(self, identifier_data: IdentifierData, value=None):
+        try:
+            await self.driver.set(identifier_data, value=value)
+        finally:
+            self._invalidate(identifier_data)
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        try:
+            await self.driver.set_many(items)
+        finally:
+            for identifier_data, _value in items:
+                self._invalidate(identifier_data)
+
+    async def clear(self, identifier_data: IdentifierData):
+        try:
+            await self.driver.clear(identifier_data)
+        finally:
+            self._invalidate(identifier_data)
+
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        try:
+            await self.driver.clear_many(identifiers)
+        finally:
+            for identifier_data in identifiers:
+                self._invalidate(identifier_data)
+
+    async def inc(
+        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+    ) -> Union[int, float]:
+        try:
+            return await self.driver.inc(identifier_data, value, default)
+        finally:
+            self._invalidate(identifier_data)
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        try:
+            return await self.driver.toggle(identifier_data, default)
+        finally:
+            self._invalidate(identifier_data)
+
+    async def export_data(
+        self, custom_group_data: Dict[str, int]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        return await self.driver.export_data(custom_group_data)
+
+    async def import_data(
+        self, cog_data: List[Tuple[str, Dict[str, Any]]], custom_group_data: Dict[str, int]
+    ) -> None:
+        try:
+            await self.driver.import_data(cog_data, custom_group_data)
+        finally:
+            self._invalidate(
+                IdentifierData(self.cog_name, self.unique_cog_identifier, "", (), (), 0)
+            )
+
+    @staticmethod
+    def _invalidate(identifier_data: IdentifierData) -> None:
+        if _cache is not None:
+            _cache.invalidate(identifier_data.to_tuple())
@@ -3,14 +3,16 @@ import json
 import logging
 import os
 import pickle
+import time
 import weakref
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 from uuid import uuid4
 
 from .. import data_manager, errors
-from .base import BaseDriver, IdentifierData, ConfigCategory
+from .base import BaseDriver, IdentifierData, ConfigCategory, _increment, _toggle
+from .views import freeze
 
 __all__ = ["JsonDriver"]
 
@@ -20,6 +22,15 @@ _driver_counts = {}
 _finalizers = []
 _locks = defaultdict(asyncio.Lock)
 
+# Write-behind state. Disabled unless ``write_delay`` is given in the storage details.
+_write_delay: Optional[float] = None
+_max_pending_writes: int = 0
+_dirty_paths: Dict[str, Path] = {}
+_pending_writes: Dict[str, int] = {}
+_flush_handles: Dict[str, asyncio.TimerHandle] = {}
+_flush_tasks: Set["asyncio.Task[None]"] = set()
+_flush_stats = {"flush_count": 0, "last_latency": 0.0, "max_latency": 0.0, "total_latency": 0.0}
+
 log = logging.getLogger("redbot.json_driver")
 
 
@@ -30,6 +41,11 @@ def finalize_driver(cog_name):
     _driver_counts[cog_name] -= 1
 
     if _driver_counts[cog_name] == 0:
+        if cog_name in _dirty_paths:
+            # Last driver for this cog is going away, we can't defer this write any longer.
+            _cancel_scheduled_flush(cog_name)
+            _save_json(_dirty_paths.pop(cog_name), _shared_datastore[cog_name])
+            _pending_writes.pop(cog_name, None)
         if cog_name in _shared_datastore:
             del _shared_datastore[cog_name]
         if cog_name in _locks:
@@ -52,6 +68,19 @@ class JsonDriver(BaseDriver):
     .. py:attribute:: data_path
 
         The path in which to store the file indicated by :py:attr:`file_name`.
+
+    By default, every change is written to disk (and fsynced) before the
+    call which made it returns. Write-behind mode can be enabled with these
+    storage details:
+
+    - ``write_delay`` - maximum number of seconds a change may stay in
+      memory before the cog's file is rewritten. All changes made to a cog
+      during that window are written together.
+    - ``max_pending_writes`` - number of pending changes for a single cog
+      after which its file is rewritten immediately. ``0`` (the default)
+      means no limit.
+
+    Pending changes are always flushed on :py:meth:`teardown`.
     """
 
     def __init__(
@@ -88,13 +117,36 @@ class JsonDriver(BaseDriver):
 
     @classmethod
     async def initialize(cls, **storage_details) -> None:
-        # No initializing to do
-        return
+        global _write_delay, _max_pending_writes
+        write_delay = storage_details.get("write_delay")
+        _write_delay = float(write_delay) if write_delay else None
+        _max_pending_writes = int(storage_details.get("max_pending_writes", 0))
 
     @classmethod
     async def teardown(cls) -> None:
-        # No tearing down to do
-        return
+        await cls.flush()
+        if _flush_tasks:
+            await asyncio.gather(*_flush_tasks, return_exceptions=True)
+
+    @classmethod
+    async def flush(cls) -> None:
+        """Write all pending changes to disk."""
+        for cog_name in list(_dirty_paths):
+            await _flush_cog(cog_name)
+
+    @staticmethod
+    def get_write_stats() -> Dict[str, Any]:
+        """Get metrics about writes deferred by write-behind mode.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary with the number of pending changes per cog
+            (``pending_writes``), and the count (``flush_count``) and
+            latencies in seconds (``last_latency``, ``max_latency``,
+            ``total_latency``) of the writes done so far.
+        """
+        return {"pending_writes": dict(_pending_writes), **_flush_stats}
 
     @staticmethod
     def get_config_details() -> Dict[str, Any]:
@@ -138,40 +190,98 @@ class JsonDriver(BaseDriver):
             partial = partial[i]
         return pickle.loads(pickle.dumps(partial, -1))
 
-    async def set(self, identifier_data: IdentifierData, value=None):
+    async def get_view(self, identifier_data: IdentifierData):
         partial = self.data
         full_identifiers = identifier_data.to_tuple()[1:]
+        for i in full_identifiers:
+            partial = partial[i]
+        return freeze(partial)
+
+    async def set(self, identifier_data: IdentifierData, value=None):
         # This is both our deepcopy() and our way of making sure this value is actually JSON
         # serializable.
         value_copy = json.loads(json.dumps(value))
 
         async with self._lock:
-            for i in full_identifiers[:-1]:
-                try:
-                    partial = partial.setdefault(i, {})
-                except AttributeError:
-                    # Tried to set sub-field of non-object
-                    raise errors.CannotSetSubfield
-
-            partial[full_identifiers[-1]] = value_copy
+            self._set_partial(identifier_data.to_tuple()[1:], value_copy)
             await self._save()
 
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        to_set = [
+            (identifier_data.to_tuple()[1:], json.loads(json.dumps(value)))
+            for identifier_data, value in items
+        ]
+        if not to_set:
+            return
+
+        async with self._lock:
+            try:
+                for full_identifiers, value_copy in to_set:
+                    self._set_partial(full_identifiers, value_copy)
+            finally:
+                await self._save()
+
     async def clear(self, identifier_data: IdentifierData):
-        partial = self.data
+        async with self._lock:
+            if self._clear_partial(identifier_data.to_tuple()[1:]):
+                await self._save()
+
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        async with self._lock:
+            changed = False
+            for identifier_data in identifiers:
+                changed |= self._clear_partial(identifier_data.to_tuple()[1:])
+            if changed:
+                await self._save()
+
+    async def inc(
+        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+    ) -> Union[int, float]:
+        return await self._update(
+            identifier_data, default, lambda current: _increment(current, value)
+        )
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        return await self._update(identifier_data, default, _toggle)
+
+    async def _update(
+        self, identifier_data: IdentifierData, default: Any, func: Callable[[Any], Any]
+    ) -> Any:
         full_identifiers = identifier_data.to_tuple()[1:]
+        async with self._lock:
+            partial = self.data
+            try:
+                for i in full_identifiers:
+                    partial = partial[i]
+            except (KeyError, TypeError):
+                partial = default
+            result = func(partial)
+            self._set_partial(full_identifiers, result)
+            await self._save()
+        return result
+
+    def _set_partial(self, full_identifiers: Tuple[str, ...], value: Any) -> None:
+        # Must be called while holding `self._lock`.
+        partial = self.data
+        for i in full_identifiers[:-1]:
+            try:
+                partial = partial.setdefault(i, {})
+            except AttributeError:
+                # Tried to set sub-field of non-object
+                raise errors.CannotSetSubfield
+
+        partial[full_identifiers[-1]] = value
+
+    def _clear_partial(self, full_identifiers: Tuple[str, ...]) -> bool:
+        # Must be called while holding `self._lock`.
+        partial = self.data
         try:
             for i in full_identifiers[:-1]:
                 partial = partial[i]
+            del partial[full_identifiers[-1]]
         except KeyError:
-            pass
-        else:
-            async with self._lock:
-                try:
-                    del partial[full_identifiers[-1]]
-                except KeyError:
-                    pass
-                else:
-                    await self._save()
+            return False
+        return True
 
     @classmethod
     async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
@@ -217,8 +327,69 @@ class JsonDriver(BaseDriver):
             await self._save()
 
     async def _save(self) -> None:
+        # Must be called while holding `self._lock`.
+        if _write_delay is None:
+            await _write_data(self.data_path, self.data)
+            return
+
+        cog_name = self.cog_name
+        _dirty_paths[cog_name] = self.data_path
+        _pending_writes[cog_name] = _pending_writes.get(cog_name, 0) + 1
+        if _max_pending_writes and _pending_writes[cog_name] >= _max_pending_writes:
+            _cancel_scheduled_flush(cog_name)
+            del _dirty_paths[cog_name]
+            del _pending_writes[cog_name]
+            await _write_data(self.data_path, self.data)
+        else:
+            _schedule_flush(cog_name)
+
+
+def _schedule_flush(cog_name: str) -> None:
+    if _write_delay is not None and cog_name not in _flush_handles:
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, _save_json, self.data_path, self.data)
+        _flush_handles[cog_name] = loop.call_later(_write_delay, _schedule_flush_task, cog_name)
+
+
+def _cancel_scheduled_flush(cog_name: str) -> None:
+    handle = _flush_handles.pop(cog_name, None)
+    if handle is not None:
+        handle.cancel()
+
+
+def _schedule_flush_task(cog_name: str) -> None:
+    _flush_handles.pop(cog_name, None)
+    task = asyncio.create_task(_flush_cog(cog_name))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def _flush_cog(cog_name: str) -> None:
+    _cancel_scheduled_flush(cog_name)
+    async with _locks[cog_name]:
+        path = _dirty_paths.pop(cog_name, None)
+        if path is None:
+            # Already flushed by someone else.
+            return
+        _pending_writes.pop(cog_name, None)
+        try:
+            await _write_data(path, _shared_datastore[cog_name])
+        except Exception:
+            # Keep the cog marked as dirty and retry the write after the same delay.
+            _dirty_paths.setdefault(cog_name, path)
+            log.exception("Failed to flush pending changes for cog %s", cog_name)
+            _schedule_flush(cog_name)
+
+
+async def _write_data(path: Path, data: Dict[str, Any]) -> None:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await loop.run_in_executor(None, _save_json, path, data)
+    latency = time.perf_counter() - start
+    _flush_stats["flush_count"] += 1
+    _flush_stats["last_latency"] = latency
+    _flush_stats["total_latency"] += latency
+    if latency > _flush_stats["max_latency"]:
+        _flush_stats["max_latency"] = latency
 
 
 def _save_json(path: Path, data: Dict[str, Any]) -> None:
@@ -2,7 +2,7 @@ import getpass
 import json
 import sys
 from pathlib import Path
-from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List
+from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List, Sequence
 
 try:
     # pylint: disable=import-error
@@ -158,14 +158,50 @@ class PostgresDriver(BaseDriver):
         except asyncpg.ErrorInAssignmentError:
             raise errors.CannotSetSubfield
 
+    async def get_many(
+        self, identifiers: Sequence[IdentifierData], default: Any = None
+    ) -> List[Any]:
+        if not identifiers:
+            return []
+        rows = await self._execute(
+            "SELECT red_config.get(($1::red_config.identifier_data[])[i])"
+            " FROM generate_series(1, cardinality($1::red_config.identifier_data[])) AS i"
+            " ORDER BY i",
+            [encode_identifier_data(identifier_data) for identifier_data in identifiers],
+            method=self._pool.fetch,
+        )
+        return [default if row[0] is None else json.loads(row[0]) for row in rows]
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        if not items:
+            return
+        try:
+            await self._execute_many(
+                "SELECT red_config.set($1, $2::jsonb)",
+                [
+                    (encode_identifier_data(identifier_data), json.dumps(value))
+                    for identifier_data, value in items
+                ],
+            )
+        except asyncpg.ErrorInAssignmentError:
+            raise errors.CannotSetSubfield
+
     async def clear(self, identifier_data: IdentifierData):
         await self._execute("SELECT red_config.clear($1)", encode_identifier_data(identifier_data))
 
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        if not identifiers:
+            return
+        await self._execute_many(
+            "SELECT red_config.clear($1)",
+            [(encode_identifier_data(identifier_data),) for identifier_data in identifiers],
+        )
+
     async def inc(
         self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
     ) -> Union[int, float]:
         try:
-            return await self._execute(
+            result = await self._execute(
                 f"SELECT red_config.inc($1, $2, $3)",
                 encode_identifier_data(identifier_data),
                 value,
@@ -174,11 +210,13 @@ class PostgresDriver(BaseDriver):
             )
         except asyncpg.WrongObjectTypeError as exc:
             raise errors.StoredTypeError(*exc.args)
+        # The result is a `decimal.Decimal`, keep the type JSON would have given us.
+        return int(result) if result.as_tuple().exponent >= 0 else float(result)
 
     async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
         try:
             return await self._execute(
-                "SELECT red_config.inc($1, $2)",
+                "SELECT red_config.toggle($1, $2)",
                 encode_identifier_data(identifier_data),
                 default,
                 method=self._pool.fetchval,
@@ -226,3 +264,11 @@ class PostgresDriver(BaseDriver):
         if args:
             log.invisible("Args: %s", args)
         return await method(query, *args)
+
+    @classmethod
+    async def _execute_many(cls, query: str, args: List[Tuple[Any, ...]]) -> None:
+        # asyncpg sends all of the statements in a single round-trip.
+        log.invisible("Query: %s", query)
+        log.invisible("Args: %s", args)
+        async with cls._pool.acquire() as conn, conn.transaction():
+            await conn.executemany(query, args)
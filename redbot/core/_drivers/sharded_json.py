@@ -0,0 +1,464 @@
+import asyncio
+import json
+import pickle
+import re
+import weakref
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .. import data_manager, errors
+from .base import BaseDriver, ConfigCategory, IdentifierData, _increment, _toggle
+from .json import _save_json
+from .log import log
+from .views import freeze
+
+__all__ = ["ShardedJsonDriver"]
+
+#: Name of the directory (in cog's data path) in which the shards are stored.
+SHARDS_DIR_NAME = "settings_shards"
+
+# (uuid, category, first primary key or None for categories without primary keys)
+_ShardId = Tuple[str, str, Optional[str]]
+
+_MISSING = object()
+_CATEGORY_NAME_RE = re.compile(r"[0-9A-Z_]+")
+
+_stores: Dict[str, "_CogStore"] = {}
+_driver_counts: Dict[str, int] = {}
+
+
+def _encode_name(name: str, *, is_category: bool = False) -> str:
+    # Keep the common cases (numeric IDs and built-in categories) readable, and hex-encode
+    # anything else, so that the names are always valid (and unambiguous) on every filesystem.
+    if name.isascii() and (
+        name.isdigit() if not is_category else _CATEGORY_NAME_RE.fullmatch(name) is not None
+    ):
+        return name
+    return "~" + name.encode("utf-8").hex()
+
+
+def _decode_name(name: str) -> str:
+    if name.startswith("~"):
+        return bytes.fromhex(name[1:]).decode("utf-8")
+    return name
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        with path.open("r", encoding="utf-8") as fs:
+            return json.load(fs)
+    except FileNotFoundError:
+        return _MISSING
+    except json.JSONDecodeError:
+        log.exception("Config shard %s is corrupted and will be ignored.", path)
+        return _MISSING
+
+
+def _read_category(category_path: Path) -> Tuple[Any, Dict[str, Any]]:
+    """Read the shard(s) of a category.
+
+    Returns the data of the category's single shard (if it has no primary keys),
+    and a dict mapping first primary keys to the data of their shards.
+    """
+    whole = _read_json(category_path.with_name(category_path.name + ".json"))
+    keyed = {}
+    if category_path.is_dir():
+        for entry in category_path.iterdir():
+            if entry.suffix != ".json":
+                continue
+            value = _read_json(entry)
+            if value is not _MISSING:
+                keyed[_decode_name(entry.stem)] = value
+    return whole, keyed
+
+
+def _read_uuid(uuid_path: Path) -> Dict[str, Tuple[Any, Dict[str, Any]]]:
+    ret = {}
+    if not uuid_path.is_dir():
+        return ret
+    names = set()
+    for entry in uuid_path.iterdir():
+        if entry.is_dir():
+            names.add(entry.name)
+        elif entry.suffix == ".json":
+            names.add(entry.stem)
+    for name in names:
+        ret[_decode_name(name)] = _read_category(uuid_path / name)
+    return ret
+
+
+def _write_shards(shards: List[Tuple[Path, Any]]) -> None:
+    for path, value in shards:
+        if value is _MISSING:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _save_json(path, value)
+
+
+class _CogStore:
+    """In-memory data of a single cog, shared by all of its drivers."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.data: Dict[str, Any] = {}
+        self.lock = asyncio.Lock()
+        # Scopes, i.e. `(uuid,)` or `(uuid, category)`, that have been fully loaded.
+        self.loaded_scopes: Set[Tuple[str, ...]] = set()
+        self.loaded_shards: Set[_ShardId] = set()
+        # Whether the category is split into one shard per first primary key.
+        self.keyed_categories: Dict[Tuple[str, str], bool] = {}
+
+    def shard_path(self, shard: _ShardId) -> Path:
+        uuid, category, key = shard
+        category_path = self.root / _encode_name(uuid) / _encode_name(category, is_category=True)
+        if key is None:
+            return category_path.with_name(category_path.name + ".json")
+        return category_path / f"{_encode_name(key)}.json"
+
+    def is_loaded(self, idents: Tuple[str, ...], shard_key: Optional[str]) -> bool:
+        if idents[:1] in self.loaded_scopes or idents[:2] in self.loaded_scopes:
+            return True
+        if len(idents) < 3:
+            return False
+        return shard_key is not None and (*idents[:2], shard_key) in self.loaded_shards
+
+    def merge_category(self, uuid: str, category: str, whole: Any, keyed: Dict[str, Any]):
+        if (uuid, category) in self.loaded_scopes:
+            return
+        if keyed:
+            self.keyed_categories[(uuid, category)] = True
+            category_data = self.data.setdefault(uuid, {}).setdefault(category, {})
+            for key, value in keyed.items():
+                if (uuid, category, key) not in self.loaded_shards:
+                    category_data[key] = value
+        elif whole is not _MISSING:
+            self.keyed_categories[(uuid, category)] = False
+            self.data.setdefault(uuid, {})[category] = whole
+        self.loaded_scopes.add((uuid, category))
+
+    def is_keyed(self, uuid: str, category: str) -> bool:
+        try:
+            return self.keyed_categories[(uuid, category)]
+        except KeyError:
+            pass
+        try:
+            return ConfigCategory.get_pkey_info(category, {})[0] > 0
+        except KeyError:
+            # Unknown custom group, these almost always have primary keys.
+            return isinstance(self.data.get(uuid, {}).get(category), dict)
+
+    def shards_in(self, idents: Tuple[str, ...]) -> Set[_ShardId]:
+        """Get IDs of all shards in the given (fully loaded) scope."""
+        uuid = idents[0]
+        uuid_data = self.data.get(uuid)
+        if not isinstance(uuid_data, dict):
+            return set()
+        categories = idents[1:2] or tuple(uuid_data)
+        ret = set()
+        for category in categories:
+            category_data = uuid_data.get(category, _MISSING)
+            if category_data is _MISSING:
+                continue
+            if self.is_keyed(uuid, category) and isinstance(category_data, dict):
+                ret.update((uuid, category, key) for key in category_data)
+            else:
+                ret.add((uuid, category, None))
+        return ret
+
+    def shard_value(self, shard: _ShardId) -> Any:
+        uuid, category, key = shard
+        value = self.data.get(uuid, {})
+        for ident in (category,) if key is None else (category, key):
+            if not isinstance(value, dict):
+                return _MISSING
+            value = value.get(ident, _MISSING)
+            if value is _MISSING:
+                break
+        return value
+
+
+def _finalize_driver(cog_name: str) -> None:
+    if cog_name not in _driver_counts:
+        return
+
+    _driver_counts[cog_name] -= 1
+
+    if _driver_counts[cog_name] == 0:
+        del _driver_counts[cog_name]
+        _stores.pop(cog_name, None)
+
+
+# noinspection PyProtectedMember
+class ShardedJsonDriver(BaseDriver):
+    """
+    Subclass of :py:class:`.BaseDriver`.
+
+    Stores each cog's data in many small JSON files instead of a single
+    ``settings.json``, one for each config category and first primary key,
+    e.g. ``GUILD/<guild_id>.json`` and ``MEMBER/<guild_id>.json``.
+    Categories without primary keys, such as ``GLOBAL``, are kept in
+    a single ``<category>.json`` file.
+
+    Shards are loaded lazily on first access and only the shards
+    which were changed are written back.
+
+    .. py:attribute:: data_path
+
+        The directory in which this cog's shards are stored.
+    """
+
+    def __init__(
+        self, cog_name: str, identifier: str, *, data_path_override: Optional[Path] = None
+    ):
+        super().__init__(cog_name, identifier)
+        if data_path_override is not None:
+            self.data_path = data_path_override
+        elif cog_name == "Core" and identifier == "0":
+            self.data_path = data_manager.core_data_path()
+        else:
+            self.data_path = data_manager.cog_data_path(raw_name=cog_name)
+        self.data_path = self.data_path / SHARDS_DIR_NAME
+        self.data_path.mkdir(parents=True, exist_ok=True)
+
+        if cog_name not in _stores:
+            _stores[cog_name] = _CogStore(self.data_path)
+        _driver_counts[cog_name] = _driver_counts.get(cog_name, 0) + 1
+        weakref.finalize(self, _finalize_driver, cog_name)
+
+    @property
+    def _store(self) -> _CogStore:
+        return _stores[self.cog_name]
+
+    @classmethod
+    async def initialize(cls, **storage_details) -> None:
+        # No initializing to do
+        return
+
+    @classmethod
+    async def teardown(cls) -> None:
+        # No tearing down to do, all writes are done synchronously
+        return
+
+    @staticmethod
+    def get_config_details() -> Dict[str, Any]:
+        # No driver-specific configuration needed
+        return {}
+
+    async def _ensure_loaded(self, identifier_data: IdentifierData) -> Tuple[str, ...]:
+        store = self._store
+        idents = identifier_data.to_tuple()[1:]
+        shard_key = identifier_data.primary_key[0] if identifier_data.primary_key else None
+        if len(idents) >= 2:
+            store.keyed_categories.setdefault(idents[:2], identifier_data.primary_key_len > 0)
+
+        if store.is_loaded(idents, shard_key):
+            return idents
+
+        async with store.lock:
+            if store.is_loaded(idents, shard_key):
+                return idents
+            loop = asyncio.get_running_loop()
+            uuid = idents[0]
+            uuid_path = store.root / _encode_name(uuid)
+            if len(idents) == 1:
+                categories = await loop.run_in_executor(None, _read_uuid, uuid_path)
+                for category, (whole, keyed) in categories.items():
+                    store.merge_category(uuid, category, whole, keyed)
+                store.loaded_scopes.add((uuid,))
+            elif len(idents) == 2 or shard_key is None:
+                category = idents[1]
+                category_path = uuid_path / _encode_name(category, is_category=True)
+                whole, keyed = await loop.run_in_executor(None, _read_category, category_path)
+                store.merge_category(uuid, category, whole, keyed)
+            else:
+                shard = (uuid, idents[1], shard_key)
+                value = await loop.run_in_executor(None, _read_json, store.shard_path(shard))
+                if value is not _MISSING:
+                    store.data.setdefault(uuid, {}).setdefault(idents[1], {})[shard_key] = value
+                store.loaded_shards.add(shard)
+        return idents
+
+    def _affected_shards(
+        self, identifier_data: IdentifierData, idents: Tuple[str, ...]
+    ) -> Set[_ShardId]:
+        if len(idents) >= 3 or (len(idents) == 2 and not identifier_data.primary_key_len):
+            if identifier_data.primary_key:
+                return {(idents[0], idents[1], identifier_data.primary_key[0])}
+            return {(idents[0], idents[1], None)}
+        return self._store.shards_in(idents)
+
+    async def _save(self, shards: Iterable[_ShardId]) -> None:
+        # Must be called while holding the store's lock.
+        store = self._store
+        to_write = [(store.shard_path(shard), store.shard_value(shard)) for shard in shards]
+        if not to_write:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write_shards, to_write)
+
+    def _get_partial(self, idents: Tuple[str, ...]) -> Any:
+        partial = self._store.data
+        for i in idents:
+            partial = partial[i]
+        return partial
+
+    async def get(self, identifier_data: IdentifierData):
+        idents = await self._ensure_loaded(identifier_data)
+        return pickle.loads(pickle.dumps(self._get_partial(idents), -1))
+
+    async def get_view(self, identifier_data: IdentifierData):
+        idents = await self._ensure_loaded(identifier_data)
+        return freeze(self._get_partial(idents))
+
+    async def set(self, identifier_data: IdentifierData, value=None):
+        await self.set_many([(identifier_data, value)])
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        to_set = []
+        for identifier_data, value in items:
+            idents = await self._ensure_loaded(identifier_data)
+            # This is both our deepcopy() and our way of making sure this value is actually
+            # JSON serializable.
+            to_set.append((identifier_data, idents, json.loads(json.dumps(value))))
+        if not to_set:
+            return
+
+        store = self._store
+        async with store.lock:
+            shards = set()
+            try:
+                for identifier_data, idents, value_copy in to_set:
+                    shards |= self._affected_shards(identifier_data, idents)
+                    partial = store.data
+                    for i in idents[:-1]:
+                        try:
+                            partial = partial.setdefault(i, {})
+                        except AttributeError:
+                            # Tried to set sub-field of non-object
+                            raise errors.CannotSetSubfield
+
+                    partial[idents[-1]] = value_copy
+                    shards |= self._affected_shards(identifier_data, idents)
+            finally:
+                await self._save(shards)
+
+    async def inc(
+        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+    ) -> Union[int, float]:
+        return await self._update(
+            identifier_data, default, lambda current: _increment(current, value)
+        )
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        return await self._update(identifier_data, default, _toggle)
+
+    async def _update(
+        self, identifier_data: IdentifierData, default: Any, func: Callable[[Any], Any]
+    ) -> Any:
+        idents = await self._ensure_loaded(identifier_data)
+        store = self._store
+        async with store.lock:
+            try:
+                current = self._get_partial(idents)
+            except (KeyError, TypeError):
+                current = default
+            result = func(current)
+            shards = self._affected_shards(identifier_data, idents)
+            partial = store.data
+            for i in idents[:-1]:
+                try:
+                    partial = partial.setdefault(i, {})
+                except AttributeError:
+                    # Tried to set sub-field of non-object
+                    raise errors.CannotSetSubfield
+            partial[idents[-1]] = result
+            shards |= self._affected_shards(identifier_data, idents)
+            await self._save(shards)
+        return result
+
+    async def clear(self, identifier_data: IdentifierData):
+        await self.clear_many([identifier_data])
+
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        to_clear = [
+            (identifier_data, await self._ensure_loaded(identifier_data))
+            for identifier_data in identifiers
+        ]
+        store = self._store
+        async with store.lock:
+            shards = set()
+            for identifier_data, idents in to_clear:
+                affected = self._affected_shards(identifier_data, idents)
+                try:
+                    partial = self._get_partial(idents[:-1])
+                    del partial[idents[-1]]
+                except (KeyError, TypeError):
+                    continue
+                shards |= affected
+            await self._save(shards)
+
+    @classmethod
+    async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
+        yield "Core", "0"
+        for _dir in data_manager.cog_data_path().iterdir():
+            shards_path = _dir / SHARDS_DIR_NAME
+            if not shards_path.is_dir():
+                continue
+            for uuid_path in shards_path.iterdir():
+                if uuid_path.is_dir() and any(uuid_path.iterdir()):
+                    yield _dir.stem, _decode_name(uuid_path.name)
+
+    async def import_data(self, cog_data, custom_group_data):
+        store = self._store
+        for category, _all_data in cog_data:
+            # Make sure that shards which already exist on disk don't get overwritten
+            # with just the imported part of their data.
+            await self._ensure_loaded(
+                IdentifierData(
+                    self.cog_name,
+                    self.unique_cog_identifier,
+                    category,
+                    (),
+                    (),
+                    *ConfigCategory.get_pkey_info(category, custom_group_data),
+                )
+            )
+
+        shards = set()
+        async with store.lock:
+            for category, all_data in cog_data:
+                pkey_len, is_custom = ConfigCategory.get_pkey_info(category, custom_group_data)
+                splitted_pkey = self._split_primary_key(category, custom_group_data, all_data)
+                for pkey, data in splitted_pkey:
+                    ident_data = IdentifierData(
+                        self.cog_name,
+                        self.unique_cog_identifier,
+                        category,
+                        pkey,
+                        (),
+                        pkey_len,
+                        is_custom,
+                    )
+                    idents = ident_data.to_tuple()[1:]
+                    partial = store.data
+                    for ident in idents[:-1]:
+                        partial = partial.setdefault(ident, {})
+                    partial[idents[-1]] = data
+                    shards.add((idents[0], idents[1], pkey[0] if pkey else None))
+            await self._save(shards)
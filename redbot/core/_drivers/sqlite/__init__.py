@@ -0,0 +1,3 @@
+from .sqlite import SqliteDriver
+
+__all__ = ["SqliteDriver"]
@@ -0,0 +1,27 @@
+/*
+ ********************************************************
+ * SQLite driver Data Definition Language (DDL) Script. *
+ ********************************************************
+ */
+
+CREATE TABLE IF NOT EXISTS red_cogs (
+  cog_name TEXT NOT NULL,
+  cog_id TEXT NOT NULL,
+  PRIMARY KEY (cog_name, cog_id)
+) WITHOUT ROWID;
+
+/*
+ * One row per document, i.e. per full primary key of a category.
+ *
+ * `pkeys` is the full primary key encoded as a compact JSON array, e.g. '["1234","5678"]',
+ * so that all documents for a partial primary key can be found with a range scan on the
+ * primary key index. Categories without primary keys (such as GLOBAL) use '[]'.
+ */
+CREATE TABLE IF NOT EXISTS red_config (
+  cog_name TEXT NOT NULL,
+  cog_id TEXT NOT NULL,
+  category TEXT NOT NULL,
+  pkeys TEXT NOT NULL,
+  json_data TEXT NOT NULL,
+  PRIMARY KEY (cog_name, cog_id, category, pkeys)
+) WITHOUT ROWID;
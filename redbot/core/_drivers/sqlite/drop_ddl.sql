@@ -0,0 +1,2 @@
+DROP TABLE IF EXISTS red_config;
+DROP TABLE IF EXISTS red_cogs;
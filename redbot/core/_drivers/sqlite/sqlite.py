@@ -0,0 +1,475 @@
+import asyncio
+import concurrent.futures
+import json
+import sqlite3
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ... import data_manager, errors
+from ..base import BaseDriver, ConfigCategory, IdentifierData, _increment, _toggle
+from ..log import log
+
+__all__ = ["SqliteDriver"]
+
+_PKG_PATH = Path(__file__).parent
+DDL_SCRIPT_PATH = _PKG_PATH / "ddl.sql"
+DROP_DDL_SCRIPT_PATH = _PKG_PATH / "drop_ddl.sql"
+DEFAULT_DB_FILE_NAME = "settings.sqlite3"
+
+_T = TypeVar("_T")
+_Job = Callable[[sqlite3.Connection], Any]
+
+
+def _encode_pkeys(pkeys: Tuple[str, ...]) -> str:
+    return json.dumps(list(pkeys), separators=(",", ":"))
+
+
+def _pkey_range(pkeys: Tuple[str, ...]) -> Tuple[str, str]:
+    """Get the range of encoded full primary keys which start with the given ones."""
+    lower = _encode_pkeys(pkeys)[:-1]
+    if pkeys:
+        lower += ","
+    upper = lower[:-1] + chr(ord(lower[-1]) + 1)
+    return lower, upper
+
+
+def _where_clause(id_data: IdentifierData, *, full: bool) -> Tuple[str, List[Any]]:
+    clause = "cog_name = ? AND cog_id = ? AND category = ?"
+    params: List[Any] = [id_data.cog_name, id_data.uuid, id_data.category]
+    if full:
+        clause += " AND pkeys = ?"
+        params.append(_encode_pkeys(id_data.primary_key))
+    elif id_data.primary_key:
+        clause += " AND pkeys >= ? AND pkeys < ?"
+        params.extend(_pkey_range(id_data.primary_key))
+    return clause, params
+
+
+def _is_full(id_data: IdentifierData) -> bool:
+    return len(id_data.primary_key) >= id_data.primary_key_len
+
+
+def _assemble(rows: List[Tuple[str, str]], skip: int) -> Dict[str, Any]:
+    """Build a nested dict from (encoded pkeys, json_data) rows."""
+    ret: Dict[str, Any] = {}
+    for pkeys, json_data in rows:
+        keys = json.loads(pkeys)[skip:]
+        partial = ret
+        for key in keys[:-1]:
+            partial = partial.setdefault(key, {})
+        partial[keys[-1]] = json.loads(json_data)
+    return ret
+
+
+def _get(conn: sqlite3.Connection, id_data: IdentifierData) -> Any:
+    if not id_data.category:
+        rows = conn.execute(
+            "SELECT category, pkeys, json_data FROM red_config WHERE cog_name = ? AND cog_id = ?",
+            (id_data.cog_name, id_data.uuid),
+        ).fetchall()
+        if not rows:
+            raise KeyError
+        ret = {}
+        by_category: Dict[str, List[Tuple[str, str]]] = {}
+        for category, pkeys, json_data in rows:
+            if pkeys == "[]":
+                ret[category] = json.loads(json_data)
+            else:
+                by_category.setdefault(category, []).append((pkeys, json_data))
+        for category, category_rows in by_category.items():
+            ret[category] = _assemble(category_rows, 0)
+        return ret
+
+    if not _is_full(id_data):
+        clause, params = _where_clause(id_data, full=False)
+        rows = conn.execute(f"SELECT pkeys, json_data FROM red_config WHERE {clause}", params)
+        ret = _assemble(rows.fetchall(), len(id_data.primary_key))
+        if not ret:
+            raise KeyError
+        return ret
+
+    clause, params = _where_clause(id_data, full=True)
+    row = conn.execute(f"SELECT json_data FROM red_config WHERE {clause}", params).fetchone()
+    if row is None:
+        raise KeyError
+    partial = json.loads(row[0])
+    for ident in id_data.identifiers:
+        if not isinstance(partial, dict):
+            raise KeyError(ident)
+        partial = partial[ident]
+    return partial
+
+
+def _register_cog(conn: sqlite3.Connection, id_data: IdentifierData) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO red_cogs (cog_name, cog_id) VALUES (?, ?)",
+        (id_data.cog_name, id_data.uuid),
+    )
+
+
+def _flatten(value: Any, depth: int, parent: Tuple[str, ...] = ()):
+    if depth == 0:
+        yield parent, value
+        return
+    if not isinstance(value, dict):
+        raise errors.CannotSetSubfield
+    for key, inner in value.items():
+        yield from _flatten(inner, depth - 1, parent + (key,))
+
+
+def _set(conn: sqlite3.Connection, id_data: IdentifierData, value_json: str) -> None:
+    _register_cog(conn, id_data)
+    insert = (
+        "INSERT OR REPLACE INTO red_config (cog_name, cog_id, category, pkeys, json_data)"
+        " VALUES (?, ?, ?, ?, ?)"
+    )
+    if not _is_full(id_data):
+        clause, params = _where_clause(id_data, full=False)
+        conn.execute(f"DELETE FROM red_config WHERE {clause}", params)
+        num_missing = id_data.primary_key_len - len(id_data.primary_key)
+        conn.executemany(
+            insert,
+            (
+                (
+                    id_data.cog_name,
+                    id_data.uuid,
+                    id_data.category,
+                    _encode_pkeys(id_data.primary_key + pkeys),
+                    json.dumps(document),
+                )
+                for pkeys, document in _flatten(json.loads(value_json), num_missing)
+            ),
+        )
+        return
+
+    if id_data.identifiers:
+        clause, params = _where_clause(id_data, full=True)
+        row = conn.execute(f"SELECT json_data FROM red_config WHERE {clause}", params).fetchone()
+        document = {} if row is None else json.loads(row[0])
+        partial = document
+        for ident in id_data.identifiers[:-1]:
+            if not isinstance(partial, dict):
+                raise errors.CannotSetSubfield
+            partial = partial.setdefault(ident, {})
+        if not isinstance(partial, dict):
+            raise errors.CannotSetSubfield
+        partial[id_data.identifiers[-1]] = json.loads(value_json)
+        value_json = json.dumps(document)
+
+    conn.execute(
+        insert,
+        (
+            id_data.cog_name,
+            id_data.uuid,
+            id_data.category,
+            _encode_pkeys(id_data.primary_key),
+            value_json,
+        ),
+    )
+
+
+def _clear(conn: sqlite3.Connection, id_data: IdentifierData) -> None:
+    if not id_data.category:
+        params = (id_data.cog_name, id_data.uuid)
+        conn.execute("DELETE FROM red_config WHERE cog_name = ? AND cog_id = ?", params)
+        conn.execute("DELETE FROM red_cogs WHERE cog_name = ? AND cog_id = ?", params)
+        return
+
+    if not id_data.identifiers:
+        clause, params = _where_clause(id_data, full=_is_full(id_data))
+        conn.execute(f"DELETE FROM red_config WHERE {clause}", params)
+        return
+
+    clause, params = _where_clause(id_data, full=True)
+    row = conn.execute(f"SELECT json_data FROM red_config WHERE {clause}", params).fetchone()
+    if row is None:
+        return
+    document = json.loads(row[0])
+    partial = document
+    for ident in id_data.identifiers[:-1]:
+        if not isinstance(partial, dict) or ident not in partial:
+            return
+        partial = partial[ident]
+    if not isinstance(partial, dict) or id_data.identifiers[-1] not in partial:
+        return
+    del partial[id_data.identifiers[-1]]
+    conn.execute(
+        f"UPDATE red_config SET json_data = ? WHERE {clause}", [json.dumps(document)] + params
+    )
+
+
+def _update(
+    conn: sqlite3.Connection, id_data: IdentifierData, default: Any, func: Callable[[Any], Any]
+) -> Any:
+    try:
+        current = _get(conn, id_data)
+    except KeyError:
+        current = default
+    result = func(current)
+    _set(conn, id_data, json.dumps(result))
+    return result
+
+
+def _run_batch(conn: sqlite3.Connection, jobs: List[_Job]) -> List[Tuple[bool, Any]]:
+    """Run the given write jobs in a single transaction.
+
+    Each job runs in its own savepoint, so that one failing job doesn't affect the others.
+    """
+    results = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for job in jobs:
+            conn.execute("SAVEPOINT job")
+            try:
+                result = job(conn)
+            except Exception as exc:
+                conn.execute("ROLLBACK TO job")
+                results.append((False, exc))
+            else:
+                results.append((True, result))
+            conn.execute("RELEASE job")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return results
+
+
+class SqliteDriver(BaseDriver):
+    """
+    Subclass of :py:class:`.BaseDriver`.
+
+    Stores all data in a single SQLite database (in WAL mode), with one row
+    per document, i.e. per full primary key of a config category.
+
+    All database calls are made from a dedicated thread. Writes which are
+    issued at the same time are committed together in a single transaction.
+
+    The database file can be changed with the ``path`` storage detail,
+    and defaults to ``settings.sqlite3`` in the core data path.
+    """
+
+    _conn: Optional[sqlite3.Connection] = None
+    _path: Optional[Path] = None
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _pending_writes: List[Tuple[_Job, "asyncio.Future[Any]"]] = []
+
+    @classmethod
+    async def initialize(cls, **storage_details) -> None:
+        path = storage_details.get("path")
+        if path is None:
+            path = data_manager.core_data_path() / DEFAULT_DB_FILE_NAME
+        cls._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="red-sqlite-driver"
+        )
+        cls._pending_writes = []
+        cls._path = Path(path)
+        cls._conn = await cls._run(lambda _conn: cls._connect(cls._path))
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed manually, see `_run_batch()`.
+        conn = sqlite3.connect(str(path), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with DDL_SCRIPT_PATH.open() as fs:
+            conn.executescript(fs.read())
+        return conn
+
+    @classmethod
+    async def teardown(cls) -> None:
+        if cls._executor is None:
+            return
+        if cls._pending_writes:
+            await asyncio.gather(*(f for _j, f in cls._pending_writes), return_exceptions=True)
+        if cls._conn is not None:
+            await cls._run(lambda conn: conn.close())
+            cls._conn = None
+        cls._path = None
+        cls._executor.shutdown(wait=True)
+        cls._executor = None
+
+    @classmethod
+    def get_database_path(cls) -> Optional[Path]:
+        """Get the path to the database file, or ``None`` if the driver isn't initialized."""
+        return cls._path
+
+    @classmethod
+    async def backup(cls, destination: Path) -> None:
+        """Write a consistent copy of the database to the given file.
+
+        The database file itself can't be copied safely while it's open,
+        since the recent writes may only be in its write-ahead log.
+        """
+        if cls._pending_writes:
+            await asyncio.gather(*(f for _j, f in cls._pending_writes), return_exceptions=True)
+
+        def _backup(conn: sqlite3.Connection) -> None:
+            dest_conn = sqlite3.connect(str(destination))
+            try:
+                conn.backup(dest_conn)
+            finally:
+                dest_conn.close()
+
+        await cls._run(_backup)
+
+    @staticmethod
+    def get_config_details() -> Dict[str, Any]:
+        # No driver-specific configuration needed
+        return {}
+
+    @classmethod
+    async def _run(cls, func: Callable[[sqlite3.Connection], _T]) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._executor, lambda: func(cls._conn))
+
+    @classmethod
+    async def _write(cls, job: _Job) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        cls._pending_writes.append((job, future))
+        if len(cls._pending_writes) == 1:
+            # Give other tasks a chance to queue their writes so they can share the transaction.
+            loop.call_soon(cls._flush_writes)
+        return await future
+
+    @classmethod
+    def _flush_writes(cls) -> None:
+        batch, cls._pending_writes = cls._pending_writes, []
+        log.invisible("Committing %s writes", len(batch))
+        task = asyncio.ensure_future(
+            cls._run(lambda conn: _run_batch(conn, [j for j, _ in batch]))
+        )
+
+        def _set_results(fut: "asyncio.Future[List[Tuple[bool, Any]]]") -> None:
+            exc = asyncio.CancelledError() if fut.cancelled() else fut.exception()
+            for idx, (_job, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if exc is not None:
+                    future.set_exception(exc)
+                    continue
+                success, result = fut.result()[idx]
+                if success:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+
+        task.add_done_callback(_set_results)
+
+    async def get(self, identifier_data: IdentifierData):
+        return await self._run(lambda conn: _get(conn, identifier_data))
+
+    async def get_many(
+        self, identifiers: Sequence[IdentifierData], default: Any = None
+    ) -> List[Any]:
+        def _get_many(conn: sqlite3.Connection) -> List[Any]:
+            ret = []
+            for identifier_data in identifiers:
+                try:
+                    ret.append(_get(conn, identifier_data))
+                except KeyError:
+                    ret.append(default)
+            return ret
+
+        return await self._run(_get_many)
+
+    async def set(self, identifier_data: IdentifierData, value=None):
+        value_json = json.dumps(value)
+        await self._write(lambda conn: _set(conn, identifier_data, value_json))
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        to_set = [(identifier_data, json.dumps(value)) for identifier_data, value in items]
+
+        def _set_many(conn: sqlite3.Connection) -> None:
+            for identifier_data, value_json in to_set:
+                _set(conn, identifier_data, value_json)
+
+        await self._write(_set_many)
+
+    async def clear(self, identifier_data: IdentifierData):
+        await self._write(lambda conn: _clear(conn, identifier_data))
+
+    async def clear_many(self, identifiers: Sequence[IdentifierData]) -> None:
+        def _clear_many(conn: sqlite3.Connection) -> None:
+            for identifier_data in identifiers:
+                _clear(conn, identifier_data)
+
+        await self._write(_clear_many)
+
+    async def inc(
+        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+    ) -> Union[int, float]:
+        # Runs inside of the write transaction, so the read can't be interleaved with other writes.
+        return await self._write(
+            lambda conn: _update(
+                conn, identifier_data, default, lambda current: _increment(current, value)
+            )
+        )
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        return await self._write(lambda conn: _update(conn, identifier_data, default, _toggle))
+
+    @classmethod
+    async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
+        rows = await cls._run(
+            lambda conn: conn.execute("SELECT cog_name, cog_id FROM red_cogs").fetchall()
+        )
+        for cog_name, cog_id in rows:
+            yield cog_name, cog_id
+
+    @classmethod
+    async def delete_all_data(cls, *, drop_db: Optional[bool] = None, **kwargs) -> None:
+        """Delete all data being stored by this driver.
+
+        The tables which store bot data will be dropped.
+
+        Parameters
+        ----------
+        drop_db : Optional[bool]
+            If set to ``True``, function will print information
+            about not being able to delete the database file itself.
+
+        """
+        if drop_db is True:
+            print(
+                "Deleting the database file is not possible in SQLite driver."
+                " We will delete all of Red's data within this database,"
+                " without deleting the file itself."
+            )
+        with DROP_DDL_SCRIPT_PATH.open() as fs:
+            script = fs.read()
+        await cls._run(lambda conn: conn.executescript(script))
+
+    async def import_data(self, cog_data, custom_group_data):
+        jobs = []
+        for category, all_data in cog_data:
+            splitted_pkey = self._split_primary_key(category, custom_group_data, all_data)
+            for pkey, data in splitted_pkey:
+                ident_data = IdentifierData(
+                    self.cog_name,
+                    self.unique_cog_identifier,
+                    category,
+                    pkey,
+                    (),
+                    *ConfigCategory.get_pkey_info(category, custom_group_data),
+                )
+                jobs.append((ident_data, json.dumps(data)))
+
+        def _import(conn: sqlite3.Connection) -> None:
+            for ident_data, value_json in jobs:
+                _set(conn, ident_data, value_json)
+
+        await self._write(_import)
@@ -0,0 +1,274 @@
+"""Read-only and copy-on-write views over stored config data.
+
+These let drivers hand out their in-memory data without deep copying it
+on every read. A read-only view can be layered over a dict of defaults,
+in which case it behaves as if the stored data was merged into them,
+the same way `Group.nested_update() <redbot.core.config.Group.nested_update>`
+does it.
+"""
+import collections.abc
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set
+
+__all__ = ("ReadOnlyDict", "ReadOnlyList", "CopyOnWriteDict", "CopyOnWriteList", "freeze")
+
+
+def freeze(value: Any) -> Any:
+    """Wrap the given value in a read-only view if it's mutable JSON data."""
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList, CopyOnWriteDict, CopyOnWriteList)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {k: _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_builtin(v) for v in value]
+    return value
+
+
+def _is_sequence(value: Any) -> bool:
+    return isinstance(value, collections.abc.Sequence) and not isinstance(value, (str, bytes))
+
+
+class ReadOnlyDict(collections.abc.Mapping):
+    """A read-only view of a dict, optionally layered over defaults.
+
+    Nested dicts and lists are wrapped in read-only views on access. The
+    view reflects later changes made to the underlying data.
+
+    When ``nested`` is ``False``, nested dicts are not merged with the
+    defaults, i.e. the view behaves like ``defaults.update(data)``.
+    """
+
+    __slots__ = ("_data", "_defaults", "_nested")
+
+    def __init__(
+        self,
+        data: Mapping[str, Any],
+        defaults: Optional[Dict[str, Any]] = None,
+        *,
+        nested: bool = True,
+    ):
+        if isinstance(data, ReadOnlyDict) and data._defaults is None:
+            data = data._data
+        self._data = data
+        self._defaults = defaults or None
+        self._nested = nested
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            if self._defaults is None:
+                raise
+            return freeze(self._defaults[key])
+
+        if isinstance(value, dict):
+            if self._defaults is None or not self._nested:
+                return ReadOnlyDict(value)
+            default = self._defaults.get(key)
+            return ReadOnlyDict(value, default if isinstance(default, dict) else None)
+        return freeze(value)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        if self._defaults is not None:
+            for key in self._defaults:
+                if key not in self._data:
+                    yield key
+
+    def __len__(self) -> int:
+        if self._defaults is None:
+            return len(self._data)
+        return len(self._data) + sum(1 for key in self._defaults if key not in self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data or (self._defaults is not None and key in self._defaults)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.copy()!r}>"
+
+    def copy(self) -> Dict[str, Any]:
+        """Get a mutable deep copy of this view made of builtin types."""
+        return {key: _to_builtin(value) for key, value in self.items()}
+
+
+class ReadOnlyList(collections.abc.Sequence):
+    """A read-only view of a list.
+
+    Nested dicts and lists are wrapped in read-only views on access.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Sequence[Any]):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(self._data[index])
+        return freeze(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if not _is_sequence(other):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.copy()!r}>"
+
+    def copy(self) -> List[Any]:
+        """Get a mutable deep copy of this view made of builtin types."""
+        return [_to_builtin(value) for value in self]
+
+
+def _cow_wrap(value: Any) -> Any:
+    if isinstance(value, collections.abc.Mapping):
+        return CopyOnWriteDict(value)
+    if _is_sequence(value):
+        return CopyOnWriteList(value)
+    return value
+
+
+class CopyOnWriteDict(collections.abc.MutableMapping):
+    """A mutable wrapper over a mapping which is never modified itself.
+
+    Only the levels of the data which get mutated are (shallowly) copied,
+    on the first mutation. Nested containers are wrapped on access.
+    """
+
+    __slots__ = ("_source", "_copy", "_children", "_assigned")
+
+    def __init__(self, source: Mapping[str, Any]):
+        self._source = source
+        self._copy: Optional[Dict[str, Any]] = None
+        self._children: Dict[str, Any] = {}
+        self._assigned: Set[str] = set()
+
+    @property
+    def _target(self) -> Mapping[str, Any]:
+        return self._source if self._copy is None else self._copy
+
+    def _materialize(self) -> Dict[str, Any]:
+        if self._copy is None:
+            self._copy = dict(self._source.items())
+        return self._copy
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._children[key]
+        except KeyError:
+            pass
+        value = self._target[key]
+        if key in self._assigned:
+            return value
+        wrapped = _cow_wrap(value)
+        if wrapped is not value:
+            self._children[key] = wrapped
+        return wrapped
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._materialize()[key] = value
+        self._children.pop(key, None)
+        self._assigned.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._materialize()[key]
+        self._children.pop(key, None)
+        self._assigned.discard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._target)
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._target
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.copy()!r}>"
+
+    def copy(self) -> Dict[str, Any]:
+        """Get a mutable deep copy of the current data made of builtin types."""
+        return {key: _to_builtin(self[key]) for key in self}
+
+
+class CopyOnWriteList(collections.abc.MutableSequence):
+    """A mutable wrapper over a sequence which is never modified itself.
+
+    The list is (shallowly) copied on the first mutation. Nested containers
+    are wrapped on access.
+    """
+
+    __slots__ = ("_source", "_copy", "_children")
+
+    def __init__(self, source: Sequence[Any]):
+        self._source = source
+        self._copy: Optional[List[Any]] = None
+        self._children: Dict[int, Any] = {}
+
+    def _materialize(self) -> List[Any]:
+        if self._copy is None:
+            # Indices will shift from now on, so every nested container which came
+            # from the source is wrapped up-front. Anything else that ends up in
+            # the copy is owned by the caller.
+            self._copy = [
+                self._children[idx] if idx in self._children else _cow_wrap(value)
+                for idx, value in enumerate(self._source)
+            ]
+            self._children.clear()
+        return self._copy
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(len(self))[index]]
+        if self._copy is not None:
+            return self._copy[index]
+        if index < 0:
+            index += len(self._source)
+        try:
+            return self._children[index]
+        except KeyError:
+            pass
+        value = self._source[index]
+        wrapped = _cow_wrap(value)
+        if wrapped is not value:
+            self._children[index] = wrapped
+        return wrapped
+
+    def __setitem__(self, index, value) -> None:
+        self._materialize()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._source if self._copy is None else self._copy)
+
+    def insert(self, index: int, value: Any) -> None:
+        self._materialize().insert(index, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not _is_sequence(other):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.copy()!r}>"
+
+    def copy(self) -> List[Any]:
+        """Get a mutable deep copy of the current data made of builtin types."""
+        return [_to_builtin(value) for value in self]
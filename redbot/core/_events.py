@@ -526,6 +526,20 @@ def init_events(bot, cli_flags):
             if command_obj is not None:
                 command_obj.enable_in(guild)
 
+    # The resolved permission rules depend on the order of the roles.
+    @bot.event
+    async def on_guild_role_create(role: discord.Role):
+        commands.Requires.invalidate_rule_caches(role.guild.id)
+
+    @bot.event
+    async def on_guild_role_delete(role: discord.Role):
+        commands.Requires.invalidate_rule_caches(role.guild.id)
+
+    @bot.event
+    async def on_guild_role_update(before: discord.Role, after: discord.Role):
+        if before.position != after.position:
+            commands.Requires.invalidate_rule_caches(after.guild.id)
+
     @bot.event
     async def on_cog_add(cog: commands.Cog):
         confs = get_latest_confs()
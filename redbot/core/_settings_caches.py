@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union, Set, Iterable, Tuple, overload
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    Set,
+    Iterable,
+    Tuple,
+    overload,
+)
 import asyncio
 from argparse import Namespace
 from collections import defaultdict
@@ -228,17 +239,188 @@ class IgnoreManager:
             await self._config.guild_from_id(gid).ignored.clear()
 
 
+class EmbedSettingsCache:
+    """Cache of the embed settings used by `Red.embed_requested()`.
+
+    Each level of the setting hierarchy (channel, command in guild, guild, user,
+    global command, global) is cached separately, so that changing one
+    setting only needs to update its own entry.
+    """
+
+    def __init__(self, config: Config):
+        self._config: Config = config
+        self._cached_global: Optional[bool] = None
+        self._cached_guilds: Dict[int, Optional[bool]] = {}
+        self._cached_channels: Dict[int, Optional[bool]] = {}
+        self._cached_users: Dict[int, Optional[bool]] = {}
+        # (command's qualified name, guild ID or 0 for global scope)
+        self._cached_commands: Dict[Tuple[str, int], Optional[bool]] = {}
+
+    async def get_global(self) -> bool:
+        if self._cached_global is None:
+            self._cached_global = await self._config.embeds()
+        return self._cached_global
+
+    async def set_global(self, enabled: Optional[bool]) -> None:
+        if enabled is None:
+            await self._config.embeds.clear()
+        else:
+            await self._config.embeds.set(enabled)
+        # The registered default is used when cleared, let the next get fetch it.
+        self._cached_global = enabled
+
+    async def get_guild(self, guild_id: int) -> Optional[bool]:
+        try:
+            return self._cached_guilds[guild_id]
+        except KeyError:
+            ret = self._cached_guilds[guild_id] = await self._config.guild_from_id(
+                guild_id
+            ).embeds()
+            return ret
+
+    async def set_guild(self, guild_id: int, enabled: Optional[bool]) -> None:
+        self._cached_guilds[guild_id] = enabled
+        if enabled is None:
+            await self._config.guild_from_id(guild_id).embeds.clear()
+        else:
+            await self._config.guild_from_id(guild_id).embeds.set(enabled)
+
+    async def get_channel(self, channel_id: int) -> Optional[bool]:
+        try:
+            return self._cached_channels[channel_id]
+        except KeyError:
+            ret = self._cached_channels[channel_id] = await self._config.channel_from_id(
+                channel_id
+            ).embeds()
+            return ret
+
+    async def set_channel(self, channel_id: int, enabled: Optional[bool]) -> None:
+        self._cached_channels[channel_id] = enabled
+        if enabled is None:
+            await self._config.channel_from_id(channel_id).embeds.clear()
+        else:
+            await self._config.channel_from_id(channel_id).embeds.set(enabled)
+
+    async def get_user(self, user_id: int) -> Optional[bool]:
+        try:
+            return self._cached_users[user_id]
+        except KeyError:
+            ret = self._cached_users[user_id] = await self._config.user_from_id(user_id).embeds()
+            return ret
+
+    async def set_user(self, user_id: int, enabled: Optional[bool]) -> None:
+        self._cached_users[user_id] = enabled
+        if enabled is None:
+            await self._config.user_from_id(user_id).embeds.clear()
+        else:
+            await self._config.user_from_id(user_id).embeds.set(enabled)
+
+    def forget_user(self, user_id: int) -> None:
+        """Drop the cached setting of a user whose data has been cleared."""
+        self._cached_users.pop(user_id, None)
+
+    async def get_command(self, command_name: str, guild_id: int) -> Optional[bool]:
+        key = (command_name, guild_id)
+        try:
+            return self._cached_commands[key]
+        except KeyError:
+            ret = self._cached_commands[key] = await self._config.custom(
+                "COMMAND", command_name, guild_id
+            ).embeds()
+            return ret
+
+    async def set_command(self, command_name: str, guild_id: int, enabled: Optional[bool]) -> None:
+        self._cached_commands[(command_name, guild_id)] = enabled
+        scope = self._config.custom("COMMAND", command_name, guild_id)
+        if enabled is None:
+            await scope.embeds.clear()
+        else:
+            await scope.embeds.set(enabled)
+
+
+class CompiledLists(NamedTuple):
+    """Read-only snapshot of the allowlist and blocklist of a single scope."""
+
+    whitelist: FrozenSet[int]
+    blacklist: FrozenSet[int]
+
+    @property
+    def empty(self) -> bool:
+        """Whether neither of the lists has any entries."""
+        return not (self.whitelist or self.blacklist)
+
+    def allows(self, ids: Union[int, Set[int]]) -> bool:
+        """Check whether the given ID, or any of the given IDs, passes the lists.
+
+        The blocklist is only used when the allowlist is empty.
+        """
+        if isinstance(ids, int):
+            if self.whitelist:
+                return ids in self.whitelist
+            return ids not in self.blacklist
+        if self.whitelist:
+            return not ids.isdisjoint(self.whitelist)
+        return ids.isdisjoint(self.blacklist)
+
+
+_NO_LISTS = CompiledLists(frozenset(), frozenset())
+
+
 class WhitelistBlacklistManager:
     def __init__(self, config: Config):
         self._config: Config = config
         self._cached_whitelist: Dict[Optional[int], Set[int]] = {}
         self._cached_blacklist: Dict[Optional[int], Set[int]] = {}
+        # Snapshots of the cached lists used by `Red.allowed_by_whitelist_blacklist()`,
+        # rebuilt for a single scope whenever one of its lists changes.
+        self._compiled: Dict[Optional[int], CompiledLists] = {}
         # because of discord deletion
         # we now have sync and async access that may need to happen at the
         # same time.
         # blame discord for this.
         self._access_lock = asyncio.Lock()
 
+    async def get_compiled(self, guild_id: Optional[int] = None) -> CompiledLists:
+        """Get the compiled lists of the guild with the given ID, or the global lists.
+
+        After the first call for a scope, this returns without awaiting anything.
+        """
+        try:
+            return self._compiled[guild_id]
+        except KeyError:
+            pass
+        async with self._access_lock:
+            if guild_id not in self._cached_whitelist:
+                if guild_id is None:
+                    self._cached_whitelist[guild_id] = set(await self._config.whitelist())
+                else:
+                    self._cached_whitelist[guild_id] = set(
+                        await self._config.guild_from_id(guild_id).whitelist()
+                    )
+            if guild_id not in self._cached_blacklist:
+                if guild_id is None:
+                    self._cached_blacklist[guild_id] = set(await self._config.blacklist())
+                else:
+                    self._cached_blacklist[guild_id] = set(
+                        await self._config.guild_from_id(guild_id).blacklist()
+                    )
+            return self._compile(guild_id)
+
+    def _compile(self, gid: Optional[int]) -> CompiledLists:
+        # Must be called while holding `self._access_lock`.
+        whitelist = self._cached_whitelist.get(gid)
+        blacklist = self._cached_blacklist.get(gid)
+        if whitelist is None or blacklist is None:
+            # Not fully loaded yet, `get_compiled()` will take care of it.
+            self._compiled.pop(gid, None)
+            return _NO_LISTS
+        if whitelist or blacklist:
+            compiled = CompiledLists(frozenset(whitelist), frozenset(blacklist))
+        else:
+            compiled = _NO_LISTS
+        self._compiled[gid] = compiled
+        return compiled
+
     async def discord_deleted_user(self, user_id: int):
         async with self._access_lock:
             async for guild_id_or_none, ids in AsyncIter(
@@ -251,6 +433,12 @@ class WhitelistBlacklistManager:
             ):
                 ids.discard(user_id)
 
+            async for guild_id_or_none, compiled in AsyncIter(
+                list(self._compiled.items()), steps=100
+            ):
+                if user_id in compiled.whitelist or user_id in compiled.blacklist:
+                    self._compile(guild_id_or_none)
+
             for grp in (self._config.whitelist, self._config.blacklist):
                 async with grp() as ul:
                     try:
@@ -307,6 +495,7 @@ class WhitelistBlacklistManager:
                 await self._config.guild_from_id(gid).whitelist.set(
                     list(self._cached_whitelist[gid])
                 )
+            self._compile(gid)
 
     async def clear_whitelist(self, guild: Optional[discord.Guild] = None):
         async with self._access_lock:
@@ -316,6 +505,7 @@ class WhitelistBlacklistManager:
                 await self._config.whitelist.clear()
             else:
                 await self._config.guild_from_id(gid).whitelist.clear()
+            self._compile(gid)
 
     async def remove_from_whitelist(
         self, guild: Optional[discord.Guild], role_or_user: Iterable[int]
@@ -341,6 +531,7 @@ class WhitelistBlacklistManager:
                 await self._config.guild_from_id(gid).whitelist.set(
                     list(self._cached_whitelist[gid])
                 )
+            self._compile(gid)
 
     async def get_blacklist(self, guild: Optional[discord.Guild] = None) -> Set[int]:
         async with self._access_lock:
@@ -378,6 +569,7 @@ class WhitelistBlacklistManager:
                 await self._config.guild_from_id(gid).blacklist.set(
                     list(self._cached_blacklist[gid])
                 )
+            self._compile(gid)
 
     async def clear_blacklist(self, guild: Optional[discord.Guild] = None):
         async with self._access_lock:
@@ -387,6 +579,7 @@ class WhitelistBlacklistManager:
                 await self._config.blacklist.clear()
             else:
                 await self._config.guild_from_id(gid).blacklist.clear()
+            self._compile(gid)
 
     async def remove_from_blacklist(
         self, guild: Optional[discord.Guild], role_or_user: Iterable[int]
@@ -410,6 +603,7 @@ class WhitelistBlacklistManager:
                 await self._config.guild_from_id(gid).blacklist.set(
                     list(self._cached_blacklist[gid])
                 )
+            self._compile(gid)
 
 
 class DisabledCogCache:
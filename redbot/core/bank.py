@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import itertools
 import logging
 from datetime import datetime, timezone
-from typing import Union, List, Optional, TYPE_CHECKING, Literal
-from functools import wraps
+from typing import Any, Dict, Union, List, Mapping, Optional, Tuple, TYPE_CHECKING, Literal
+from functools import partial, wraps
 
 import discord
 
@@ -29,6 +31,7 @@ __all__ = (
     "withdraw_credits",
     "deposit_credits",
     "transfer_credits",
+    "Transaction",
     "wipe_bank",
     "bank_prune",
     "get_leaderboard",
@@ -82,8 +85,83 @@ _cache_is_global = None
 _cache = {"bank_name": None, "currency": None, "default_balance": None, "max_balance": None}
 
 
+class _LeaderboardIndex:
+    """Balances of a bank's accounts, kept sorted for leaderboard lookups.
+
+    The index is loaded lazily on first use and then updated
+    incrementally by the functions changing the balances.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.lock = asyncio.Lock()
+        self.balances: Dict[int, int] = {}
+        # (-balance, user_id) tuples in ascending order, i.e. richest account first
+        self.ranking: List[Tuple[int, int]] = []
+        # Changes done while the index was being loaded, `None` for removed accounts.
+        self._pending: Dict[int, Optional[int]] = {}
+
+    def load(self, accounts: Mapping[int, Mapping[str, Any]]) -> None:
+        balances = {user_id: account["balance"] for user_id, account in accounts.items()}
+        for user_id, balance in self._pending.items():
+            if balance is None:
+                balances.pop(user_id, None)
+            else:
+                balances[user_id] = balance
+        self._pending.clear()
+        self.balances = balances
+        self.ranking = sorted((-balance, user_id) for user_id, balance in balances.items())
+        self.loaded = True
+
+    def update(self, user_id: int, balance: Optional[int]) -> None:
+        """Update the balance of an account, or remove it if ``balance`` is `None`."""
+        if not self.loaded:
+            self._pending[user_id] = balance
+            return
+        old_balance = self.balances.pop(user_id, None)
+        if old_balance is not None:
+            del self.ranking[bisect.bisect_left(self.ranking, (-old_balance, user_id))]
+        if balance is not None:
+            self.balances[user_id] = balance
+            bisect.insort(self.ranking, (-balance, user_id))
+
+    def position(self, user_id: int) -> Optional[int]:
+        try:
+            balance = self.balances[user_id]
+        except KeyError:
+            return None
+        return bisect.bisect_left(self.ranking, (-balance, user_id)) + 1
+
+
+# Leaderboard indexes by guild ID, `None` being the global bank's index.
+_leaderboards: Dict[Optional[int], _LeaderboardIndex] = {}
+
+
+async def _get_leaderboard_index(guild: Optional[discord.Guild]) -> _LeaderboardIndex:
+    guild_id = None if guild is None else guild.id
+    index = _leaderboards.get(guild_id)
+    if index is None:
+        index = _leaderboards[guild_id] = _LeaderboardIndex()
+    if not index.loaded:
+        async with index.lock:
+            if not index.loaded:
+                if guild is None:
+                    accounts = await _config.all_users(copy=False)
+                else:
+                    accounts = await _config.all_members(guild, copy=False)
+                index.load(accounts)
+    return index
+
+
+def _update_leaderboard(guild_id: Optional[int], user_id: int, balance: Optional[int]) -> None:
+    index = _leaderboards.get(guild_id)
+    if index is not None:
+        index.update(user_id, balance)
+
+
 async def _init():
     global _config
+    _leaderboards.clear()
     _config = Config.get_conf(None, 384734293238749, cog_name="Bank", force_registration=True)
     _config.register_global(**_DEFAULT_GLOBAL)
     _config.register_guild(**_DEFAULT_GUILD)
@@ -144,10 +222,12 @@ async def _process_data_deletion(
 
     async with _data_deletion_lock:
         await _config.user_from_id(user_id).clear()
+        _update_leaderboard(None, user_id, None)
         all_members = await _config.all_members()
         async for guild_id, member_dict in AsyncIter(all_members.items(), steps=100):
             if user_id in member_dict:
                 await _config.member_from_ids(guild_id, user_id).clear()
+                _update_leaderboard(guild_id, user_id, None)
 
 
 def is_owner_if_bank_global():
@@ -334,9 +414,12 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         )
     if await is_global():
         group = _config.user(member)
+        guild_id = None
     else:
         group = _config.member(member)
+        guild_id = member.guild.id
     await group.balance.set(amount)
+    _update_leaderboard(guild_id, member.id, amount)
 
     if await group.created_at() == 0:
         time = _encoded_current_time()
@@ -487,6 +570,209 @@ async def transfer_credits(
     return await deposit_credits(to, amount)
 
 
+class Transaction:
+    """Stages balance changes of many accounts to commit them all at once.
+
+    The changes are applied in the order they were staged when the
+    transaction is committed. They are either all stored with a single
+    storage write, or, if any of them is invalid, none of them are.
+
+    This is an asynchronous context manager which commits the transaction
+    on exit, unless an exception was raised in its body.
+
+    Example
+    -------
+    ::
+
+        async with bank.Transaction() as transaction:
+            for member in winners:
+                transaction.transfer(ctx.author, member, prize)
+            transaction.deposit(ctx.author, refund)
+
+    """
+
+    def __init__(self):
+        self._operations: List[Tuple[Union[discord.Member, discord.User], int, bool]] = []
+        self._committed = False
+
+    async def __aenter__(self) -> Transaction:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.commit()
+
+    def _check_amount(self, amount: int, kind: str) -> None:
+        if self._committed:
+            raise RuntimeError("This transaction has already been committed.")
+        if not isinstance(amount, int):
+            raise TypeError("{} amount must be of type int, not {}.".format(kind, type(amount)))
+        if _invalid_amount(amount):
+            raise ValueError(
+                "Invalid {} amount {} < 0".format(
+                    kind.lower(), humanize_number(amount, override_locale="en_US")
+                )
+            )
+
+    def set_balance(self, member: Union[discord.Member, discord.User], amount: int) -> None:
+        """Stage setting an account balance.
+
+        See `set_balance()` for more information.
+
+        Raises
+        ------
+        ValueError
+            If attempting to set the balance to a negative number.
+        TypeError
+            If the amount is not an `int`.
+
+        """
+        self._check_amount(amount, "Balance")
+        self._operations.append((member, amount, True))
+
+    def deposit(self, member: Union[discord.Member, discord.User], amount: int) -> None:
+        """Stage adding a given amount of credits to an account.
+
+        See `deposit_credits()` for more information.
+
+        Raises
+        ------
+        ValueError
+            If the deposit amount is invalid.
+        TypeError
+            If the deposit amount is not an `int`.
+
+        """
+        self._check_amount(amount, "Deposit")
+        self._operations.append((member, amount, False))
+
+    def withdraw(self, member: Union[discord.Member, discord.User], amount: int) -> None:
+        """Stage removing a certain amount of credits from an account.
+
+        Whether the account has sufficient funds is checked when
+        the transaction is committed.
+
+        See `withdraw_credits()` for more information.
+
+        Raises
+        ------
+        ValueError
+            If the withdrawal amount is invalid.
+        TypeError
+            If the withdrawal amount is not an `int`.
+
+        """
+        self._check_amount(amount, "Withdrawal")
+        self._operations.append((member, -amount, False))
+
+    def transfer(
+        self,
+        from_: Union[discord.Member, discord.User],
+        to: Union[discord.Member, discord.User],
+        amount: int,
+    ) -> None:
+        """Stage transferring a given amount of credits from one account to another.
+
+        See `transfer_credits()` for more information.
+
+        Raises
+        ------
+        ValueError
+            If the transfer amount is invalid.
+        TypeError
+            If the transfer amount is not an `int`.
+
+        """
+        self._check_amount(amount, "Transfer")
+        self._operations.append((from_, -amount, False))
+        self._operations.append((to, amount, False))
+
+    async def commit(self) -> None:
+        """Apply all of the staged changes.
+
+        Raises
+        ------
+        ValueError
+            If any of the accounts would end up with a negative balance.
+        RuntimeError
+            If the bank is guild-specific and a discord.User object was provided,
+            or if the transaction has already been committed.
+        BalanceTooHigh
+            If any of the accounts would end up with a balance greater than
+            the maximum balance.
+
+        """
+        if self._committed:
+            raise RuntimeError("This transaction has already been committed.")
+        global_bank = await is_global()
+
+        # (guild ID or None, user ID) keys of the operations
+        keys = []
+        guilds = {}
+        groups = {}
+        for member, _amount, _absolute in self._operations:
+            guild = None if global_bank else getattr(member, "guild", None)
+            key = (None if guild is None else guild.id, member.id)
+            keys.append(key)
+            if key in groups:
+                continue
+            if global_bank:
+                groups[key] = _config.user(member)
+            elif guild is None:
+                raise RuntimeError("A discord.Member is required when the bank is guild-specific.")
+            else:
+                groups[key] = _config.member(member)
+            guilds[key[0]] = guild
+
+        accounts = dict(zip(groups, await _config.get_many(groups.values())))
+        balances = {}
+        for key, account in accounts.items():
+            if account["created_at"] == 0:
+                # the account doesn't exist yet
+                balances[key] = await get_default_balance(guilds[key[0]])
+            else:
+                balances[key] = account["balance"]
+        max_balances = {
+            guild_id: await get_max_balance(guild) for guild_id, guild in guilds.items()
+        }
+
+        for key, (member, amount, absolute) in zip(keys, self._operations):
+            balance = amount if absolute else balances[key] + amount
+            if balance < 0:
+                raise ValueError(
+                    "Insufficient funds {} > {}".format(
+                        humanize_number(-amount, override_locale="en_US"),
+                        humanize_number(balances[key], override_locale="en_US"),
+                    )
+                )
+            if balance > max_balances[key[0]]:
+                currency = await get_currency_name(guilds[key[0]])
+                raise errors.BalanceTooHigh(
+                    user=member.display_name,
+                    max_balance=max_balances[key[0]],
+                    currency_name=currency,
+                )
+            balances[key] = balance
+
+        to_set = []
+        time = _encoded_current_time()
+        for key, (member, _amount, _absolute) in zip(keys, self._operations):
+            account = accounts.pop(key, None)
+            if account is None:
+                continue
+            group = groups[key]
+            to_set.append((group.balance, balances[key]))
+            if account["created_at"] == 0:
+                to_set.append((group.created_at, time))
+            if account["name"] == "":
+                to_set.append((group.name, member.display_name))
+        await _config.set_many(to_set)
+        self._committed = True
+
+        for (guild_id, user_id), balance in balances.items():
+            _update_leaderboard(guild_id, user_id, balance)
+
+
 async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
     """Delete all accounts from the bank.
 
@@ -499,8 +785,13 @@ async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
     """
     if await is_global():
         await _config.clear_all_users()
+        _leaderboards.pop(None, None)
     else:
         await _config.clear_all_members(guild)
+        if guild is None:
+            _leaderboards.clear()
+        else:
+            _leaderboards.pop(guild.id, None)
 
 
 async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None) -> None:
@@ -536,6 +827,7 @@ async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None)
                 elif g.unavailable:
                     _uguilds.add(g)
         group = _config._get_base_group(_config.USER)
+        guild_id = None
 
     else:
         if guild is None:
@@ -544,27 +836,26 @@ async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None)
             _guilds = {guild} if not guild.unavailable and guild.large else set()
             _uguilds = {guild} if guild.unavailable else set()
         group = _config._get_base_group(_config.MEMBER, str(guild.id))
+        guild_id = guild.id
 
     if user_id is None:
         for _guild in _guilds:
             await _guild.chunk()
-        accounts = await group.all()
-        tmp = accounts.copy()
+        accounts = await group.all(copy=False)
         members = bot.get_all_members() if global_bank else guild.members
         user_list = {str(m.id) for m in members if m.guild not in _uguilds}
-
-    async with group.all() as bank_data:  # FIXME: use-config-bulk-update
-        if user_id is None:
-            for acc in tmp:
-                if acc not in user_list:
-                    del bank_data[acc]
-        else:
-            user_id = str(user_id)
-            if user_id in bank_data:
-                del bank_data[user_id]
+        to_prune = [acc for acc in accounts if acc not in user_list]
+        await group.clear_many(to_prune)
+        for acc in to_prune:
+            _update_leaderboard(guild_id, int(acc), None)
+    else:
+        await group.clear_raw(str(user_id))
+        _update_leaderboard(guild_id, user_id, None)
 
 
-async def get_leaderboard(positions: int = None, guild: discord.Guild = None) -> List[tuple]:
+async def get_leaderboard(
+    positions: int = None, guild: discord.Guild = None, *, offset: int = 0
+) -> List[tuple]:
     """
     Gets the bank's leaderboard
 
@@ -575,6 +866,9 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
     guild : discord.Guild
         The guild to get the leaderboard of. If the bank is global and this
         is provided, get only guild members on the leaderboard
+    offset : `int`
+        The number of top positions to skip, can be used to get
+        the leaderboard in pages. Defaults to 0.
 
     Returns
     -------
@@ -588,21 +882,23 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
 
     """
     if await is_global():
-        raw_accounts = await _config.all_users()
+        index = await _get_leaderboard_index(None)
+        user_ids = (user_id for _balance, user_id in index.ranking)
         if guild is not None:
-            tmp = raw_accounts.copy()
-            for acc in tmp:
-                if not guild.get_member(acc):
-                    del raw_accounts[acc]
+            user_ids = (user_id for user_id in user_ids if guild.get_member(user_id))
+        stop = None if positions is None else offset + positions
+        user_ids = list(itertools.islice(user_ids, offset, stop))
+        get_group = _config.user_from_id
     else:
         if guild is None:
             raise TypeError("Expected a guild, got NoneType object instead!")
-        raw_accounts = await _config.all_members(guild)
-    sorted_acc = sorted(raw_accounts.items(), key=lambda x: x[1]["balance"], reverse=True)
-    if positions is None:
-        return sorted_acc
-    else:
-        return sorted_acc[:positions]
+        index = await _get_leaderboard_index(guild)
+        stop = None if positions is None else offset + positions
+        user_ids = [user_id for _balance, user_id in index.ranking[offset:stop]]
+        get_group = partial(_config.member_from_ids, guild.id)
+
+    raw_accounts = await _config.get_many(get_group(user_id) for user_id in user_ids)
+    return list(zip(user_ids, raw_accounts))
 
 
 async def get_leaderboard_position(
@@ -630,17 +926,11 @@ async def get_leaderboard_position(
     if await is_global():
         guild = None
     else:
-        guild = member.guild if hasattr(member, "guild") else None
-    try:
-        leaderboard = await get_leaderboard(None, guild)
-    except TypeError:
-        raise
-    else:
-        pos = discord.utils.find(lambda x: x[1][0] == member.id, enumerate(leaderboard, 1))
-        if pos is None:
-            return None
-        else:
-            return pos[0]
+        guild = getattr(member, "guild", None)
+        if guild is None:
+            raise TypeError("Expected a guild, got NoneType object instead!")
+    index = await _get_leaderboard_index(guild)
+    return index.position(member.id)
 
 
 async def get_account(member: Union[discord.Member, discord.User]) -> Account:
@@ -726,6 +1016,7 @@ async def set_global(global_: bool) -> bool:
         await _config.clear_all_users()
     else:
         await _config.clear_all_members()
+    _leaderboards.clear()
 
     await _config.is_global.set(global_)
     _cache_is_global = global_
@@ -51,6 +51,7 @@ from ._settings_caches import (
     WhitelistBlacklistManager,
     DisabledCogCache,
     I18nManager,
+    EmbedSettingsCache,
 )
 from .utils.predicates import MessagePredicate
 from ._rpc import RPCMixin
@@ -183,7 +184,6 @@ class Red(
         # GUILD_ID=0 for global setting
         self._config.init_custom(COMMAND_SCOPE, 2)
         self._config.register_custom(COMMAND_SCOPE, embeds=None)
-        # TODO: add cache for embed settings
 
         self._config.init_custom(SHARED_API_TOKENS, 2)
         self._config.register_custom(SHARED_API_TOKENS)
@@ -192,6 +192,7 @@ class Red(
         self._ignored_cache = IgnoreManager(self._config)
         self._whiteblacklist_cache = WhitelistBlacklistManager(self._config)
         self._i18n_cache = I18nManager(self._config)
+        self._embed_settings_cache = EmbedSettingsCache(self._config)
         self._bypass_cooldowns = False
 
         async def prefix_manager(bot, message) -> List[str]:
@@ -759,21 +760,22 @@ class Red(
         if await self.is_owner(who):
             return True
 
-        global_whitelist = await self.get_whitelist()
-        if global_whitelist:
-            if who.id not in global_whitelist:
-                return False
-        else:
-            # blacklist is only used when whitelist doesn't exist.
-            global_blacklist = await self.get_blacklist()
-            if who.id in global_blacklist:
-                return False
+        # The compiled lists are cached after first use, so in the common case
+        # none of the awaits below actually suspend.
+        global_lists = await self._whiteblacklist_cache.get_compiled()
+        if not global_lists.allows(who.id):
+            return False
 
         if guild:
             if guild.owner_id == who.id:
                 return True
 
-            # The delayed expansion of ids to check saves time in the DM case.
+            guild_lists = await self._whiteblacklist_cache.get_compiled(guild.id)
+            if guild_lists.empty:
+                return True
+
+            # The delayed expansion of ids to check saves time in the DM case
+            # and in guilds without any lists.
             # Converting to a set reduces the total lookup time in section
             if mocked:
                 ids = {i for i in (who.id, *(role_ids or [])) if i != guild.id}
@@ -784,14 +786,8 @@ class Red(
                 # there is a silent failure potential, and role blacklist/whitelists will break.
                 ids = {i for i in (who.id, *(getattr(who, "_roles", []))) if i != guild.id}
 
-            guild_whitelist = await self.get_whitelist(guild)
-            if guild_whitelist:
-                if ids.isdisjoint(guild_whitelist):
-                    return False
-            else:
-                guild_blacklist = await self.get_blacklist(guild)
-                if not ids.isdisjoint(guild_blacklist):
-                    return False
+            if not guild_lists.allows(ids):
+                return False
 
         return True
 
@@ -1362,11 +1358,12 @@ class Red(
             `discord.DMChannel`, or `discord.PartialMessageable`.
         """
 
+        embed_settings = self._embed_settings_cache
+
         async def get_command_setting(guild_id: int) -> Optional[bool]:
             if command is None:
                 return None
-            scope = self._config.custom(COMMAND_SCOPE, command.qualified_name, guild_id)
-            return await scope.embeds()
+            return await embed_settings.get_command(command.qualified_name, guild_id)
 
         # using dpy_commands.Context to keep the Messageable contract in full
         if isinstance(channel, dpy_commands.Context):
@@ -1393,25 +1390,24 @@ class Red(
             if check_permissions and not channel.permissions_for(channel.guild.me).embed_links:
                 return False
 
-            channel_setting = await self._config.channel_from_id(channel_id).embeds()
+            channel_setting = await embed_settings.get_channel(channel_id)
             if channel_setting is not None:
                 return channel_setting
 
             if (command_setting := await get_command_setting(channel.guild.id)) is not None:
                 return command_setting
 
-            if (guild_setting := await self._config.guild(channel.guild).embeds()) is not None:
+            if (guild_setting := await embed_settings.get_guild(channel.guild.id)) is not None:
                 return guild_setting
         else:
             user = channel
-            if (user_setting := await self._config.user(user).embeds()) is not None:
+            if (user_setting := await embed_settings.get_user(user.id)) is not None:
                 return user_setting
 
         if (global_command_setting := await get_command_setting(0)) is not None:
             return global_command_setting
 
-        global_setting = await self._config.embeds()
-        return global_setting
+        return await embed_settings.get_global()
 
     async def use_buttons(self) -> bool:
         """
@@ -2313,6 +2309,7 @@ class Red(
             return
 
         await self._config.user_from_id(user_id).clear()
+        self._embed_settings_cache.forget_user(user_id)
         all_guilds = await self._config.all_guilds()
 
         async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
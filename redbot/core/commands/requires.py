@@ -93,6 +93,16 @@ GuildPermissionModel = Union[
 PermissionModel = Union[GlobalPermissionModel, GuildPermissionModel]
 CheckPredicate = Callable[["Context"], Union[Optional[bool], Awaitable[Optional[bool]]]]
 
+# Maximum number of resolved rules cached per command per guild.
+_RULE_CACHE_MAX_SIZE = 512
+# (author ID, channel IDs, author's role IDs)
+_RuleCacheKey = Tuple[int, Tuple[int, ...], Tuple[int, ...]]
+# Per-guild generation of the rule caches of all commands, bumped by
+# `Requires.invalidate_rule_caches()` when a change to a guild affects rule resolution
+# without changing the cache keys, e.g. when the role hierarchy changes.
+_rule_cache_generations: Dict[int, int] = {}
+_rule_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "invalidations": 0}
+
 
 class PrivilegeLevel(enum.IntEnum):
     """Enumeration for special privileges."""
@@ -343,6 +353,8 @@ class Requires:
             self.bot_perms = bot_perms
         self._global_rules: _RulesDict = _RulesDict()
         self._guild_rules: _IntKeyDict[_RulesDict] = _IntKeyDict[_RulesDict]()
+        # guild ID -> (generation, resolved rules), see `_get_rule_from_ctx()`
+        self._rule_cache: Dict[int, Tuple[int, Dict[_RuleCacheKey, PermState]]] = {}
 
     @staticmethod
     def get_decorator(
@@ -428,6 +440,7 @@ class Requires:
             rules.pop(model_id, None)
         else:
             rules[model_id] = rule
+        self._clear_rule_cache(guild_id)
 
     def clear_all_rules(self, guild_id: int, *, preserve_default_rule: bool = True) -> None:
         """Clear all rules of a particular scope.
@@ -454,6 +467,7 @@ class Requires:
         rules.clear()
         if default is not None and preserve_default_rule:
             rules[self.DEFAULT] = default
+        self._clear_rule_cache(guild_id)
 
     def reset(self) -> None:
         """Reset this Requires object to its original state.
@@ -463,8 +477,49 @@ class Requires:
         """
         self._guild_rules.clear()  # pylint: disable=no-member
         self._global_rules.clear()  # pylint: disable=no-member
+        self._clear_rule_cache(self.GLOBAL)
         self.ready_event.clear()
 
+    @staticmethod
+    def invalidate_rule_caches(guild_id: int) -> None:
+        """Invalidate the cached rules of all commands in a guild.
+
+        Rules resolved for a context are cached per command, and the
+        cache is cleared when the command's rules change. This should
+        be called when something else that affects the resolved rules
+        changes, such as the role hierarchy of a guild.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to invalidate the cached rules for.
+
+        """
+        _rule_cache_generations[guild_id] = _rule_cache_generations.get(guild_id, 0) + 1
+        _rule_cache_stats["invalidations"] += 1
+
+    @staticmethod
+    def get_rule_cache_stats() -> Dict[str, int]:
+        """Get the counters of the rule caches of all commands.
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionary with the number of ``hits``, ``misses`` and
+            ``invalidations`` so far.
+
+        """
+        return _rule_cache_stats.copy()
+
+    def _clear_rule_cache(self, guild_id: int) -> None:
+        # Global rules apply to all guilds.
+        if guild_id:
+            if self._rule_cache.pop(guild_id, None) is not None:
+                _rule_cache_stats["invalidations"] += 1
+        elif self._rule_cache:
+            self._rule_cache.clear()
+            _rule_cache_stats["invalidations"] += 1
+
     async def verify(self, ctx: "Context") -> bool:
         """Check if the given context passes the requirements.
 
@@ -579,11 +634,6 @@ class Requires:
                 return rule
             return self.get_rule(self.DEFAULT, self.GLOBAL)
 
-        rules_chain = [self._global_rules]
-        guild_rules = self._guild_rules.get(ctx.guild.id)
-        if guild_rules:
-            rules_chain.append(guild_rules)
-
         channels = []
         if author.voice is not None:
             channels.append(author.voice.channel)
@@ -595,6 +645,46 @@ class Requires:
         if category is not None:
             channels.append(category)
 
+        # The resolved rule only depends on the models in the chain below, and the order
+        # of the author's roles only changes when the role hierarchy does,
+        # which invalidates the cache through `Requires.invalidate_rule_caches()`.
+        # DEP-WARN
+        # This uses member._roles, which is a sorted array of role IDs,
+        # to avoid sorting the roles by position on every cache hit.
+        cache_key = (author.id, tuple(c.id for c in channels), tuple(author._roles))
+        generation = _rule_cache_generations.get(guild.id, 0)
+        cached_generation, cache = self._rule_cache.get(guild.id, (None, None))
+        if cache is None or cached_generation != generation:
+            cache = {}
+            self._rule_cache[guild.id] = (generation, cache)
+        elif (rule := cache.get(cache_key)) is not None:
+            _rule_cache_stats["hits"] += 1
+            return rule
+        _rule_cache_stats["misses"] += 1
+        if len(cache) >= _RULE_CACHE_MAX_SIZE:
+            cache.clear()
+        rule = cache[cache_key] = self._resolve_rule(author, guild, channels)
+        return rule
+
+    def _resolve_rule(
+        self,
+        author: discord.Member,
+        guild: discord.Guild,
+        channels: List[
+            Union[
+                discord.VoiceChannel,
+                discord.StageChannel,
+                discord.TextChannel,
+                discord.ForumChannel,
+                discord.CategoryChannel,
+            ]
+        ],
+    ) -> PermState:
+        rules_chain = [self._global_rules]
+        guild_rules = self._guild_rules.get(guild.id)
+        if guild_rules:
+            rules_chain.append(guild_rules)
+
         # We want author roles sorted highest to lowest, and exclude the @everyone role
         author_roles = reversed(author.roles[1:])
 
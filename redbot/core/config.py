@@ -10,6 +10,9 @@ from typing import (
     Awaitable,
     Dict,
     Generator,
+    Iterable,
+    List,
+    Mapping,
     MutableMapping,
     Optional,
     Tuple,
@@ -21,6 +24,8 @@ from typing import (
 import discord
 
 from ._drivers import BaseDriver, ConfigCategory, IdentifierData, get_driver
+from ._drivers.base import _is_number
+from ._drivers.views import CopyOnWriteDict, ReadOnlyDict, _cow_wrap
 
 __all__ = (
     "ConfigCategory",
@@ -37,6 +42,11 @@ _T = TypeVar("_T")
 _config_cache = weakref.WeakValueDictionary()
 
 
+def _check_copy_mode(copy: Union[bool, str]) -> None:
+    if copy not in (True, False, "lazy"):
+        raise ValueError('copy must be True, False, or "lazy".')
+
+
 class ConfigMeta(type):
     """
     We want to prevent re-initializing existing config instances while having a singleton
@@ -233,6 +243,15 @@ class Value:
         """
         return _ValueCtxManager(self, self._get(default), acquire_lock=acquire_lock)
 
+    def _resolve(self, raw):
+        # Resolves a value fetched by `Config.get_many()`, `raw` is `...` when nothing is stored.
+        return self.default if raw is ... else raw
+
+    def _prepare(self, value):
+        if isinstance(value, dict):
+            value = _str_key_dict(value)
+        return value
+
     async def set(self, value):
         """Set the value of the data elements pointed to by `identifiers`.
 
@@ -252,9 +271,7 @@ class Value:
             The new literal value of this attribute.
 
         """
-        if isinstance(value, dict):
-            value = _str_key_dict(value)
-        await self._driver.set(self.identifier_data, value=value)
+        await self._driver.set(self.identifier_data, value=self._prepare(value))
 
     async def clear(self):
         """
@@ -262,6 +279,73 @@ class Value:
         """
         await self._driver.clear(self.identifier_data)
 
+    async def inc(self, delta: Union[int, float] = 1) -> Union[int, float]:
+        """Increment the number pointed to by `identifiers`.
+
+        The value is read and written in a single driver operation, so
+        there's no need to hold this value's lock while incrementing it.
+
+        Example
+        -------
+        ::
+
+            # Increments the member's "count" value by 1
+            count = await config.member(some_member).count.inc()
+
+        Parameters
+        ----------
+        delta : `int` or `float`
+            The amount to increment the value by. Defaults to 1.
+
+        Returns
+        -------
+        `int` or `float`
+            The new value.
+
+        Raises
+        ------
+        TypeError
+            If ``delta`` or the default of this value is not a number.
+        `redbot.core.errors.StoredTypeError`
+            If the stored value is not a number.
+
+        """
+        if not _is_number(delta):
+            raise TypeError(f"Cannot increment by non-numeric value {delta!r}")
+        if not _is_number(self.default):
+            raise TypeError(f"Cannot increment value with non-numeric default {self.default!r}")
+        return await self._driver.inc(self.identifier_data, delta, self.default)
+
+    async def toggle(self) -> bool:
+        """Toggle the boolean pointed to by `identifiers`.
+
+        The value is read and written in a single driver operation, so
+        there's no need to hold this value's lock while toggling it.
+
+        Example
+        -------
+        ::
+
+            # Toggles the guild's "enabled" value
+            enabled = await config.guild(some_guild).enabled.toggle()
+
+        Returns
+        -------
+        bool
+            The new value.
+
+        Raises
+        ------
+        TypeError
+            If the default of this value is not a boolean.
+        `redbot.core.errors.StoredTypeError`
+            If the stored value is not a boolean.
+
+        """
+        if not isinstance(self.default, bool):
+            raise TypeError(f"Cannot toggle value with non-boolean default {self.default!r}")
+        return await self._driver.toggle(self.identifier_data, self.default)
+
 
 class Group(Value):
     """
@@ -308,6 +392,23 @@ class Group(Value):
         else:
             return raw
 
+    def _resolve(self, raw):
+        default = self.defaults
+        if raw is ...:
+            return default
+        if isinstance(raw, dict):
+            return self.nested_update(raw, default)
+        return raw
+
+    async def _get_view(self, copy: Union[bool, str]) -> Any:
+        try:
+            raw = await self._driver.get_view(self.identifier_data)
+        except KeyError:
+            raw = {}
+        if isinstance(raw, collections.abc.Mapping):
+            raw = ReadOnlyDict(raw, self._defaults)
+        return _cow_wrap(raw) if copy == "lazy" else raw
+
     # noinspection PyTypeChecker
     def __getattr__(self, item: str) -> Union["Group", Value]:
         """Get an attribute of this group.
@@ -385,6 +486,37 @@ class Group(Value):
         identifier_data = self.identifier_data.get_child(*path)
         await self._driver.clear(identifier_data)
 
+    async def clear_many(self, paths: Iterable[Any]):
+        """Clear multiple values from this group at once.
+
+        This is equivalent to calling `clear_raw` for each of the paths,
+        but only takes a single round-trip to the storage backend.
+
+        Example
+        -------
+        ::
+
+            await config.guild(guild).clear_many(["foo", ("bar", "baz")])
+
+            # is equivalent to
+
+            await config.guild(guild).clear_raw("foo")
+            await config.guild(guild).clear_raw("bar", "baz")
+
+        Parameters
+        ----------
+        paths : Iterable[Any]
+            The paths to clear. Each path is either a single key, or a tuple
+            of keys that mirror the arguments passed in for nested dict access.
+            These are casted to `str` for you.
+        """
+        await self._driver.clear_many([self._get_path_identifier_data(p) for p in paths])
+
+    def _get_path_identifier_data(self, path: Any) -> IdentifierData:
+        if not isinstance(path, tuple):
+            path = (path,)
+        return self.identifier_data.get_child(*(str(p) for p in path))
+
     def is_group(self, item: Any) -> bool:
         """A helper method for `__getattr__`. Most developers will have no need
         to use this.
@@ -512,7 +644,9 @@ class Group(Value):
                 return self.nested_update(raw, default)
             return raw
 
-    def all(self, *, acquire_lock: bool = True) -> _ValueCtxManager[Dict[str, Any]]:
+    def all(
+        self, *, acquire_lock: bool = True, copy: Union[bool, str] = True
+    ) -> _ValueCtxManager[Dict[str, Any]]:
         """Get a dictionary representation of this group's data.
 
         The return value of this method can also be used as an asynchronous
@@ -528,14 +662,30 @@ class Group(Value):
         acquire_lock : bool
             Same as the ``acquire_lock`` keyword parameter in
             `Value.__call__`.
+        copy : Union[bool, str]
+            Set to ``False`` to get a read-only mapping instead of a copy
+            of the data. With drivers which keep data in memory, this avoids
+            copying the data entirely. Set to ``"lazy"`` to get a mutable
+            mapping which only copies the parts of the data that get modified.
+            Either way, the result can't be used as a context manager, and
+            its ``copy()`` method has to be used to get builtin types.
+            Defaults to ``True``.
 
         Returns
         -------
         dict
             All of this Group's attributes, resolved as raw data values.
 
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
-        return self(acquire_lock=acquire_lock)
+        if copy is True:
+            return self(acquire_lock=acquire_lock)
+        _check_copy_mode(copy)
+        return _ValueCtxManager(self, self._get_view(copy), acquire_lock=acquire_lock)
 
     def nested_update(
         self, current: collections.abc.Mapping, defaults: Dict[str, Any] = ...
@@ -556,10 +706,10 @@ class Group(Value):
                 defaults[key] = pickle.loads(pickle.dumps(current[key], -1))
         return defaults
 
-    async def set(self, value):
+    def _prepare(self, value):
         if not isinstance(value, dict):
             raise ValueError("You may only set the value of a group to be a dict.")
-        await super().set(value)
+        return super()._prepare(value)
 
     async def set_raw(self, *nested_path: Any, value):
         """
@@ -589,6 +739,40 @@ class Group(Value):
             value = _str_key_dict(value)
         await self._driver.set(identifier_data, value=value)
 
+    async def set_many(self, values: Mapping[Any, Any]):
+        """Set multiple values of this group at once.
+
+        This is equivalent to calling `set_raw` for each of the items,
+        but only takes a single round-trip to the storage backend.
+
+        Example
+        -------
+        ::
+
+            await config.guild(guild).set_many({"foo": 1, ("bar", "baz"): 2})
+
+            # is equivalent to
+
+            await config.guild(guild).set_raw("foo", value=1)
+            await config.guild(guild).set_raw("bar", "baz", value=2)
+
+        Parameters
+        ----------
+        values : Mapping[Any, Any]
+            Mapping of paths to the values to store. Each path is either
+            a single key, or a tuple of keys that mirror the arguments passed
+            in for nested dict access. These are casted to `str` for you.
+        """
+        await self._driver.set_many(
+            [
+                (
+                    self._get_path_identifier_data(path),
+                    _str_key_dict(value) if isinstance(value, dict) else value,
+                )
+                for path, value in values.items()
+            ]
+        )
+
 
 class Config(metaclass=ConfigMeta):
     """Configuration manager for cogs and Red.
@@ -1166,7 +1350,9 @@ class Config(metaclass=ConfigMeta):
             raise ValueError(f"Group identifier not initialized: {group_identifier}")
         return self._get_base_group(str(group_identifier), *map(str, identifiers))
 
-    async def _all_from_scope(self, scope: str) -> Dict[int, Dict[Any, Any]]:
+    async def _all_from_scope(
+        self, scope: str, *, copy: Union[bool, str] = True
+    ) -> Dict[int, Dict[Any, Any]]:
         """Get a dict of all values from a particular scope of data.
 
         :code:`scope` must be one of the constants attributed to
@@ -1176,9 +1362,20 @@ class Config(metaclass=ConfigMeta):
 
         Default values are also mixed into the data if they have not yet been
         overwritten.
+
+        See `Group.all()` for the meaning of :code:`copy`.
         """
+        _check_copy_mode(copy)
         group = self._get_base_group(scope)
         ret = {}
+
+        if copy is not True:
+            try:
+                view = await self._driver.get_view(group.identifier_data)
+            except KeyError:
+                return ret
+            return self._wrap_views(view, self._defaults.get(scope, {}), copy)
+
         defaults = self.defaults.get(scope, {})
 
         try:
@@ -1193,7 +1390,20 @@ class Config(metaclass=ConfigMeta):
 
         return ret
 
-    async def all_guilds(self) -> dict:
+    @staticmethod
+    def _wrap_views(
+        view: ReadOnlyDict, defaults: Dict[str, Any], copy: Union[bool, str]
+    ) -> Dict[int, Any]:
+        ret = {}
+        for k, v in view.items():
+            # Defaults are only merged at the top level, same as in the copying path.
+            data = ReadOnlyDict(v, defaults, nested=False)
+            if copy == "lazy":
+                data = CopyOnWriteDict(data)
+            ret[int(k)] = data
+        return ret
+
+    async def all_guilds(self, *, copy: Union[bool, str] = True) -> dict:
         """Get all guild data as a dict.
 
         Note
@@ -1207,10 +1417,20 @@ class Config(metaclass=ConfigMeta):
             A dictionary in the form {`int`: `dict`} mapping
             :code:`GUILD_ID -> data`.
 
+        Other Parameters
+        ----------------
+        copy : Union[bool, str]
+            Same as the ``copy`` keyword parameter in `Group.all`.
+
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
-        return await self._all_from_scope(self.GUILD)
+        return await self._all_from_scope(self.GUILD, copy=copy)
 
-    async def all_channels(self) -> dict:
+    async def all_channels(self, *, copy: Union[bool, str] = True) -> dict:
         """Get all channel data as a dict.
 
         Note
@@ -1224,10 +1444,20 @@ class Config(metaclass=ConfigMeta):
             A dictionary in the form {`int`: `dict`} mapping
             :code:`CHANNEL_ID -> data`.
 
+        Other Parameters
+        ----------------
+        copy : Union[bool, str]
+            Same as the ``copy`` keyword parameter in `Group.all`.
+
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
-        return await self._all_from_scope(self.CHANNEL)
+        return await self._all_from_scope(self.CHANNEL, copy=copy)
 
-    async def all_roles(self) -> dict:
+    async def all_roles(self, *, copy: Union[bool, str] = True) -> dict:
         """Get all role data as a dict.
 
         Note
@@ -1241,10 +1471,20 @@ class Config(metaclass=ConfigMeta):
             A dictionary in the form {`int`: `dict`} mapping
             :code:`ROLE_ID -> data`.
 
+        Other Parameters
+        ----------------
+        copy : Union[bool, str]
+            Same as the ``copy`` keyword parameter in `Group.all`.
+
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
-        return await self._all_from_scope(self.ROLE)
+        return await self._all_from_scope(self.ROLE, copy=copy)
 
-    async def all_users(self) -> dict:
+    async def all_users(self, *, copy: Union[bool, str] = True) -> dict:
         """Get all user data as a dict.
 
         Note
@@ -1258,10 +1498,22 @@ class Config(metaclass=ConfigMeta):
             A dictionary in the form {`int`: `dict`} mapping
             :code:`USER_ID -> data`.
 
+        Other Parameters
+        ----------------
+        copy : Union[bool, str]
+            Same as the ``copy`` keyword parameter in `Group.all`.
+
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
-        return await self._all_from_scope(self.USER)
+        return await self._all_from_scope(self.USER, copy=copy)
 
-    def _all_members_from_guild(self, guild_data: dict) -> dict:
+    def _all_members_from_guild(self, guild_data: dict, copy: Union[bool, str] = True) -> dict:
+        if copy is not True:
+            return self._wrap_views(guild_data, self._defaults.get(self.MEMBER, {}), copy)
         ret = {}
         defaults = self.defaults.get(self.MEMBER, {})
         for member_id, member_data in guild_data.items():
@@ -1270,7 +1522,9 @@ class Config(metaclass=ConfigMeta):
             ret[int(member_id)] = new_member_data
         return ret
 
-    async def all_members(self, guild: discord.Guild = None) -> dict:
+    async def all_members(
+        self, guild: discord.Guild = None, *, copy: Union[bool, str] = True
+    ) -> dict:
         """Get data for all members.
 
         If :code:`guild` is specified, only the data for the members of that
@@ -1289,32 +1543,143 @@ class Config(metaclass=ConfigMeta):
             The guild to get the member data from. Can be omitted if data
             from every member of all guilds is desired.
 
+        Other Parameters
+        ----------------
+        copy : Union[bool, str]
+            Same as the ``copy`` keyword parameter in `Group.all`.
+
         Returns
         -------
         dict
             A dictionary of all specified member data.
 
+        Raises
+        ------
+        ValueError
+            If an invalid ``copy`` value is passed.
+
         """
+        _check_copy_mode(copy)
+        get = self._driver.get if copy is True else self._driver.get_view
         ret = {}
         if guild is None:
             group = self._get_base_group(self.MEMBER)
             try:
-                dict_ = await self._driver.get(group.identifier_data)
+                dict_ = await get(group.identifier_data)
             except KeyError:
                 pass
             else:
                 for guild_id, guild_data in dict_.items():
-                    ret[int(guild_id)] = self._all_members_from_guild(guild_data)
+                    ret[int(guild_id)] = self._all_members_from_guild(guild_data, copy)
         else:
             group = self._get_base_group(self.MEMBER, str(guild.id))
             try:
-                guild_data = await self._driver.get(group.identifier_data)
+                guild_data = await get(group.identifier_data)
             except KeyError:
                 pass
             else:
-                ret = self._all_members_from_guild(guild_data)
+                ret = self._all_members_from_guild(guild_data, copy)
         return ret
 
+    def _check_values(self, values: Iterable[Value]) -> None:
+        for value_obj in values:
+            if value_obj._config is not self:
+                raise ValueError(f"{value_obj!r} does not belong to this Config instance.")
+
+    async def get_many(self, values: Iterable[Value]) -> List[Any]:
+        """Get the data of multiple values at once.
+
+        This is equivalent to awaiting each of the values, but only
+        takes a single round-trip to the storage backend.
+
+        Example
+        -------
+        ::
+
+            balances = await config.get_many(
+                config.member_from_ids(guild_id, member_id).balance
+                for member_id in member_ids
+            )
+
+        Parameters
+        ----------
+        values : Iterable[Value]
+            `Value` or `Group` objects obtained from this Config instance.
+
+        Returns
+        -------
+        List[Any]
+            The data of the values, in the same order as ``values``.
+            Registered defaults are used for data which has not been set.
+
+        Raises
+        ------
+        ValueError
+            If any of the values does not belong to this Config instance.
+
+        """
+        values = list(values)
+        self._check_values(values)
+        raws = await self._driver.get_many([v.identifier_data for v in values], ...)
+        return [value_obj._resolve(raw) for value_obj, raw in zip(values, raws)]
+
+    async def set_many(self, items: Union[Mapping[Value, Any], Iterable[Tuple[Value, Any]]]):
+        """Set the data of multiple values at once.
+
+        This is equivalent to calling `Value.set` for each of the items,
+        but only takes a single round-trip to the storage backend.
+
+        Example
+        -------
+        ::
+
+            await config.set_many(
+                (config.member_from_ids(guild_id, member_id).balance, 0)
+                for member_id in member_ids
+            )
+
+        Parameters
+        ----------
+        items : Union[Mapping[Value, Any], Iterable[Tuple[Value, Any]]]
+            Pairs of `Value` or `Group` objects obtained from this Config
+            instance and their new values.
+
+        Raises
+        ------
+        ValueError
+            If any of the values does not belong to this Config instance,
+            or if a `Group` is set to a value which is not a dict.
+
+        """
+        if isinstance(items, collections.abc.Mapping):
+            items = items.items()
+        items = list(items)
+        self._check_values(value_obj for value_obj, _value in items)
+        await self._driver.set_many(
+            [(value_obj.identifier_data, value_obj._prepare(value)) for value_obj, value in items]
+        )
+
+    async def clear_many(self, values: Iterable[Value]):
+        """Clear the data of multiple values at once.
+
+        This is equivalent to calling `Value.clear` for each of the values,
+        but only takes a single round-trip to the storage backend.
+
+        Parameters
+        ----------
+        values : Iterable[Value]
+            `Value` or `Group` objects obtained from this Config instance.
+
+        Raises
+        ------
+        ValueError
+            If any of the values does not belong to this Config instance.
+
+        """
+        values = list(values)
+        self._check_values(values)
+        await self._driver.clear_many([v.identifier_data for v in values])
+
     async def _clear_scope(self, *scopes: str):
         """Clear all data in a particular scope.
 
@@ -1152,33 +1152,32 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         # qualified name might be different if alias was passed to this command
         command_name = command and command.qualified_name
 
+        embed_settings = self.bot._embed_settings_cache
         text = _("Embed settings:\n\n")
-        global_default = await self.bot._config.embeds()
+        global_default = await embed_settings.get_global()
         text += _("Global default: {value}\n").format(value=global_default)
 
         if command_name is not None:
-            scope = self.bot._config.custom("COMMAND", command_name, 0)
-            global_command_setting = await scope.embeds()
+            global_command_setting = await embed_settings.get_command(command_name, 0)
             text += _("Global command setting for {command} command: {value}\n").format(
                 command=inline(command_name), value=global_command_setting
             )
 
         if ctx.guild:
-            guild_setting = await self.bot._config.guild(ctx.guild).embeds()
+            guild_setting = await embed_settings.get_guild(ctx.guild.id)
             text += _("Guild setting: {value}\n").format(value=guild_setting)
 
             if command_name is not None:
-                scope = self.bot._config.custom("COMMAND", command_name, ctx.guild.id)
-                command_setting = await scope.embeds()
+                command_setting = await embed_settings.get_command(command_name, ctx.guild.id)
                 text += _("Server command setting for {command} command: {value}\n").format(
                     command=inline(command_name), value=command_setting
                 )
 
         if ctx.channel:
-            channel_setting = await self.bot._config.channel(ctx.channel).embeds()
+            channel_setting = await embed_settings.get_channel(ctx.channel.id)
             text += _("Channel setting: {value}\n").format(value=channel_setting)
 
-        user_setting = await self.bot._config.user(ctx.author).embeds()
+        user_setting = await embed_settings.get_user(ctx.author.id)
         text += _("User setting: {value}").format(value=user_setting)
         await ctx.send(box(text))
 
@@ -1196,12 +1195,13 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Example:**
         - `[p]embedset global`
         """
-        current = await self.bot._config.embeds()
+        embed_settings = self.bot._embed_settings_cache
+        current = await embed_settings.get_global()
         if current:
-            await self.bot._config.embeds.set(False)
+            await embed_settings.set_global(False)
             await ctx.send(_("Embeds are now disabled by default."))
         else:
-            await self.bot._config.embeds.clear()
+            await embed_settings.set_global(None)
             await ctx.send(_("Embeds are now enabled by default."))
 
     @embedset.command(name="server", aliases=["guild"])
@@ -1226,11 +1226,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         - `[enabled]` - Whether to use embeds on this server. Leave blank to reset to default.
         """
         if enabled is None:
-            await self.bot._config.guild(ctx.guild).embeds.clear()
+            await self.bot._embed_settings_cache.set_guild(ctx.guild.id, None)
             await ctx.send(_("Embeds will now fall back to the global setting."))
             return
 
-        await self.bot._config.guild(ctx.guild).embeds.set(enabled)
+        await self.bot._embed_settings_cache.set_guild(ctx.guild.id, enabled)
         await ctx.send(
             _("Embeds are now enabled for this guild.")
             if enabled
@@ -1304,11 +1304,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         command_name = command.qualified_name
 
         if enabled is None:
-            await self.bot._config.custom("COMMAND", command_name, 0).embeds.clear()
+            await self.bot._embed_settings_cache.set_command(command_name, 0, None)
             await ctx.send(_("Embeds will now fall back to the global setting."))
             return
 
-        await self.bot._config.custom("COMMAND", command_name, 0).embeds.set(enabled)
+        await self.bot._embed_settings_cache.set_command(command_name, 0, enabled)
         if enabled:
             await ctx.send(
                 _("Embeds are now enabled for {command_name} command.").format(
@@ -1349,11 +1349,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         command_name = command.qualified_name
 
         if enabled is None:
-            await self.bot._config.custom("COMMAND", command_name, ctx.guild.id).embeds.clear()
+            await self.bot._embed_settings_cache.set_command(command_name, ctx.guild.id, None)
             await ctx.send(_("Embeds will now fall back to the server setting."))
             return
 
-        await self.bot._config.custom("COMMAND", command_name, ctx.guild.id).embeds.set(enabled)
+        await self.bot._embed_settings_cache.set_command(command_name, ctx.guild.id, enabled)
         if enabled:
             await ctx.send(
                 _("Embeds are now enabled for {command_name} command.").format(
@@ -1398,11 +1398,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             - `[enabled]` - Whether to use embeds in this channel. Leave blank to reset to default.
         """
         if enabled is None:
-            await self.bot._config.channel(channel).embeds.clear()
+            await self.bot._embed_settings_cache.set_channel(channel.id, None)
             await ctx.send(_("Embeds will now fall back to the global setting."))
             return
 
-        await self.bot._config.channel(channel).embeds.set(enabled)
+        await self.bot._embed_settings_cache.set_channel(channel.id, enabled)
         await ctx.send(
             _("Embeds are now {} for this channel.").format(
                 _("enabled") if enabled else _("disabled")
@@ -1429,11 +1429,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         - `[enabled]` - Whether to use embeds in your DMs. Leave blank to reset to default.
         """
         if enabled is None:
-            await self.bot._config.user(ctx.author).embeds.clear()
+            await self.bot._embed_settings_cache.set_user(ctx.author.id, None)
             await ctx.send(_("Embeds will now fall back to the global setting."))
             return
 
-        await self.bot._config.user(ctx.author).embeds.set(enabled)
+        await self.bot._embed_settings_cache.set_user(ctx.author.id, enabled)
         await ctx.send(
             _("Embeds are now enabled for you in DMs.")
             if enabled
@@ -3,7 +3,21 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal, Union, Optional, cast, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+    TYPE_CHECKING,
+)
 
 import discord
 
@@ -32,6 +46,7 @@ __all__ = (
     "get_latest_case",
     "get_all_cases",
     "get_cases_for_member",
+    "aiter_cases",
     "create_case",
     "get_casetype",
     "get_all_casetypes",
@@ -53,6 +68,122 @@ _data_deletion_lock = asyncio.Lock()
 
 _ = Translator("ModLog", __file__)
 
+# Maximum number of concurrent API requests when fetching the users of many cases.
+_USER_FETCH_CONCURRENCY = 5
+# ID used in place of IDs of the users whose data has been deleted.
+_DELETED_USER_ID = 0xDE1
+
+# (user ID, moderator ID, action type)
+_CaseIndexEntry = Tuple[Optional[int], Optional[int], Optional[str]]
+
+
+class _CaseIndex:
+    """Case numbers of a guild's cases by target user, moderator and action type.
+
+    The index is loaded lazily on first use and then kept up to date
+    by the functions modifying the cases.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.lock = asyncio.Lock()
+        self.entries: Dict[int, _CaseIndexEntry] = {}
+        self.by_user: Dict[Optional[int], Set[int]] = {}
+        self.by_moderator: Dict[Optional[int], Set[int]] = {}
+        self.by_action_type: Dict[Optional[str], Set[int]] = {}
+        # Changes done while the index was being loaded, `None` for removed cases.
+        self._pending: Dict[int, Optional[_CaseIndexEntry]] = {}
+
+    @staticmethod
+    def _entry(data: Mapping[str, Any]) -> _CaseIndexEntry:
+        return data.get("user"), data.get("moderator"), data.get("action_type")
+
+    def load(self, cases: Mapping[str, Mapping[str, Any]]) -> None:
+        for case_number, data in cases.items():
+            self._add(int(case_number), self._entry(data))
+        for case_number, entry in self._pending.items():
+            self._remove(case_number)
+            if entry is not None:
+                self._add(case_number, entry)
+        self._pending.clear()
+        self.loaded = True
+
+    def update(self, case_number: int, data: Optional[Mapping[str, Any]]) -> None:
+        """Update the entry of a case, or remove it if ``data`` is `None`."""
+        entry = None if data is None else self._entry(data)
+        if not self.loaded:
+            self._pending[case_number] = entry
+            return
+        self._remove(case_number)
+        if entry is not None:
+            self._add(case_number, entry)
+
+    def _add(self, case_number: int, entry: _CaseIndexEntry) -> None:
+        self.entries[case_number] = entry
+        user_id, moderator_id, action_type = entry
+        self.by_user.setdefault(user_id, set()).add(case_number)
+        self.by_moderator.setdefault(moderator_id, set()).add(case_number)
+        self.by_action_type.setdefault(action_type, set()).add(case_number)
+
+    def _remove(self, case_number: int) -> None:
+        entry = self.entries.pop(case_number, None)
+        if entry is None:
+            return
+        for mapping, key in zip((self.by_user, self.by_moderator, self.by_action_type), entry):
+            case_numbers = mapping[key]
+            case_numbers.discard(case_number)
+            if not case_numbers:
+                del mapping[key]
+
+    def find(
+        self,
+        *,
+        user_id: Optional[int] = None,
+        moderator_id: Optional[int] = None,
+        action_type: Optional[str] = None,
+    ) -> List[int]:
+        """Get sorted numbers of the cases matching all of the given criteria."""
+        candidates = [
+            mapping.get(key, set())
+            for mapping, key in (
+                (self.by_user, user_id),
+                (self.by_moderator, moderator_id),
+                (self.by_action_type, action_type),
+            )
+            if key is not None
+        ]
+        if not candidates:
+            return sorted(self.entries)
+        candidates.sort(key=len)
+        return sorted(candidates[0].intersection(*candidates[1:]))
+
+
+# Case indexes by guild ID.
+_case_indexes: Dict[int, _CaseIndex] = {}
+
+
+async def _get_case_index(guild_id: int) -> _CaseIndex:
+    index = _case_indexes.get(guild_id)
+    if index is None:
+        index = _case_indexes[guild_id] = _CaseIndex()
+    if not index.loaded:
+        async with index.lock:
+            if not index.loaded:
+                index.load(await _config.custom(_CASES, str(guild_id)).all(copy=False))
+    return index
+
+
+def _update_case_index(guild_id: int, case_number: int, data: Optional[dict]) -> None:
+    index = _case_indexes.get(guild_id)
+    if index is not None:
+        index.update(case_number, data)
+
+
+async def _save_case(case: Case) -> None:
+    data = case.to_json()
+    await _config.custom(_CASES, str(case.guild.id), str(case.case_number)).set(data)
+    _update_case_index(case.guild.id, case.case_number, data)
+
 
 async def _process_data_deletion(
     *, requester: Literal["discord_deleted_user", "owner", "user", "user_strict"], user_id: int
@@ -76,18 +207,22 @@ async def _process_data_deletion(
             for guild_id_str, case_num_str in key_paths:
                 case = all_cases[guild_id_str][case_num_str]
                 if (case.get("user", 0) or 0) == user_id:
-                    case["user"] = 0xDE1
+                    case["user"] = _DELETED_USER_ID
                     case.pop("last_known_username", None)
                 if (case.get("moderator", 0) or 0) == user_id:
-                    case["moderator"] = 0xDE1
+                    case["moderator"] = _DELETED_USER_ID
                 if (case.get("amended_by", 0) or 0) == user_id:
-                    case["amended_by"] = 0xDE1
+                    case["amended_by"] = _DELETED_USER_ID
+
+        # The affected cases could be in any guild, it's simpler to just rebuild the indexes.
+        _case_indexes.clear()
 
 
 async def _init(bot: Red):
     global _config
     global _bot_ref
     _bot_ref = bot
+    _case_indexes.clear()
     _config = Config.get_conf(None, 1354799444, cog_name="ModLog")
     _config.register_global(schema_version=1)
     _config.register_guild(mod_log=None, casetypes={}, latest_case_number=0)
@@ -306,7 +441,7 @@ class Case:
         # in order to avoid making an API request to "edit" the message with changes.
         # In all other cases, edit() is correct method.
         self.message = message
-        await _config.custom(_CASES, str(self.guild.id), str(self.case_number)).set(self.to_json())
+        await _save_case(self)
 
     async def edit(self, data: dict):
         """
@@ -338,7 +473,7 @@ class Case:
         if isinstance(self.channel, discord.Thread):
             self.parent_channel_id = self.channel.parent_id
 
-        await _config.custom(_CASES, str(self.guild.id), str(self.case_number)).set(self.to_json())
+        await _save_case(self)
         self.bot.dispatch("modlog_case_edit", self)
         if not self.message:
             return
@@ -634,6 +769,21 @@ class Case:
         `discord.HTTPException`
             A generic API issue
         """
+        return cls._from_json(mod_channel, bot, case_number, data, {}, **kwargs)
+
+    @classmethod
+    def _from_json(
+        cls,
+        mod_channel: Optional[
+            Union[discord.TextChannel, discord.VoiceChannel, discord.StageChannel]
+        ],
+        bot: Red,
+        case_number: int,
+        data: dict,
+        users: Mapping[int, Union[discord.abc.User, int]],
+        **kwargs,
+    ):
+        # `users` maps IDs to already resolved users, see `_resolve_users()`.
         guild = kwargs.get("guild") or mod_channel.guild
 
         message = kwargs.get("message")
@@ -650,6 +800,8 @@ class Case:
                 user_id = data.get(user_key)
                 if user_id is None:
                     user_object = None
+                elif user_id in users:
+                    user_object = users[user_id]
                 else:
                     user_object = bot.get_user(user_id) or user_id
             user_objects[user_key] = user_object
@@ -840,7 +992,9 @@ async def get_latest_case(guild: discord.Guild, bot: Red) -> Optional[Case]:
         return await get_case(case_number, guild, bot)
 
 
-async def get_all_cases(guild: discord.Guild, bot: Red) -> List[Case]:
+async def get_all_cases(
+    guild: discord.Guild, bot: Red, *, fetch_users: bool = False
+) -> List[Case]:
     """
     Gets all cases for the specified guild
 
@@ -850,26 +1004,31 @@ async def get_all_cases(guild: discord.Guild, bot: Red) -> List[Case]:
         The guild to get the cases from
     bot: Red
         The bot's instance
+    fetch_users: bool
+        Whether to fetch the users which are not in the bot's cache from Discord.
+        Each user is only fetched once. Defaults to ``False``.
 
     Returns
     -------
     list
         A list of all cases for the guild
 
+    Raises
+    ------
+    `discord.HTTPException`
+        Fetching a user failed.
+
     """
-    cases = await _config.custom(_CASES, str(guild.id)).all()
-    try:
-        mod_channel = await get_modlog_channel(guild)
-    except RuntimeError:
-        mod_channel = None
-    return [
-        await Case.from_json(mod_channel, bot, case_number, case_data, guild=guild)
-        for case_number, case_data in cases.items()
-    ]
+    return [case async for case in aiter_cases(guild, bot, fetch_users=fetch_users)]
 
 
 async def get_cases_for_member(
-    guild: discord.Guild, bot: Red, *, member: discord.Member = None, member_id: int = None
+    guild: discord.Guild,
+    bot: Red,
+    *,
+    member: discord.Member = None,
+    member_id: int = None,
+    fetch_users: bool = False,
 ) -> List[Case]:
     """
     Gets all cases for the specified member or member id in a guild.
@@ -884,6 +1043,9 @@ async def get_cases_for_member(
         The member to get cases about
     member_id: int
         The id of the member to get cases about
+    fetch_users: bool
+        Whether to fetch the users which are not in the bot's cache from Discord.
+        Each user is only fetched once. Defaults to ``False``.
 
     Returns
     -------
@@ -899,9 +1061,6 @@ async def get_cases_for_member(
     `discord.HTTPException`
         Fetching the user failed.
     """
-
-    cases = await _config.custom(_CASES, str(guild.id)).all()
-
     if not (member_id or member):
         raise ValueError("Expected a member or a member id to be provided.") from None
 
@@ -909,20 +1068,148 @@ async def get_cases_for_member(
         member_id = member.id
 
     if not member:
-        member = bot.get_user(member_id) or member_id
+        member = (await _resolve_users(bot, [member_id], fetch=fetch_users))[member_id]
+
+    index = await _get_case_index(guild.id)
+    return await _get_cases(
+        guild, bot, index.find(user_id=member_id), fetch_users=fetch_users, user=member
+    )
+
+
+async def aiter_cases(
+    guild: discord.Guild,
+    bot: Red,
+    *,
+    member_id: Optional[int] = None,
+    moderator_id: Optional[int] = None,
+    action_type: Optional[str] = None,
+    reverse: bool = False,
+    batch_size: int = 100,
+    fetch_users: bool = False,
+) -> AsyncIterator[Case]:
+    """
+    Iterate over the cases of the specified guild, in order of their case numbers.
+
+    The cases are fetched and hydrated lazily, in batches, so that listing
+    them does not require loading every case of the guild.
+
+    Example
+    -------
+    ::
+
+        async for case in modlog.aiter_cases(guild, bot, moderator_id=ctx.author.id):
+            ...
+
+    Parameters
+    ----------
+    guild: `discord.Guild`
+        The guild to get the cases from
+    bot: Red
+        The bot's instance
+    member_id: Optional[int]
+        If given, only cases about the member with this id are returned.
+    moderator_id: Optional[int]
+        If given, only cases created by the moderator with this id are returned.
+    action_type: Optional[str]
+        If given, only cases with this action type are returned.
+    reverse: bool
+        Whether to iterate from the latest case. Defaults to ``False``.
+    batch_size: int
+        The number of cases to fetch at a time. Defaults to 100.
+    fetch_users: bool
+        Whether to fetch the users which are not in the bot's cache from Discord.
+        Each user is only fetched once per batch. Defaults to ``False``.
+
+    Yields
+    ------
+    Case
+        The cases matching all of the given criteria.
 
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` is not a positive number.
+    `discord.HTTPException`
+        Fetching a user failed.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive number.")
+    index = await _get_case_index(guild.id)
+    case_numbers = index.find(
+        user_id=member_id, moderator_id=moderator_id, action_type=action_type
+    )
+    if reverse:
+        case_numbers.reverse()
+    for start in range(0, len(case_numbers), batch_size):
+        batch = case_numbers[start : start + batch_size]
+        for case in await _get_cases(guild, bot, batch, fetch_users=fetch_users):
+            yield case
+
+
+async def _get_cases(
+    guild: discord.Guild,
+    bot: Red,
+    case_numbers: Iterable[int],
+    *,
+    fetch_users: bool = False,
+    **kwargs,
+) -> List[Case]:
+    case_numbers = list(case_numbers)
+    if not case_numbers:
+        return []
+    guild_id = str(guild.id)
+    cases = await _config.get_many(
+        _config.custom(_CASES, guild_id, str(case_number)) for case_number in case_numbers
+    )
+    user_ids = [
+        user_id
+        for case_data in cases
+        for user_key in ("user", "moderator", "amended_by")
+        if user_key not in kwargs and (user_id := case_data.get(user_key)) is not None
+    ]
+    users = await _resolve_users(bot, user_ids, fetch=fetch_users)
     try:
-        modlog_channel = await get_modlog_channel(guild)
+        mod_channel = await get_modlog_channel(guild)
     except RuntimeError:
-        modlog_channel = None
-
-    cases = [
-        await Case.from_json(modlog_channel, bot, case_number, case_data, user=member, guild=guild)
-        for case_number, case_data in cases.items()
-        if case_data["user"] == member_id
+        mod_channel = None
+    return [
+        Case._from_json(mod_channel, bot, case_number, case_data, users, guild=guild, **kwargs)
+        for case_number, case_data in zip(case_numbers, cases)
+        if case_data
     ]
 
-    return cases
+
+async def _resolve_users(
+    bot: Red, user_ids: Iterable[int], *, fetch: bool
+) -> Dict[int, Union[discord.abc.User, int]]:
+    """Resolve user IDs to users from the bot's cache, or by fetching them if ``fetch`` is True.
+
+    Each unique ID is only resolved once. IDs of users that couldn't be found are mapped
+    to themselves.
+    """
+    resolved: Dict[int, Union[discord.abc.User, int]] = {}
+    missing = []
+    for user_id in set(user_ids):
+        user = bot.get_user(user_id)
+        if user is None:
+            resolved[user_id] = user_id
+            if user_id != _DELETED_USER_ID:
+                missing.append(user_id)
+        else:
+            resolved[user_id] = user
+
+    if fetch and missing:
+        semaphore = asyncio.Semaphore(_USER_FETCH_CONCURRENCY)
+
+        async def fetch_user(user_id: int) -> None:
+            async with semaphore:
+                try:
+                    resolved[user_id] = await bot.fetch_user(user_id)
+                except discord.NotFound:
+                    pass
+
+        await asyncio.gather(*(fetch_user(user_id) for user_id in missing))
+    return resolved
 
 
 async def create_case(
@@ -1018,7 +1305,7 @@ async def create_case(
             message=None,
             last_known_username=last_known_username,
         )
-        await _config.custom(_CASES, str(guild.id), str(next_case_number)).set(case.to_json())
+        await _save_case(case)
         await _config.guild(guild).latest_case_number.set(next_case_number)
 
     await set_contextual_locales_from_guild(bot, guild)
@@ -1266,6 +1553,7 @@ async def reset_cases(guild: discord.Guild) -> None:
     """
     await _config.custom(_CASES, str(guild.id)).clear()
     await _config.guild(guild).latest_case_number.clear()
+    _case_indexes.pop(guild.id, None)
 
 
 def _strfdelta(delta):
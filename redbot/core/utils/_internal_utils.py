@@ -21,6 +21,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Union,
     TypeVar,
@@ -216,7 +217,17 @@ async def format_fuzzy_results(
         return "Perhaps you wanted one of these? " + box("\n".join(lines), lang="vhdl")
 
 
-async def create_backup(dest: Path = Path.home()) -> Optional[Path]:
+async def create_backup(
+    dest: Path = Path.home(),
+    *,
+    excluded_files: Iterable[Path] = (),
+    extra_files: Optional[Mapping[str, Path]] = None,
+) -> Optional[Path]:
+    """Create a backup of the data path.
+
+    ``excluded_files`` are left out of the backup, and ``extra_files``
+    are added to it, keyed by their path in the backup.
+    """
     data_path = Path(data_manager.core_data_path().parent)
     if not data_path.exists():
         return None
@@ -249,13 +260,17 @@ async def create_backup(dest: Path = Path.home()) -> Optional[Path]:
     instance_file = data_path / "instance.json"
     with instance_file.open("w") as fs:
         json.dump({data_manager.instance_name(): data_manager.basic_config}, fs, indent=4)
+    excluded = {f.resolve() for f in excluded_files}
     for f in data_path.glob("**/*"):
         if not any(ex in str(f) for ex in exclusions) and f.is_file():
-            to_backup.append(f)
+            if f.resolve() not in excluded:
+                to_backup.append(f)
 
     with tarfile.open(str(backup_fpath), "w:gz") as tar:
         for f in to_backup:
             tar.add(str(f), arcname=str(f.relative_to(data_path)), recursive=False)
+        for arcname, f in (extra_files or {}).items():
+            tar.add(str(f), arcname=arcname, recursive=False)
     return backup_fpath
 
 
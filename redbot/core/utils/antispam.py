@@ -1,10 +1,28 @@
-from datetime import datetime, timedelta
-from typing import Tuple, List
-from collections import namedtuple
+import time
+from collections import OrderedDict, deque
+from datetime import timedelta
+from typing import Deque, Hashable, Iterator, List, Tuple
 
-__all__ = ("AntiSpam",)
+__all__ = ("AntiSpam", "KeyedAntiSpam")
 
-_AntiSpamInterval = namedtuple("_AntiSpamInterval", ["period", "frequency"])
+# (period in seconds, frequency)
+_Interval = Tuple[float, int]
+
+
+def _prepare_intervals(intervals: List[Tuple[timedelta, int]]) -> List[_Interval]:
+    return [(period.total_seconds(), frequency) for period, frequency in intervals]
+
+
+def _is_spammy(stamps: Deque[float], intervals: List[_Interval], now: float) -> bool:
+    # `stamps` holds the most recent monotonic timestamps in ascending order, at least
+    # as many as the highest frequency, so the interval's limit has been reached
+    # if the frequency-th most recent stamp is still within its period.
+    for period, frequency in intervals:
+        if frequency <= 0:
+            return True
+        if len(stamps) >= frequency and stamps[-frequency] + period > now:
+            return True
+    return False
 
 
 class AntiSpam:
@@ -88,6 +106,8 @@ class AntiSpam:
     # with insertion of the antispam element into context
     # for manual stamping on successful command completion
 
+    __slots__ = ("_intervals", "_stamps")
+
     default_intervals = [
         (timedelta(seconds=5), 3),
         (timedelta(minutes=1), 5),
@@ -96,15 +116,10 @@ class AntiSpam:
     ]
 
     def __init__(self, intervals: List[Tuple[timedelta, int]]):
-        self.__event_timestamps = []
-        _itvs = intervals or self.default_intervals
-        self.__intervals = [_AntiSpamInterval(*x) for x in _itvs]
-        self.__discard_after = max([x.period for x in self.__intervals])
-
-    def __interval_check(self, interval: _AntiSpamInterval):
-        return (
-            len([t for t in self.__event_timestamps if (t + interval.period) > datetime.utcnow()])
-            >= interval.frequency
+        self._intervals = _prepare_intervals(intervals or self.default_intervals)
+        # Only the stamps needed to check the interval with the highest frequency are kept.
+        self._stamps: Deque[float] = deque(
+            maxlen=max(frequency for _period, frequency in self._intervals)
         )
 
     @property
@@ -113,7 +128,7 @@ class AntiSpam:
         Whether, for any interval, the number of events that happened
         within that interval exceeds the number specified for that interval.
         """
-        return any(self.__interval_check(x) for x in self.__intervals)
+        return _is_spammy(self._stamps, self._intervals, time.monotonic())
 
     def stamp(self):
         """
@@ -123,7 +138,108 @@ class AntiSpam:
         The stamp will last until the corresponding interval duration
         has expired (set when this AntiSpam object was initiated).
         """
-        self.__event_timestamps.append(datetime.utcnow())
-        self.__event_timestamps = [
-            t for t in self.__event_timestamps if t + self.__discard_after > datetime.utcnow()
-        ]
+        self._stamps.append(time.monotonic())
+
+
+class KeyedAntiSpam:
+    """
+    A container of `AntiSpam`-like counters, one per key, sharing the same intervals.
+
+    Unlike a dict of `AntiSpam` objects, this evicts the counters of keys whose
+    events all happened longer ago than the longest interval, so it can be used
+    to track a large number of keys (e.g. users) without growing indefinitely.
+
+    Examples
+    --------
+    Tracking whether the number of reports sent by a user within a single guild is spammy:
+
+    .. code-block:: python
+
+        class MyCog(commands.Cog):
+            def __init__(self, bot):
+                self.bot = bot
+                self.antispam = KeyedAntiSpam(INTERVALS)
+
+            @commands.guild_only()
+            @commands.command()
+            async def report(self, ctx, content):
+                key = (ctx.guild.id, ctx.author.id)
+                if self.antispam.spammy(key):
+                    await ctx.send(
+                        "You've sent too many reports recently, please try again later."
+                    )
+                    return
+
+                self.antispam.stamp(key)
+                # Save the report...
+
+    Parameters
+    ----------
+    intervals : List[Tuple[datetime.timedelta, int]]
+        Same as the ``intervals`` argument of `AntiSpam`.
+    """
+
+    __slots__ = ("_intervals", "_max_frequency", "_ttl", "_stamps")
+
+    def __init__(self, intervals: List[Tuple[timedelta, int]]):
+        self._intervals = _prepare_intervals(intervals or AntiSpam.default_intervals)
+        self._max_frequency = max(frequency for _period, frequency in self._intervals)
+        # Stamps older than the longest interval don't affect any check anymore.
+        self._ttl = max(period for period, _frequency in self._intervals)
+        # Ordered by the time of the last stamp, oldest first.
+        self._stamps: "OrderedDict[Hashable, Deque[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._stamps
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._stamps)
+
+    def spammy(self, key: Hashable) -> bool:
+        """
+        Whether, for any interval, the number of events that happened for the given key
+        within that interval exceeds the number specified for that interval.
+        """
+        now = time.monotonic()
+        self._evict(now)
+        stamps = self._stamps.get(key)
+        if stamps is None:
+            return _is_spammy(deque(), self._intervals, now)
+        return _is_spammy(stamps, self._intervals, now)
+
+    def stamp(self, key: Hashable) -> None:
+        """
+        Mark an event timestamp for the given key happening right now.
+        """
+        now = time.monotonic()
+        self._evict(now)
+        stamps = self._stamps.get(key)
+        if stamps is None:
+            stamps = self._stamps[key] = deque(maxlen=self._max_frequency)
+        else:
+            self._stamps.move_to_end(key)
+        stamps.append(now)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Forget all events of the given key.
+        """
+        self._stamps.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Forget all events of all keys.
+        """
+        self._stamps.clear()
+
+    def _evict(self, now: float) -> None:
+        # Amortized O(1), as each key is evicted at most once per stamp.
+        stamps_map = self._stamps
+        while stamps_map:
+            key, stamps = next(iter(stamps_map.items()))
+            if stamps and stamps[-1] + self._ttl > now:
+                break
+            del stamps_map[key]
@@ -0,0 +1,230 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+__all__ = ("ExpiryScheduler",)
+
+log = logging.getLogger("red.core.utils.scheduler")
+
+_K = TypeVar("_K", bound=Hashable)
+
+# Upper bound for a single sleep, so that changes to the system clock are noticed.
+_MAX_SLEEP = 300
+
+
+class ExpiryScheduler(Generic[_K]):
+    """
+    Calls a coroutine function for keys once their expiration times pass.
+
+    Expiration times are kept in a min-heap, so scheduling a key takes
+    ``O(log n)`` time and cancelling one takes ``O(1)`` time. The scheduler
+    sleeps until the earliest expiration, instead of periodically
+    checking all keys.
+
+    Examples
+    --------
+    Lifting temporary restrictions, one batch of expired restrictions at a time:
+
+    .. code-block:: python
+
+        class MyCog(commands.Cog):
+            def __init__(self, bot):
+                self.bot = bot
+                self.scheduler = ExpiryScheduler(self.lift_restrictions, leeway=1)
+
+            async def cog_load(self):
+                for member_id, until in (await self.config.restrictions()).items():
+                    self.scheduler.schedule(int(member_id), until)
+                self.scheduler.start()
+
+            async def cog_unload(self):
+                self.scheduler.stop()
+
+            async def lift_restrictions(self, member_ids):
+                ...
+
+    Parameters
+    ----------
+    callback : Callable[[List[Hashable]], Awaitable[Any]]
+        Coroutine function which is called with the list of keys that expired.
+        Keys which expire at the same time are passed in a single call.
+        Each call runs in its own task, so a slow callback doesn't delay
+        later expirations. Exceptions raised by it are logged.
+    leeway : float
+        Keys which expire up to this many seconds after an expiring key
+        are expired early, together with it.
+    """
+
+    __slots__ = (
+        "_callback",
+        "_leeway",
+        "_heap",
+        "_entries",
+        "_counter",
+        "_wakeup",
+        "_task",
+        "_tasks",
+    )
+
+    def __init__(self, callback: Callable[[List[_K]], Awaitable[Any]], *, leeway: float = 0.0):
+        self._callback = callback
+        self._leeway = leeway
+        # (expiration time, sequence number, key) - entries of cancelled or rescheduled
+        # keys are left in the heap, and skipped when they reach its top.
+        self._heap: List[Tuple[float, int, _K]] = []
+        # key -> (expiration time, sequence number) of its current heap entry
+        self._entries: Dict[_K, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._entries
+
+    def get(self, key: _K) -> Optional[float]:
+        """
+        Get the expiration time of the given key.
+
+        Returns
+        -------
+        Optional[float]
+            The expiration time as a POSIX timestamp,
+            or ``None`` if the key isn't scheduled.
+        """
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def schedule(self, key: _K, when: float) -> None:
+        """
+        Schedule the key to expire at the given time.
+
+        If the key is already scheduled, its expiration time is replaced.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key.
+        when : float
+            The expiration time as a POSIX timestamp.
+            Times in the past make the key expire right away.
+        """
+        entry = (when, next(self._counter))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (*entry, key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+        if self._wakeup is not None and self._heap[0][1] == entry[1]:
+            # The new key expires first, the sleep needs to be shortened.
+            self._wakeup.set()
+
+    def cancel(self, key: _K) -> bool:
+        """
+        Stop the key from expiring.
+
+        Returns
+        -------
+        bool
+            ``True`` if the key was scheduled.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Cancel all scheduled keys."""
+        self._entries.clear()
+        self._heap.clear()
+
+    def start(self) -> None:
+        """
+        Start expiring keys.
+
+        This has to be called from within a running event loop.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """
+        Stop expiring keys and cancel the callbacks which are still running.
+
+        Scheduled keys are kept, so the scheduler can be started again.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._wakeup = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _compact(self) -> None:
+        self._heap = [(when, seq, key) for key, (when, seq) in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    def _is_current(self, item: Tuple[float, int, _K]) -> bool:
+        when, seq, key = item
+        return self._entries.get(key) == (when, seq)
+
+    def _pop_due(self, now: float) -> List[_K]:
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            item = heapq.heappop(heap)
+            if self._is_current(item):
+                del self._entries[item[2]]
+                due.append(item[2])
+        return due
+
+    def _next_expiration(self) -> Optional[float]:
+        heap = self._heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        while True:
+            wakeup.clear()
+            due = self._pop_due(time.time() + self._leeway)
+            if due:
+                task = asyncio.create_task(self._callback(due))
+                self._tasks.add(task)
+                task.add_done_callback(self._callback_done)
+
+            when = self._next_expiration()
+            if when is None:
+                await wakeup.wait()
+                continue
+            delay = when - time.time()
+            if delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), min(delay, _MAX_SLEEP))
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.error("An unexpected error occurred in an expiry callback.", exc_info=exc)
@@ -7,6 +7,7 @@ import asyncio
 import json
 import logging
 import sys
+import tempfile
 import re
 from copy import deepcopy
 from pathlib import Path
@@ -33,6 +34,9 @@ from redbot.core._drivers import (
 
 conversion_log = logging.getLogger("red.converter")
 
+# Backends which store data in the instance's data path and don't need a database server.
+FILE_BACKENDS = (BackendType.JSON, BackendType.SHARDED_JSON, BackendType.SQLITE)
+
 try:
     config_dir.mkdir(parents=True, exist_ok=True)
 except PermissionError:
@@ -109,13 +113,20 @@ def get_storage_type(backend: Optional[str], *, interactive: bool):
         return get_target_backend(backend)
     if not interactive:
         return BackendType.JSON
-    storage_dict = {1: BackendType.JSON, 2: BackendType.POSTGRES}
+    storage_dict = {
+        1: BackendType.JSON,
+        2: BackendType.POSTGRES,
+        3: BackendType.SHARDED_JSON,
+        4: BackendType.SQLITE,
+    }
     storage = None
     while storage is None:
         print()
         print("Please choose your storage backend.")
         print("1. JSON (file storage, requires no database).")
         print("2. PostgreSQL (Requires a database server)")
+        print("3. Sharded JSON (file storage split into a file per guild, requires no database).")
+        print("4. SQLite (single database file, requires no database server).")
         print("If you're unsure, press [ENTER] to use the recommended default - JSON.")
 
         storage = input("> ")
@@ -263,6 +274,10 @@ def get_target_backend(backend: str) -> BackendType:
         return BackendType.JSON
     elif backend == "postgres":
         return BackendType.POSTGRES
+    elif backend == "sharded-json":
+        return BackendType.SHARDED_JSON
+    elif backend == "sqlite":
+        return BackendType.SQLITE
 
 
 async def do_migration(
@@ -284,16 +299,43 @@ async def do_migration(
     return new_storage_details
 
 
+async def _create_sqlite_backup(driver_cls, destination_folder: Path) -> Optional[Path]:
+    # The database can't be copied file by file while it's open in WAL mode,
+    # so a snapshot of it is backed up in place of the database files.
+    db_path = driver_cls.get_database_path()
+    data_path = data_manager.core_data_path().parent
+    try:
+        arcname = db_path.resolve().relative_to(data_path.resolve())
+    except ValueError:
+        # The database is outside of the data path, back it up to the default location.
+        arcname = data_manager.core_data_path().relative_to(data_path) / db_path.name
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / db_path.name
+        await driver_cls.backup(snapshot)
+        return await red_create_backup(
+            destination_folder,
+            excluded_files=[
+                db_path.with_name(db_path.name + suffix) for suffix in ("", "-wal", "-shm")
+            ],
+            extra_files={str(arcname): snapshot},
+        )
+
+
 async def create_backup(instance: str, destination_folder: Path = Path.home()) -> None:
     data_manager.load_basic_configuration(instance)
     backend_type = get_current_backend(instance)
-    if backend_type != BackendType.JSON:
+    if backend_type not in FILE_BACKENDS:
         await do_migration(backend_type, BackendType.JSON)
     print("Backing up the instance's data...")
     driver_cls = get_driver_class()
     await driver_cls.initialize(**data_manager.storage_details())
-    backup_fpath = await red_create_backup(destination_folder)
-    await driver_cls.teardown()
+    try:
+        if backend_type == BackendType.SQLITE:
+            backup_fpath = await _create_sqlite_backup(driver_cls, destination_folder)
+        else:
+            backup_fpath = await red_create_backup(destination_folder)
+    finally:
+        await driver_cls.teardown()
     if backup_fpath is not None:
         print(f"A backup of {instance} has been made. It is at {backup_fpath}")
     else:
@@ -313,13 +355,13 @@ async def remove_instance(
 
     if interactive is True and delete_data is None:
         msg = "Would you like to delete this instance's data?"
-        if backend != BackendType.JSON:
+        if backend not in FILE_BACKENDS:
             msg += " The database server must be running for this to work."
         delete_data = click.confirm(msg, default=False)
 
     if interactive is True and _create_backup is None:
         msg = "Would you like to make a backup of the data for this instance?"
-        if backend != BackendType.JSON:
+        if backend not in FILE_BACKENDS:
             msg += " The database server must be running for this to work."
         _create_backup = click.confirm(msg, default=False)
 
@@ -407,7 +449,7 @@ async def remove_instance_interaction() -> None:
 )
 @click.option(
     "--backend",
-    type=click.Choice(["json", "postgres"]),
+    type=click.Choice(["json", "postgres", "sharded-json", "sqlite"]),
     default=None,
     help=(
         "Choose a backend type for the new instance."
@@ -523,7 +565,7 @@ def delete(
 
 @cli.command()
 @click.argument("instance", type=click.Choice(instance_list), metavar="<INSTANCE_NAME>")
-@click.argument("backend", type=click.Choice(["json", "postgres"]))
+@click.argument("backend", type=click.Choice(["json", "postgres", "sharded-json", "sqlite"]))
 def convert(instance: str, backend: str) -> None:
     """Convert data backend of an instance."""
     current_backend = get_current_backend(instance)
@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+
+import apsw
+import pytest
+
+from redbot.cogs.audio.apis.db_worker import LATENCY_BUCKETS, DatabaseWorker
+from redbot.cogs.audio.apis.playlist_wrapper import PlaylistWrapper
+from redbot.cogs.audio.core.utilities.miscellaneous import MiscellaneousUtilities
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+
+
+@pytest.fixture
+async def db_worker(tmp_path):
+    worker = DatabaseWorker(APSWConnectionWrapper(tmp_path / "test.db"))
+    yield worker
+    await worker.close()
+
+
+async def test_db_worker(db_worker):
+    await db_worker.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, value TEXT NOT NULL)")
+    assert await db_worker.fetchall("SELECT * FROM t") == []
+
+    # A failing write doesn't undo the other writes, even when they share a transaction.
+    results = await asyncio.gather(
+        db_worker.writemany(
+            "INSERT INTO t VALUES (:id, :value)", [{"id": i, "value": str(i)} for i in range(3)]
+        ),
+        db_worker.write("INSERT INTO t VALUES (?, ?)", (10, None)),
+        db_worker.write("UPDATE t SET value = 'x' WHERE id = ?", (1,)),
+        return_exceptions=True,
+    )
+    assert results[0] is None
+    assert isinstance(results[1], apsw.ConstraintError)
+    assert results[2] is None
+    assert await db_worker.fetchall("SELECT * FROM t ORDER BY id") == [
+        (0, "0"),
+        (1, "x"),
+        (2, "2"),
+    ]
+    assert await db_worker.fetchone("SELECT value FROM t WHERE id = ?", (2,)) == ("2",)
+    assert await db_worker.fetchone("SELECT value FROM t WHERE id = ?", (5,)) is None
+
+    stats = db_worker.get_stats()
+    assert stats["queue_depth"] == 0
+    assert stats["errors"] == 1
+    assert stats["latency"]["write"]["count"] == 3
+    assert sum(stats["latency"]["wait"]["buckets"].values()) == stats["latency"]["wait"]["count"]
+    assert stats["latency"]["write"]["p95"] in (*LATENCY_BUCKETS, float("inf"))
+    assert "1 errors" in MiscellaneousUtilities.format_database_stats(
+        SimpleNamespace(db_worker=db_worker)
+    )
+
+    await db_worker.close()
+    with pytest.raises(RuntimeError):
+        await db_worker.fetchall("SELECT * FROM t")
+
+
+async def test_playlist_wrapper(db_worker):
+    playlist_api = PlaylistWrapper(None, None, db_worker)
+    await playlist_api.init()
+    await playlist_api.upsert("GUILDPLAYLIST", 1, "name", 2, 3, None, [{"info": {}}])
+    playlist = await playlist_api.fetch("GUILDPLAYLIST", 1, 2)
+    assert playlist.playlist_name == "name"
+    assert playlist.tracks == [{"info": {}}]
+    assert len(await playlist_api.fetch_all("GUILDPLAYLIST", 2)) == 1
+
+    await playlist_api.delete("GUILDPLAYLIST", 1, 2)
+    await playlist_api.delete_scheduled()
+    assert await playlist_api.fetch("GUILDPLAYLIST", 1, 2) is None
@@ -0,0 +1,60 @@
+import json
+import time
+
+import pytest
+
+from redbot.cogs.audio.apis.db_worker import DatabaseWorker
+from redbot.cogs.audio.apis.local_db import LocalCacheWrapper
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+
+
+@pytest.fixture
+async def local_cache(tmp_path, config):
+    config.register_global(cache_age=365)
+    worker = DatabaseWorker(APSWConnectionWrapper(tmp_path / "test.db"))
+    local_cache = LocalCacheWrapper(None, config, worker, None)
+    await local_cache.lavalink.init()
+    yield local_cache
+    await worker.close()
+
+
+async def test_youtube_fetch_many(local_cache):
+    now = int(time.time())
+    await local_cache.youtube.upsert_many(
+        [
+            {
+                "track_info": f"track {i}",
+                "track_url": f"url {i}",
+                "last_updated": now,
+                "last_fetched": 0,
+            }
+            for i in range(5)
+        ]
+    )
+    cached = await local_cache.youtube.fetch_many(["track 1", "track 3", "missing", "track 1"])
+    assert {key: url for key, (url, updated_on) in cached.items()} == {
+        "track 1": "url 1",
+        "track 3": "url 3",
+    }
+    assert await local_cache.youtube.fetch_many([]) == {}
+
+    await local_cache.youtube.update_many(["track 1", "track 3"])
+    rows = await local_cache.database.fetchall(
+        "SELECT track_info FROM youtube WHERE last_fetched > 0 ORDER BY track_info"
+    )
+    assert rows == [("track 1",), ("track 3",)]
+
+
+async def test_lavalink_fetch_many(local_cache):
+    now = int(time.time())
+    data = {"loadType": "TRACK_LOADED", "tracks": []}
+    await local_cache.lavalink.upsert_many(
+        [
+            {"query": "a", "data": json.dumps(data), "last_updated": now, "last_fetched": now},
+            # Entries older than the cache age are ignored.
+            {"query": "b", "data": json.dumps(data), "last_updated": 0, "last_fetched": 0},
+        ]
+    )
+    cached = await local_cache.lavalink.fetch_many(["a", "b"])
+    assert list(cached) == ["a"]
+    assert cached["a"][0] == data
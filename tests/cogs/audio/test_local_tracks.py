@@ -0,0 +1,72 @@
+import pytest
+
+from redbot.cogs.audio.apis.db_worker import DatabaseWorker
+from redbot.cogs.audio.apis.local_tracks_wrapper import LocalTracksWrapper
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+
+
+@pytest.fixture
+async def local_tracks(tmp_path):
+    worker = DatabaseWorker(APSWConnectionWrapper(tmp_path / "test.db"))
+    local_tracks = LocalTracksWrapper(None, None, worker)
+    await local_tracks.init()
+    yield local_tracks
+    await worker.close()
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+async def test_local_tracks_index(tmp_path, local_tracks):
+    root = tmp_path / "localtracks"
+    _touch(root / "root.mp3")
+    _touch(root / "album" / "song one.mp3")
+    _touch(root / "album" / "cover.jpg")
+    _touch(root / "album" / "disc 2" / "song two.flac")
+    _touch(root / "other" / "another song.ogg")
+    _touch(root / ".hidden" / "hidden.mp3")
+
+    await local_tracks.refresh(root)
+    assert sorted(await local_tracks.tracks_in_tree(root, root)) == [
+        root / "album" / "disc 2" / "song two.flac",
+        root / "album" / "song one.mp3",
+        root / "other" / "another song.ogg",
+    ]
+    assert sorted(await local_tracks.tracks_in_tree(root, root / "album")) == [
+        root / "album" / "disc 2" / "song two.flac",
+        root / "album" / "song one.mp3",
+    ]
+    assert sorted(await local_tracks.subfolders_in_tree(root, root)) == [
+        root / "album",
+        root / "album" / "disc 2",
+        root / "other",
+    ]
+
+    # Folders are listed again when entries are added to or removed from them.
+    _touch(root / "other" / "new song.mp3")
+    (root / "album" / "disc 2" / "song two.flac").unlink()
+    (root / "album" / "disc 2").rmdir()
+    await local_tracks.refresh(root)
+    assert sorted(await local_tracks.tracks_in_tree(root, root)) == [
+        root / "album" / "song one.mp3",
+        root / "other" / "another song.ogg",
+        root / "other" / "new song.mp3",
+    ]
+    assert sorted(await local_tracks.subfolders_in_tree(root, root / "album")) == [root / "album"]
+
+    assert await local_tracks.search(root, "new") == [root / "other" / "new song.mp3"]
+    # Prefix matches come before fuzzy matches.
+    results = await local_tracks.search(root, "song on")
+    assert results[0] == root / "album" / "song one.mp3"
+    assert root / "other" / "another song.ogg" in results
+
+    # Indexing another folder drops the old index.
+    other_root = tmp_path / "other"
+    _touch(other_root / "folder" / "track.mp3")
+    await local_tracks.refresh(other_root)
+    assert await local_tracks.tracks_in_tree(root, root) == []
+    assert await local_tracks.tracks_in_tree(other_root, other_root) == [
+        other_root / "folder" / "track.mp3"
+    ]
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from lavalink.rest_api import LoadResult
+
+from redbot.cogs.audio.core.utilities import playlists
+from redbot.cogs.audio.core.utilities.playlists import PlaylistUtilities
+
+
+class _Message:
+    def __init__(self):
+        self.embeds = []
+
+    async def edit(self, *, embed):
+        self.embeds.append(embed)
+
+
+async def test_load_v2_playlist_skips_failed_tracks(tmp_path, monkeypatch):
+    track = {"track": "encoded", "info": {"title": "title", "uri": "https://example.com/1"}}
+    message = _Message()
+    created = []
+
+    async def create_playlist(ctx, playlist_api, scope, name, url, tracks, author, guild):
+        created.append(tracks)
+        return SimpleNamespace(name=name, id=1)
+
+    async def send_embed_msg(ctx, **kwargs):
+        return message
+
+    async def fetch_cached_tracks(ctx, queries):
+        return [
+            LoadResult({"loadType": "TRACK_LOADED", "playlistInfo": {}, "tracks": [track]}),
+            # Loading this one fails, since there's no track in it.
+            LoadResult({"loadType": "NO_MATCHES", "playlistInfo": {}, "tracks": []}),
+        ]
+
+    async def embed_colour():
+        return None
+
+    monkeypatch.setattr(playlists, "create_playlist", create_playlist)
+    cog = SimpleNamespace(
+        local_folder_current_path=tmp_path,
+        api_interface=SimpleNamespace(fetch_cached_tracks=fetch_cached_tracks),
+        playlist_api=None,
+        send_embed_msg=send_embed_msg,
+        get_track_json=lambda player, other_track: other_track.track_identifier,
+        humanize_scope=lambda scope, ctx: scope,
+    )
+    ctx = SimpleNamespace(embed_colour=embed_colour)
+    await PlaylistUtilities._load_v2_playlist(
+        cog,
+        ctx,
+        ["https://example.com/1", "https://example.com/2"],
+        None,
+        None,
+        "name",
+        "GLOBALPLAYLIST",
+        None,
+        None,
+    )
+    assert created == [["encoded"]]
+    assert "1 track(s) could not be loaded" in message.embeds[-1].description
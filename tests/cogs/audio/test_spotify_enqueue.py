@@ -0,0 +1,211 @@
+import asyncio
+from types import SimpleNamespace
+
+import lavalink
+import pytest
+
+from redbot.cogs.audio.apis import interface
+from redbot.cogs.audio.apis.interface import AudioAPIInterface
+from redbot.cogs.audio.errors import SpotifyFetchError, YouTubeApiError
+
+
+def _index(url):
+    return int(str(url).rsplit("track", 1)[1])
+
+
+class _Stats:
+    def __init__(self):
+        self.running = {"resolve": 0, "youtube": 0, "lavalink": 0}
+        self.max_running = {"resolve": 0, "youtube": 0, "lavalink": 0}
+        self.started = set()
+        self.cancelled = 0
+
+    async def call(self, kind, delay):
+        self.running[kind] += 1
+        self.max_running[kind] = max(self.max_running[kind], self.running[kind])
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running[kind] -= 1
+
+
+def _setup(config, tmp_path, total, *, global_api=False):
+    config.register_global(cache_level=0, cache_age=365)
+    config.register_guild(maxlength=0, shuffle=False)
+    stats = _Stats()
+    added = []
+
+    async def async_none(*args, **kwargs):
+        return None
+
+    async def queue_duration(ctx):
+        return 0
+
+    async def is_query_allowed(*args, **kwargs):
+        return True
+
+    cog = SimpleNamespace(
+        local_folder_current_path=tmp_path,
+        global_api_user={"can_read": global_api},
+        queue_duration=queue_duration,
+        format_time=str,
+        is_query_allowed=is_query_allowed,
+    )
+    api = AudioAPIInterface(None, config, None, None, cog)
+    api.bot = SimpleNamespace(dispatch=lambda *args: None)
+    api.global_cache_api._get_api_key = async_none
+    api.global_cache_api.get_call = async_none
+
+    async def fetch_from_spotify_api(query_type, uri, params=None, notifier=None):
+        return list(range(total))
+
+    async def get_spotify_track_info(track, ctx):
+        return (None, f"track{track}", None, "artist", f"track{track}", track, "track")
+
+    async def fetch_youtube_cache(tracks_info):
+        # Every third track is already in the YouTube table.
+        return [
+            f"https://www.youtube.com/watch?v={info}" if _index(info) % 3 == 0 else None
+            for info in tracks_info
+        ]
+
+    async def fetch_track(ctx, player, query, forced=False, should_query_global=True):
+        index = _index(query)
+        stats.started.add(index)
+        # The later tracks of the playlist are resolved first.
+        await stats.call("lavalink", (total - index) * 0.002)
+        track = lavalink.Track(
+            {
+                "track": f"encoded{index}",
+                "info": {"title": f"track{index}", "author": "artist", "uri": str(query)},
+            }
+        )
+        return SimpleNamespace(tracks=[track]), True
+
+    api.fetch_from_spotify_api = fetch_from_spotify_api
+    api.spotify_api.get_spotify_track_info = get_spotify_track_info
+    api.fetch_youtube_cache = fetch_youtube_cache
+    api.fetch_track = fetch_track
+
+    player = SimpleNamespace(
+        queue=[],
+        current=True,
+        channel=SimpleNamespace(id=1),
+        guild=None,
+        add=lambda requester, track: added.append(_index(track.title)),
+        maybe_shuffle=lambda: None,
+    )
+
+    async def embed_colour():
+        return None
+
+    ctx = SimpleNamespace(
+        guild=SimpleNamespace(id=1),
+        author=SimpleNamespace(id=1),
+        message=SimpleNamespace(id=1),
+        embed_colour=embed_colour,
+    )
+    return api, player, ctx, stats, added
+
+
+def _enqueue(api, ctx, player):
+    return api.spotify_enqueue(
+        ctx, "playlist", "uri", True, player, lambda ctx, state: None, query_global=True
+    )
+
+
+async def test_spotify_enqueue_order(config, tmp_path):
+    total = 30
+    api, player, ctx, stats, added = _setup(config, tmp_path, total)
+
+    async def fetch_youtube_query(ctx, track_info, current_cache_level=None):
+        index = _index(track_info)
+        stats.started.add(index)
+        # A track is only resolved while it's among the next few to be enqueued.
+        assert index - len(added) < interface._SPOTIFY_ENQUEUE_CONCURRENCY
+        await stats.call("youtube", (total - index) * 0.001)
+        return f"https://www.youtube.com/watch?v={track_info}"
+
+    api.fetch_youtube_query = fetch_youtube_query
+    tracks = await _enqueue(api, ctx, player)
+
+    assert added == list(range(total))
+    assert [track.title for track in tracks] == [f"track{i}" for i in range(total)]
+    assert stats.max_running["youtube"] <= interface._YOUTUBE_API_CONCURRENCY
+    assert 1 < stats.max_running["lavalink"] <= interface._LAVALINK_CONCURRENCY
+
+
+async def test_spotify_enqueue_concurrency(config, tmp_path, monkeypatch):
+    total = 30
+    api, player, ctx, stats, added = _setup(config, tmp_path, total)
+
+    async def fetch_youtube_query(ctx, track_info, current_cache_level=None):
+        index = _index(track_info)
+        stats.started.add(index)
+        assert index - len(added) < interface._SPOTIFY_ENQUEUE_CONCURRENCY
+        # Keep the first track unresolved while the others are resolved.
+        await stats.call("resolve", 0.05 if index == 1 else 0.001)
+        return f"https://www.youtube.com/watch?v={track_info}"
+
+    api.fetch_youtube_query = fetch_youtube_query
+    # Let every resolution call the YouTube API at the same time.
+    api._youtube_api_semaphore = asyncio.Semaphore(total)
+    await _enqueue(api, ctx, player)
+
+    assert added == list(range(total))
+    # Track 1 holds the queue, so the resolvers stop at the concurrency limit.
+    assert stats.max_running["resolve"] <= interface._SPOTIFY_ENQUEUE_CONCURRENCY
+    assert stats.max_running["lavalink"] <= interface._LAVALINK_CONCURRENCY
+
+
+async def test_spotify_enqueue_youtube_api_error(config, tmp_path):
+    total = 30
+    api, player, ctx, stats, added = _setup(config, tmp_path, total)
+
+    async def fetch_youtube_query(ctx, track_info, current_cache_level=None):
+        index = _index(track_info)
+        stats.started.add(index)
+        if index == 5:
+            raise YouTubeApiError("quota exceeded")
+        await stats.call("youtube", 0.01)
+        return f"https://www.youtube.com/watch?v={track_info}"
+
+    api.fetch_youtube_query = fetch_youtube_query
+    with pytest.raises(SpotifyFetchError) as exc_info:
+        await _enqueue(api, ctx, player)
+
+    assert exc_info.value.message == "quota exceeded"
+    # The tracks before the failing one are still enqueued.
+    assert added == [0, 1, 2, 3, 4]
+    # Tracks resolved ahead of the failing one are cancelled, not left running.
+    assert stats.cancelled > 0
+    assert stats.running == {"resolve": 0, "youtube": 0, "lavalink": 0}
+    assert max(stats.started) < 5 + interface._SPOTIFY_ENQUEUE_CONCURRENCY
+    await asyncio.sleep(0.05)
+    assert added == [0, 1, 2, 3, 4]
+
+
+async def test_spotify_enqueue_youtube_api_error_earlier_tracks(config, tmp_path):
+    total = 12
+    api, player, ctx, stats, added = _setup(config, tmp_path, total, global_api=True)
+
+    async def get_spotify(track_name, artist_name):
+        index = _index(track_name)
+        # Track 4 is still waiting on the global API when track 5 fails on the YouTube API.
+        await stats.call("resolve", 0.05 if index in (0, 4) else 0.001)
+        return None
+
+    async def fetch_youtube_query(ctx, track_info, current_cache_level=None):
+        if _index(track_info) == 5:
+            raise YouTubeApiError("quota exceeded")
+        return f"https://www.youtube.com/watch?v={track_info}"
+
+    api.global_cache_api.get_spotify = get_spotify
+    api.fetch_youtube_query = fetch_youtube_query
+    await _enqueue(api, ctx, player)
+
+    # With the global API, the tracks after the failing one are skipped instead of raising.
+    assert added == [0, 1, 2, 3, 4]
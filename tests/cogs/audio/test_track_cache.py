@@ -0,0 +1,66 @@
+import json
+import time
+from types import SimpleNamespace
+
+from redbot.cogs.audio.apis.interface import AudioAPIInterface
+from redbot.cogs.audio.apis.track_cache import TrackCache
+from redbot.cogs.audio.audio_dataclasses import Query
+from redbot.cogs.audio.utils import CacheLevel
+
+
+def test_track_cache():
+    cache = TrackCache(maxsize=2)
+    assert cache.hit_ratio is None
+    data = {"loadType": "TRACK_LOADED", "tracks": [{"info": {"title": "a"}}]}
+    cache.put("a", json.dumps(data), 100)
+    cache.put("b", json.dumps(data), 100)
+
+    # Every lookup returns a copy.
+    first = cache.get("a", 0)
+    assert first == data
+    first["tracks"].clear()
+    assert cache.get("a", 0) == data
+
+    # "b" is the least recently used entry.
+    cache.put("c", json.dumps(data), 100)
+    assert cache.get("b", 0) is None
+    assert len(cache) == 2
+
+    # Entries expire like they do in the Lavalink table.
+    assert cache.get("c", 100) is None
+    assert len(cache) == 1
+    assert cache.hits == 2
+    assert cache.hit_ratio == 0.5
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hit_ratio is None
+
+
+async def test_fetch_track_from_memory(config, tmp_path):
+    config.register_global(cache_level=CacheLevel.all().value, cache_age=365)
+
+    async def get_lyrics_status(ctx):
+        return False
+
+    cog = SimpleNamespace(
+        local_folder_current_path=tmp_path,
+        global_api_user={"can_read": False},
+        get_lyrics_status=get_lyrics_status,
+    )
+    api = AudioAPIInterface(None, config, None, None, cog)
+    query = Query.process_input("https://www.youtube.com/watch?v=dQw4w9WgXcQ", tmp_path)
+    data = {
+        "loadType": "TRACK_LOADED",
+        "playlistInfo": {},
+        "tracks": [{"track": "encoded", "info": {"title": "title"}}],
+    }
+    api.track_cache.put(str(query), json.dumps(data), int(time.time()))
+
+    ctx = SimpleNamespace(message=SimpleNamespace(id=1))
+    result, called_api = await api.fetch_track(ctx, None, query)
+    assert not called_api
+    assert result.tracks[0].title == "title"
+    # Only the last fetched time of the entry is updated, the entry itself isn't saved again.
+    assert api._tasks[1]["update"] == [("lavalink", {"query": str(query)})]
+    assert api._tasks[1]["insert"] == []
@@ -1,3 +1,5 @@
+from collections import namedtuple
+
 import pytest
 from redbot.pytest.economy import *
 
@@ -73,3 +75,58 @@ async def test_nonint_transaction_amount(bank, member_factory):
         await bank.withdraw_credits(mbr1, 1.0)
     with pytest.raises(TypeError):
         await bank.transfer_credits(mbr1, mbr2, 1.0)
+
+
+async def test_bank_leaderboard(bank, empty_guild):
+    mock_member = namedtuple("Member", "id guild display_name")
+    members = [mock_member(idx, empty_guild, f"Member {idx}") for idx in range(1, 6)]
+    for idx, member in enumerate(members):
+        await bank.set_balance(member, idx * 100)
+    leaderboard = await bank.get_leaderboard(guild=empty_guild)
+    assert [user_id for user_id, _acc in leaderboard] == [5, 4, 3, 2, 1]
+    assert leaderboard[0][1]["balance"] == 400
+    assert leaderboard[0][1]["name"] == "Member 5"
+
+    # the index gets updated incrementally once loaded
+    await bank.deposit_credits(members[0], 1000)
+    await bank.withdraw_credits(members[4], 400)
+    assert await bank.get_leaderboard_position(members[0]) == 1
+    assert await bank.get_leaderboard_position(members[4]) == 5
+    page = await bank.get_leaderboard(2, empty_guild, offset=1)
+    assert [user_id for user_id, _acc in page] == [4, 3]
+
+    await bank.wipe_bank(empty_guild)
+    assert await bank.get_leaderboard(guild=empty_guild) == []
+    assert await bank.get_leaderboard_position(members[0]) is None
+
+
+async def test_bank_transaction(bank, empty_guild):
+    mock_member = namedtuple("Member", "id guild display_name")
+    mbr1, mbr2, mbr3 = (mock_member(idx, empty_guild, f"Member {idx}") for idx in range(3))
+    await bank.set_balance(mbr1, 500)
+
+    async with bank.Transaction() as transaction:
+        transaction.transfer(mbr1, mbr2, 200)
+        transaction.transfer(mbr1, mbr3, 200)
+        transaction.withdraw(mbr3, 50)
+    default_bal = await bank.get_default_balance(empty_guild)
+    assert await bank.get_balance(mbr1) == 100
+    assert await bank.get_balance(mbr2) == default_bal + 200
+    assert (await bank.get_account(mbr3)).name == "Member 2"
+    assert await bank.get_balance(mbr3) == default_bal + 150
+    assert await bank.get_leaderboard_position(mbr3) == 2
+
+    transaction = bank.Transaction()
+    transaction.deposit(mbr2, 100)
+    transaction.withdraw(mbr1, 101)
+    with pytest.raises(ValueError):
+        await transaction.commit()
+    assert await bank.get_balance(mbr2) == default_bal + 200
+
+    await bank.set_max_balance(1000, empty_guild)
+    transaction = bank.Transaction()
+    transaction.withdraw(mbr1, 100)
+    transaction.set_balance(mbr2, 1001)
+    with pytest.raises(bank.errors.BalanceTooHigh):
+        await transaction.commit()
+    assert await bank.get_balance(mbr1) == 100
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+
+from redbot.cogs.filter import Filter
+from redbot.cogs.filter.matcher import WordMatcher
+from redbot.core import Config
+
+
+@pytest.fixture()
+def filter_cog(config, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+        return Filter(None)
+
+
+def test_word_matcher():
+    matcher = WordMatcher(["bad", "bad word", "c++", "ba"])
+    assert len(matcher) == 4
+    assert "BAD" in matcher
+    assert "b" not in matcher
+
+    text = "Bad! a BAD WORD, badly, abad, c++ and ba."
+    assert matcher.find_all(text) == {"Bad", "BAD", "BAD WORD", "ba"}
+    # Same semantics as the regex the cog used to build.
+    pattern = re.compile("|".join(rf"\b{re.escape(w)}\b" for w in ["bad", "ba"]), flags=re.I)
+    assert set(pattern.findall(text)) <= matcher.find_all(text)
+
+    assert matcher.add("Word") is True
+    assert matcher.add("word") is False
+    assert matcher.add("") is False
+    assert matcher.find_all("a word") == {"word"}
+
+    assert matcher.remove("bad") is True
+    assert matcher.remove("bad") is False
+    assert "bad word" in matcher
+    assert matcher.find_all("bad") == set()
+    assert matcher.remove("bad word") is True
+    assert matcher.remove("ba") is True
+    assert matcher.find_all("ba bad") == set()
+    assert len(matcher) == 2
+
+
+async def test_filter_settings_cache(filter_cog, empty_member):
+    guild = empty_member.guild
+    settings = await filter_cog.get_guild_settings(guild)
+    assert "filter" not in settings
+    assert settings["filterban_count"] == 0
+    # Served from memory afterwards.
+    await filter_cog.config.guild(guild).filterban_count.set(3)
+    assert (await filter_cog.get_guild_settings(guild))["filterban_count"] == 0
+
+    counters = await filter_cog.get_member_counters(empty_member)
+    counters["filter_count"] += 2
+    counters["next_reset_time"] = 2**40
+    filter_cog._dirty_counters.add((guild.id, empty_member.id))
+    assert await filter_cog.config.member(empty_member).filter_count() == 0
+
+    await filter_cog.flush_member_counters()
+    assert await filter_cog.config.member(empty_member).all() == {
+        "filter_count": 2,
+        "next_reset_time": 2**40,
+    }
+    assert (guild.id, empty_member.id) in filter_cog.member_counters
+
+    # Expired counters are dropped from memory once saved.
+    counters["next_reset_time"] = 0
+    await filter_cog.flush_member_counters()
+    assert not filter_cog.member_counters
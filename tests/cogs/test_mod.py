@@ -39,3 +39,155 @@ async def test_modlog_case_create(mod, ctx, monkeypatch, member_factory, empty_u
 async def test_modlog_set_modlog_channel(mod, ctx):
     await mod.set_modlog_channel(ctx.guild, ctx.channel)
     assert await mod.get_modlog_channel(ctx.guild) == ctx.channel.id
+
+
+async def test_modlog_case_index(mod, ctx, monkeypatch, empty_user):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+    await mod.register_casetype(name="kick", default_setting=True, image=":boot:", case_str="Kick")
+
+    class MockGuild:
+        def __init__(self, id):
+            self.id = id
+
+        def get_channel(self, channel_id):
+            return None
+
+        def get_channel_or_thread(self, channel_id):
+            return None
+
+    guild = MockGuild(ctx.guild.id)
+    bot = ctx.bot
+    mock_connection = namedtuple("Connection", "user get_user")
+    monkeypatch.setattr(bot, "_connection", mock_connection(empty_user, lambda user_id: None))
+    created_at = datetime.now(timezone.utc)
+    for user_id, moderator_id, action_type in (
+        (1, 10, "ban"),
+        (2, 10, "kick"),
+        (1, 11, "kick"),
+        (1, 10, "kick"),
+    ):
+        await mod.create_case(bot, guild, created_at, action_type, user_id, moderator_id)
+
+    cases = await mod.get_cases_for_member(guild, bot, member_id=1)
+    assert [case.case_number for case in cases] == [1, 3, 4]
+    cases = [
+        case.case_number
+        async for case in mod.aiter_cases(
+            guild, bot, moderator_id=10, action_type="kick", reverse=True, batch_size=1
+        )
+    ]
+    assert cases == [4, 2]
+
+    case = await mod.get_case(3, guild, bot)
+    await case.edit({"moderator": 10})
+    assert [case.case_number async for case in mod.aiter_cases(guild, bot, moderator_id=10)] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+    await mod.reset_cases(guild)
+    assert await mod.get_all_cases(guild, bot) == []
+
+
+async def test_modlog_bulk_user_fetch(mod, ctx, monkeypatch, empty_user):
+    import asyncio
+    from datetime import datetime, timezone
+
+    import discord
+
+    await test_modlog_register_casetype(mod)
+
+    class MockGuild:
+        def __init__(self, id):
+            self.id = id
+
+        def get_channel(self, channel_id):
+            return None
+
+        def get_channel_or_thread(self, channel_id):
+            return None
+
+    guild = MockGuild(ctx.guild.id)
+    bot = ctx.bot
+    mock_connection = namedtuple("Connection", "user get_user")
+    monkeypatch.setattr(bot, "_connection", mock_connection(empty_user, lambda user_id: None))
+
+    fetched = []
+    running = 0
+    max_running = 0
+
+    async def fetch_user(user_id):
+        nonlocal running, max_running
+        fetched.append(user_id)
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if user_id == 404:
+            raise discord.NotFound(namedtuple("Response", "status reason")(404, ""), "")
+        return f"user-{user_id}"
+
+    monkeypatch.setattr(bot, "fetch_user", fetch_user, raising=False)
+    created_at = datetime.now(timezone.utc)
+    for user_id in range(1, 21):
+        await mod.create_case(bot, guild, created_at, "ban", user_id, 100)
+    await mod.create_case(bot, guild, created_at, "ban", 404, 100)
+
+    cases = await mod.get_all_cases(guild, bot)
+    assert fetched == []
+    assert cases[0].user == 1
+
+    cases = await mod.get_all_cases(guild, bot, fetch_users=True)
+    assert sorted(fetched) == [*range(1, 21), 100, 404]
+    assert max_running == mod._USER_FETCH_CONCURRENCY
+    assert [case.user for case in cases] == [*(f"user-{idx}" for idx in range(1, 21)), 404]
+    assert {case.moderator for case in cases} == {"user-100"}
+
+
+async def test_tempban_expirations(config, monkeypatch):
+    from types import SimpleNamespace
+
+    import discord
+
+    from redbot.cogs.mod import Mod
+    from redbot.core import Config
+
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+        cog = Mod(None)
+
+    guild_id = 1000
+    await config.version.set("1.3.0")
+    await config.guild_from_id(guild_id).current_tempbans.set([1, 2])
+    await config.member_from_ids(guild_id, 1).banned_until.set(100.0)
+    await cog._maybe_update_config()
+    assert await config.tempban_expirations() == {str(guild_id): {"1": 100.0, "2": 0}}
+
+    await cog._load_tempban_expirations()
+    assert cog.tempban_scheduler.get((guild_id, 1)) == 100.0
+    await cog._forget_tempban(guild_id, 2)
+    assert (guild_id, 2) not in cog.tempban_scheduler
+    assert await config.tempban_expirations() == {str(guild_id): {"1": 100.0}}
+
+    def http_error(cls, status, code):
+        return cls(SimpleNamespace(status=status, reason=""), {"code": code, "message": ""})
+
+    unbanned = []
+
+    async def unban(user, *, reason=None):
+        if user.id == 2:
+            raise http_error(discord.NotFound, 404, 10026)
+        if user.id == 3:
+            raise http_error(discord.Forbidden, 403, 50013)
+        unbanned.append(user.id)
+
+    guild = SimpleNamespace(id=guild_id, name="Test", unban=unban)
+    guild_tempbans = [1, 2, 3, 4]
+    retry = await cog._check_guild_tempban_expirations(guild, guild_tempbans, [1, 2, 3, 4])
+    assert unbanned == [1]
+    assert retry == [3, 4]
+    assert guild_tempbans == [3, 4]
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import aiohttp
+
+from redbot.cogs.streams.streams import Streams
+from redbot.cogs.streams.streamtypes import (
+    TWITCH_FOLLOWS_ENDPOINT,
+    TWITCH_ID_ENDPOINT,
+    TWITCH_STREAMS_ENDPOINT,
+    TwitchHelix,
+    TwitchStream,
+)
+
+
+async def test_twitch_helix_batching(monkeypatch):
+    helix = TwitchHelix()
+    requests = []
+
+    async def get_data(url, params):
+        requests.append((url, params))
+        if url == TWITCH_STREAMS_ENDPOINT:
+            ids = [value for key, value in params if key == "user_id"]
+            if "150" in ids:
+                return 500, {}
+            return 200, {"data": [{"user_id": i} for i in ids if int(i) % 2]}
+        if url == TWITCH_ID_ENDPOINT:
+            return 200, {"data": [{"id": value, "login": f"user{value}"} for _, value in params]}
+        if url == TWITCH_FOLLOWS_ENDPOINT:
+            return 200, {"total": 42}
+
+    monkeypatch.setattr(helix, "get_data", get_data)
+
+    user_ids = [str(i) for i in range(250)]
+    streams = await helix.get_streams(user_ids + ["1"])
+    assert len(requests) == 3
+    assert all(len(params) <= 101 for _url, params in requests)
+    assert streams["1"] == (200, {"user_id": "1"})
+    assert streams["2"] == (200, None)
+    # The whole batch with the failed request is reported as failed.
+    assert streams["100"] == (500, {})
+    assert streams["201"] == (200, {"user_id": "201"})
+
+    requests.clear()
+    status, profiles = await helix.get_users(ids=["1", "3"])
+    assert status == 200
+    assert [p["login"] for p in profiles] == ["user1", "user3"]
+    status, profiles = await helix.get_users(ids=["1", "3"])
+    assert len(profiles) == 2
+    assert len(requests) == 1
+
+    assert await helix.get_followers("1") == 42
+    assert await helix.get_followers("1") == 42
+    assert len(requests) == 2
+
+
+async def test_twitch_stream_uses_helix(monkeypatch):
+    helix = TwitchHelix()
+    requests = []
+
+    async def get_data(url, params, *, headers=None):
+        requests.append((url, params, headers))
+        return 200, {"data": []}
+
+    monkeypatch.setattr(helix, "get_data", get_data)
+    stream = TwitchStream(_bot=None, _helix=helix, name="name", token="id", bearer="bearer")
+    assert await stream.get_data(TWITCH_STREAMS_ENDPOINT, {"user_id": "1"}) == (200, {"data": []})
+    # The request shares the session and rate limits of the cog's Helix client.
+    assert requests == [
+        (
+            TWITCH_STREAMS_ENDPOINT,
+            {"user_id": "1"},
+            {"Client-ID": "id", "Authorization": "Bearer bearer"},
+        )
+    ]
+    assert "_helix" not in stream.export()
+
+
+async def test_poll_streams_provider_error():
+    class FakeStream:
+        def __init__(self, platform_name):
+            self.platform_name = platform_name
+
+        async def is_online(self):
+            return "embed"
+
+    async def poll_twitch_streams(streams):
+        raise aiohttp.ContentTypeError(None, ())
+
+    twitch, picarto = FakeStream("Twitch"), FakeStream("Picarto")
+    cog = SimpleNamespace(
+        streams=[twitch, picarto], _poll_twitch_streams=poll_twitch_streams, last_check_stats={}
+    )
+    results = await Streams._poll_streams(cog)
+    # A failing provider doesn't stop the other providers from being checked.
+    assert isinstance(results[twitch], aiohttp.ContentTypeError)
+    assert results[picarto] == "embed"
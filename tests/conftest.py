@@ -22,17 +22,26 @@ def event_loop(request):
 def _get_backend_type():
     if os.getenv("RED_STORAGE_TYPE") == "postgres":
         return _drivers.BackendType.POSTGRES
+    elif os.getenv("RED_STORAGE_TYPE") == "sharded_json":
+        return _drivers.BackendType.SHARDED_JSON
+    elif os.getenv("RED_STORAGE_TYPE") == "sqlite":
+        return _drivers.BackendType.SQLITE
     else:
         return _drivers.BackendType.JSON
 
 
 @pytest.fixture(scope="session", autouse=True)
-async def _setup_driver():
+async def _setup_driver(tmp_path_factory):
     backend_type = _get_backend_type()
     storage_details = {}
+    if backend_type is _drivers.BackendType.SQLITE:
+        storage_details["path"] = str(tmp_path_factory.mktemp("sqlite") / "settings.sqlite3")
     data_manager.storage_type = lambda: backend_type.value
     data_manager.storage_details = lambda: storage_details
     driver_cls = _drivers.get_driver_class(backend_type)
     await driver_cls.initialize(**storage_details)
+    cache_size = int(os.getenv("RED_CONFIG_CACHE_SIZE", 0))
+    await _drivers.CachingDriver.initialize(max_size=cache_size)
     yield
+    await _drivers.CachingDriver.teardown()
     await driver_cls.teardown()
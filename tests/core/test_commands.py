@@ -69,3 +69,40 @@ def test_converter_relativedelta():
     assert converter.parse_relativedelta("1 year 10 days 3 seconds") == relativedelta(
         years=1, days=10, seconds=3
     )
+
+
+def test_requires_rule_cache():
+    from types import SimpleNamespace
+
+    requires = commands.Requires(None, None, {}, [])
+    guild = SimpleNamespace(id=1)
+    everyone, low_role, high_role = (SimpleNamespace(id=role_id) for role_id in (1, 10, 11))
+    author = SimpleNamespace(
+        id=100, voice=None, roles=[everyone, low_role, high_role], _roles=[10, 11]
+    )
+    channel = SimpleNamespace(id=50, category=None)
+    ctx = SimpleNamespace(author=author, guild=guild, channel=channel)
+
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.NORMAL
+    stats = commands.Requires.get_rule_cache_stats()
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.NORMAL
+    assert commands.Requires.get_rule_cache_stats()["hits"] == stats["hits"] + 1
+
+    requires.set_rule(10, commands.PermState.ACTIVE_DENY, guild.id)
+    requires.set_rule(11, commands.PermState.ACTIVE_ALLOW, guild.id)
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.ACTIVE_ALLOW
+
+    # Changing the role hierarchy requires explicit invalidation.
+    author.roles = [everyone, high_role, low_role]
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.ACTIVE_ALLOW
+    commands.Requires.invalidate_rule_caches(guild.id)
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.ACTIVE_DENY
+
+    author._roles = [11]
+    author.roles = [everyone, high_role]
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.ACTIVE_ALLOW
+
+    requires.set_rule(100, commands.PermState.ACTIVE_DENY, commands.Requires.GLOBAL)
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.ACTIVE_DENY
+    requires.reset()
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.NORMAL
@@ -1,6 +1,7 @@
 import asyncio
 from unittest.mock import patch
 import pytest
+from redbot.core import errors
 from collections import Counter
 
 
@@ -422,6 +423,113 @@ async def test_all_works_as_ctxmgr(config):
     assert subgroup == {"foo": True, "bar": False}
 
 
+async def test_all_readonly_view(config):
+    config.register_global(subgroup={"foo": True, "nested": {"a": 1, "b": 2}})
+    await config.subgroup.set_raw("nested", "a", value=3)
+
+    subgroup = await config.subgroup.all(copy=False)
+    assert subgroup == {"foo": True, "nested": {"a": 3, "b": 2}}
+    with pytest.raises(TypeError):
+        subgroup["foo"] = False
+    assert subgroup.copy() == await config.subgroup.all()
+
+
+async def test_all_copy_on_write(config):
+    config.register_global(subgroup={"foo": True, "items": [1, 2]})
+    await config.subgroup.items.set([1, 2, 3])
+
+    subgroup = await config.subgroup.all(copy="lazy")
+    subgroup["foo"] = False
+    subgroup["items"].append(4)
+    assert subgroup == {"foo": False, "items": [1, 2, 3, 4]}
+    assert await config.subgroup.all() == {"foo": True, "items": [1, 2, 3]}
+
+    await config.subgroup.set(subgroup.copy())
+    assert await config.subgroup.all() == {"foo": False, "items": [1, 2, 3, 4]}
+
+
+async def test_all_invalid_copy_mode(config):
+    with pytest.raises(ValueError):
+        await config.all(copy="yes")
+
+
+async def test_all_members_readonly_view(config, empty_member):
+    config.register_member(foo=True, bar={"baz": 1})
+    await config.member(empty_member).bar.set({"qux": 2})
+
+    copied = await config.all_members()
+    assert await config.all_members(copy=False) == copied
+    assert (
+        await config.all_members(empty_member.guild, copy="lazy") == copied[empty_member.guild.id]
+    )
+
+
+async def test_get_many(config):
+    config.register_member(balance=0, bar={"baz": 1})
+    await config.member_from_ids(1, 2).balance.set(10)
+    await config.member_from_ids(1, 3).bar.set({"qux": 2})
+
+    values = [
+        config.member_from_ids(1, 2).balance,
+        config.member_from_ids(1, 3).balance,
+        config.member_from_ids(1, 3).bar,
+        config.member_from_ids(4, 5),
+    ]
+    assert await config.get_many(values) == [
+        10,
+        0,
+        {"baz": 1, "qux": 2},
+        {"balance": 0, "bar": {"baz": 1}},
+    ]
+
+
+async def test_set_many_and_clear_many(config):
+    config.register_member(balance=0)
+    await config.set_many(
+        {config.member_from_ids(1, 2).balance: 10, config.member_from_ids(1, 3).balance: 20}
+    )
+    assert await config.member_from_ids(1, 2).balance() == 10
+    assert await config.member_from_ids(1, 3).balance() == 20
+
+    await config.clear_many([config.member_from_ids(1, 2), config.member_from_ids(1, 3).balance])
+    assert await config.all_members() == {1: {3: {"balance": 0}}}
+
+    with pytest.raises(ValueError):
+        await config.set_many([(config.member_from_ids(1, 2), 1)])
+
+
+async def test_group_set_many_and_clear_many(config):
+    config.register_guild(foo=0, bar={})
+    group = config.guild_from_id(1)
+    await group.set_many({"foo": 1, ("bar", 2): {3: True}})
+    assert await group.all() == {"foo": 1, "bar": {"2": {"3": True}}}
+
+    await group.clear_many([("bar", 2), "foo"])
+    assert await group.all() == {"foo": 0, "bar": {}}
+
+
+async def test_value_inc_and_toggle(config):
+    config.register_member(count=0, ratio=0.5, enabled=True, name="")
+    member = config.member_from_ids(1, 2)
+    assert await member.count.inc() == 1
+    results = await asyncio.gather(*(member.count.inc(2) for _ in range(10)))
+    assert sorted(results) == list(range(3, 22, 2))
+    assert await member.count() == 21
+    assert await member.ratio.inc(1) == 1.5
+
+    assert await member.enabled.toggle() is False
+    assert await member.enabled.toggle() is True
+    assert await member.enabled() is True
+
+    with pytest.raises(TypeError):
+        await member.name.inc()
+    with pytest.raises(TypeError):
+        await member.name.toggle()
+    await member.count.set("foo")
+    with pytest.raises(errors.StoredTypeError):
+        await member.count.inc()
+
+
 async def test_get_raw_mixes_defaults(config):
     config.register_global(subgroup={"foo": True})
     await config.subgroup.set_raw("bar", value=False)
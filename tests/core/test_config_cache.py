@@ -0,0 +1,147 @@
+import asyncio
+import uuid
+
+import pytest
+
+from redbot.core import Config, _drivers
+from redbot.core._drivers import CachingDriver, IdentifierData, JsonDriver
+from redbot.core._drivers import cache
+
+
+@pytest.fixture()
+async def cached_driver(tmp_path):
+    old_cache = cache._cache
+    await CachingDriver.initialize(max_size=1024**2)
+    yield CachingDriver(JsonDriver(f"PyTest{uuid.uuid4().hex}", "0", data_path_override=tmp_path))
+    cache._cache = old_cache
+
+
+def _ident(driver, category, pkeys, identifiers=()):
+    pkey_len = {"GLOBAL": 0, "GUILD": 1, "MEMBER": 2}[category]
+    return IdentifierData(
+        driver.cog_name, driver.unique_cog_identifier, category, pkeys, identifiers, pkey_len
+    )
+
+
+async def test_cache_hits_and_misses(cached_driver):
+    ident = _ident(cached_driver, "GUILD", ("1",), ("foo",))
+    with pytest.raises(KeyError):
+        await cached_driver.get(ident)
+    with pytest.raises(KeyError):
+        await cached_driver.get(ident)
+    stats = CachingDriver.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    await cached_driver.set(ident, [1, 2])
+    value = await cached_driver.get(ident)
+    assert value == [1, 2]
+    value.append(3)
+    assert await cached_driver.get(ident) == [1, 2]
+    stats = CachingDriver.get_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+async def test_cache_invalidates_parents_and_children(cached_driver):
+    guild = _ident(cached_driver, "GUILD", ("1",))
+    foo = _ident(cached_driver, "GUILD", ("1",), ("foo", "bar"))
+    await cached_driver.set(foo, 1)
+
+    assert await cached_driver.get(guild) == {"foo": {"bar": 1}}
+    assert await cached_driver.get(foo) == 1
+
+    await cached_driver.set(_ident(cached_driver, "GUILD", ("1",), ("foo",)), {"bar": 2})
+    assert await cached_driver.get(guild) == {"foo": {"bar": 2}}
+    assert await cached_driver.get(foo) == 2
+
+    await cached_driver.clear(_ident(cached_driver, "GUILD", ()))
+    with pytest.raises(KeyError):
+        await cached_driver.get(guild)
+    with pytest.raises(KeyError):
+        await cached_driver.get(foo)
+
+
+async def test_cache_skips_fill_raced_by_write(cached_driver):
+    ident = _ident(cached_driver, "GLOBAL", (), ("foo",))
+    await cached_driver.set(ident, 1)
+
+    inner_get = cached_driver.driver.get
+
+    async def slow_get(identifier_data):
+        value = await inner_get(identifier_data)
+        await cached_driver.set(ident, 2)
+        return value
+
+    cached_driver.driver.get = slow_get
+    assert await cached_driver.get(ident) == 1
+    cached_driver.driver.get = inner_get
+    assert await cached_driver.get(ident) == 2
+
+
+async def test_cache_lru_eviction(cached_driver):
+    cache._cache = cache._LRUCache(max_size=4 * cache._ENTRY_OVERHEAD + 1024)
+    for idx in range(10):
+        ident = _ident(cached_driver, "GUILD", (str(idx),), ("foo",))
+        await cached_driver.set(ident, idx)
+        await cached_driver.get(ident)
+    stats = CachingDriver.get_stats()
+    assert stats["size"] <= stats["max_size"]
+    assert stats["evictions"] > 0
+    assert stats["entries"] < 10
+
+    # the most recently used entry is still cached
+    await cached_driver.get(_ident(cached_driver, "GUILD", ("9",), ("foo",)))
+    assert CachingDriver.get_stats()["hits"] == 1
+
+
+async def test_cache_with_value_lock(cached_driver):
+    config = Config(
+        cog_name=cached_driver.cog_name,
+        unique_identifier=cached_driver.unique_cog_identifier,
+        driver=cached_driver,
+    )
+    config.register_global(counter=0)
+
+    async def increment():
+        async with config.counter.get_lock():
+            await config.counter.set(await config.counter() + 1)
+
+    await asyncio.gather(*(increment() for _ in range(20)))
+    assert await config.counter() == 20
+
+
+async def test_cache_get_many(cached_driver):
+    foo = _ident(cached_driver, "GUILD", ("1",), ("foo",))
+    bar = _ident(cached_driver, "GUILD", ("1",), ("bar",))
+    await cached_driver.set_many([(foo, 1), (bar, 2)])
+    assert await cached_driver.get(foo) == 1
+
+    missing = _ident(cached_driver, "GUILD", ("2",))
+    assert await cached_driver.get_many([foo, bar, missing], None) == [1, 2, None]
+    stats = CachingDriver.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+
+    await cached_driver.clear_many([foo])
+    assert await cached_driver.get_many([foo, bar, missing], None) == [None, 2, None]
+
+
+async def test_cache_class_methods_use_wrapped_driver(cached_driver, monkeypatch):
+    calls = []
+
+    class WrappedDriver:
+        @classmethod
+        async def aiter_cogs(cls):
+            yield "Cog", "0"
+
+        @classmethod
+        async def delete_all_data(cls, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr(_drivers, "get_driver_class", lambda: WrappedDriver)
+    assert [cog async for cog in CachingDriver.aiter_cogs()] == [("Cog", "0")]
+
+    ident = _ident(cached_driver, "GUILD", ("1",), ("foo",))
+    await cached_driver.set(ident, 1)
+    assert await cached_driver.get(ident) == 1
+    await CachingDriver.delete_all_data(drop_db=True)
+    assert calls == [{"drop_db": True}]
+    assert CachingDriver.get_stats()["entries"] == 0
@@ -0,0 +1,85 @@
+import json
+import uuid
+
+import pytest
+
+from redbot.core._drivers import IdentifierData, JsonDriver
+from redbot.core._drivers import json as json_module
+
+
+@pytest.fixture()
+def json_driver(tmp_path):
+    return JsonDriver(f"PyTest{uuid.uuid4().hex}", "0", data_path_override=tmp_path)
+
+
+@pytest.fixture()
+async def write_behind():
+    await JsonDriver.initialize(write_delay=60, max_pending_writes=3)
+    yield
+    await JsonDriver.teardown()
+    await JsonDriver.initialize()
+
+
+def _ident(driver, *identifiers):
+    return IdentifierData(
+        driver.cog_name, driver.unique_cog_identifier, "GLOBAL", (), identifiers, 0
+    )
+
+
+def _read_file(driver):
+    with driver.data_path.open(encoding="utf-8") as fs:
+        return json.load(fs)
+
+
+async def test_json_driver_writes_immediately_by_default(json_driver):
+    await json_driver.set(_ident(json_driver, "foo"), 1)
+    assert _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"]["foo"] == 1
+    assert JsonDriver.get_write_stats()["pending_writes"] == {}
+
+
+async def test_json_driver_write_behind_defers_writes(json_driver, write_behind):
+    await json_driver.set(_ident(json_driver, "foo"), 1)
+    await json_driver.set(_ident(json_driver, "bar"), 2)
+    assert await json_driver.get(_ident(json_driver, "bar")) == 2
+    assert _read_file(json_driver) == {}
+    assert JsonDriver.get_write_stats()["pending_writes"] == {json_driver.cog_name: 2}
+
+    await JsonDriver.flush()
+    data = _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"]
+    assert data == {"foo": 1, "bar": 2}
+    assert JsonDriver.get_write_stats()["pending_writes"] == {}
+
+
+async def test_json_driver_write_behind_threshold(json_driver, write_behind):
+    for idx in range(3):
+        await json_driver.set(_ident(json_driver, str(idx)), idx)
+    data = _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"]
+    assert data == {"0": 0, "1": 1, "2": 2}
+
+    await json_driver.clear(_ident(json_driver, "0"))
+    assert "0" in _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"]
+
+
+async def test_json_driver_teardown_flushes(json_driver, write_behind):
+    await json_driver.set(_ident(json_driver, "foo"), "bar")
+    await JsonDriver.teardown()
+    assert _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"] == {"foo": "bar"}
+    assert not json_module._flush_handles
+
+
+async def test_json_driver_failed_flush_is_retried(json_driver, write_behind, monkeypatch):
+    await json_driver.set(_ident(json_driver, "foo"), "bar")
+
+    def save_json(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json_module, "_save_json", save_json)
+    await JsonDriver.flush()
+    # The changes are still pending and another flush is scheduled.
+    assert json_driver.cog_name in json_module._dirty_paths
+    assert json_driver.cog_name in json_module._flush_handles
+
+    monkeypatch.undo()
+    await JsonDriver.flush()
+    assert _read_file(json_driver)[json_driver.unique_cog_identifier]["GLOBAL"] == {"foo": "bar"}
+    assert not json_module._flush_handles
@@ -0,0 +1,73 @@
+import discord
+
+from redbot.core._settings_caches import EmbedSettingsCache, WhitelistBlacklistManager
+
+
+async def test_embed_settings_cache(config):
+    config.register_global(embeds=True)
+    config.register_guild(embeds=None)
+    config.register_channel(embeds=None)
+    config.register_user(embeds=None)
+    config.init_custom("COMMAND", 2)
+    config.register_custom("COMMAND", embeds=None)
+    cache = EmbedSettingsCache(config)
+
+    assert await cache.get_global() is True
+    assert await cache.get_guild(1) is None
+    assert await cache.get_command("ping", 1) is None
+
+    await cache.set_global(False)
+    await cache.set_guild(1, True)
+    await cache.set_command("ping", 0, True)
+    await cache.set_channel(2, False)
+    await cache.set_user(3, False)
+    assert await config.embeds() is False
+    assert await config.guild_from_id(1).embeds() is True
+    assert await config.custom("COMMAND", "ping", 0).embeds() is True
+    assert await config.channel_from_id(2).embeds() is False
+    assert await config.user_from_id(3).embeds() is False
+
+    # Cached values are served without touching Config.
+    await config.guild_from_id(1).embeds.set(False)
+    assert await cache.get_guild(1) is True
+
+    await cache.set_global(None)
+    await cache.set_guild(1, None)
+    assert await cache.get_global() is True
+    assert await cache.get_guild(1) is None
+    assert await config.guild_from_id(1).embeds() is None
+
+    await config.user_from_id(3).clear()
+    cache.forget_user(3)
+    assert await cache.get_user(3) is None
+
+
+async def test_whitelist_blacklist_compiled(config):
+    config.register_global(whitelist=[], blacklist=[])
+    config.register_guild(whitelist=[], blacklist=[])
+    manager = WhitelistBlacklistManager(config)
+    guild = discord.Object(id=1)
+
+    compiled = await manager.get_compiled(guild.id)
+    assert compiled.empty
+    assert compiled.allows({2, 3})
+
+    await manager.add_to_blacklist(guild, [3])
+    compiled = await manager.get_compiled(guild.id)
+    assert not compiled.empty
+    assert not compiled.allows({2, 3})
+    assert compiled.allows({2})
+
+    # The allowlist takes precedence over the blocklist.
+    await manager.add_to_whitelist(guild, [3, 4])
+    assert (await manager.get_compiled(guild.id)).allows({3})
+    assert not (await manager.get_compiled(guild.id)).allows({2})
+
+    await manager.remove_from_whitelist(guild, [3, 4])
+    await manager.clear_blacklist(guild)
+    assert (await manager.get_compiled(guild.id)).empty
+
+    await manager.add_to_whitelist(None, [5])
+    assert not (await manager.get_compiled()).allows(6)
+    await manager.discord_deleted_user(5)
+    assert (await manager.get_compiled()).empty
@@ -0,0 +1,94 @@
+import json
+import uuid
+
+import pytest
+
+from redbot.core._drivers import IdentifierData, JsonDriver, ShardedJsonDriver
+from redbot.core._drivers import sharded_json
+
+
+def _cog_name():
+    return f"PyTest{uuid.uuid4().hex}"
+
+
+@pytest.fixture()
+def sharded_driver(tmp_path):
+    return ShardedJsonDriver(_cog_name(), "0", data_path_override=tmp_path)
+
+
+def _ident(driver, category, pkeys, identifiers=(), pkey_len=None):
+    if pkey_len is None:
+        pkey_len = {"GLOBAL": 0, "GUILD": 1, "MEMBER": 2}.get(category, len(pkeys))
+    return IdentifierData(
+        driver.cog_name,
+        driver.unique_cog_identifier,
+        category,
+        pkeys,
+        identifiers,
+        pkey_len,
+        category not in ("GLOBAL", "GUILD", "MEMBER"),
+    )
+
+
+def _read(path):
+    with path.open(encoding="utf-8") as fs:
+        return json.load(fs)
+
+
+async def test_sharded_json_layout(sharded_driver):
+    await sharded_driver.set(_ident(sharded_driver, "GLOBAL", (), ("foo",)), 1)
+    await sharded_driver.set(_ident(sharded_driver, "GUILD", ("1",), ("bar",)), 2)
+    await sharded_driver.set(_ident(sharded_driver, "MEMBER", ("1", "2"), ("baz",)), 3)
+    await sharded_driver.set(_ident(sharded_driver, "Custom Group", ("a/b",), ("qux",)), 4)
+
+    root = sharded_driver.data_path / "0"
+    assert _read(root / "GLOBAL.json") == {"foo": 1}
+    assert _read(root / "GUILD" / "1.json") == {"bar": 2}
+    assert _read(root / "MEMBER" / "1.json") == {"2": {"baz": 3}}
+    custom_path = root / f"~{'Custom Group'.encode().hex()}" / f"~{'a/b'.encode().hex()}.json"
+    assert _read(custom_path) == {"qux": 4}
+
+
+async def test_sharded_json_lazy_load(tmp_path):
+    cog_name = _cog_name()
+    driver = ShardedJsonDriver(cog_name, "0", data_path_override=tmp_path)
+    await driver.set(_ident(driver, "GUILD", ("1",), ("foo",)), 1)
+    await driver.set(_ident(driver, "GUILD", ("2",), ("foo",)), 2)
+    # Start with a fresh in-memory store.
+    del sharded_json._stores[cog_name]
+    driver = ShardedJsonDriver(cog_name, "0", data_path_override=tmp_path)
+
+    assert await driver.get(_ident(driver, "GUILD", ("2",), ("foo",))) == 2
+    store = sharded_json._stores[cog_name]
+    assert store.loaded_shards == {("0", "GUILD", "2")}
+    assert "1" not in store.data["0"]["GUILD"]
+
+    assert await driver.get(_ident(driver, "GUILD", ())) == {"1": {"foo": 1}, "2": {"foo": 2}}
+
+
+async def test_sharded_json_clear_removes_shards(sharded_driver):
+    await sharded_driver.set(_ident(sharded_driver, "GUILD", ("1",), ("foo",)), 1)
+    await sharded_driver.set(_ident(sharded_driver, "GUILD", ("2",), ("foo",)), 2)
+
+    await sharded_driver.clear(_ident(sharded_driver, "GUILD", ("1",)))
+    assert not (sharded_driver.data_path / "0" / "GUILD" / "1.json").exists()
+    assert (sharded_driver.data_path / "0" / "GUILD" / "2.json").exists()
+
+    await sharded_driver.clear(_ident(sharded_driver, "GUILD", ()))
+    assert not (sharded_driver.data_path / "0" / "GUILD" / "2.json").exists()
+    with pytest.raises(KeyError):
+        await sharded_driver.get(_ident(sharded_driver, "GUILD", ("2",)))
+
+
+async def test_sharded_json_import_from_json(tmp_path):
+    cog_name = _cog_name()
+    json_driver = JsonDriver(cog_name, "0", data_path_override=tmp_path / "json")
+    await json_driver.set(_ident(json_driver, "GLOBAL", (), ("foo",)), True)
+    await json_driver.set(_ident(json_driver, "MEMBER", ("1", "2"), ("bar",)), [1, 2])
+    await json_driver.set(_ident(json_driver, "MEMBER", ("3", "4"), ("bar",)), [3])
+
+    sharded_driver = ShardedJsonDriver(cog_name, "0", data_path_override=tmp_path / "sharded")
+    exported = await json_driver.export_data({})
+    await sharded_driver.import_data(exported, {})
+    assert await sharded_driver.export_data({}) == exported
+    assert _read(sharded_driver.data_path / "0" / "MEMBER" / "3.json") == {"4": {"bar": [3]}}
@@ -0,0 +1,84 @@
+import asyncio
+import sqlite3
+import uuid
+
+import pytest
+
+from redbot.core import errors
+from redbot.core._drivers import IdentifierData, JsonDriver, SqliteDriver
+
+
+@pytest.fixture()
+async def sqlite_driver(tmp_path):
+    initialized = SqliteDriver._conn is None
+    if initialized:
+        await SqliteDriver.initialize(path=str(tmp_path / "settings.sqlite3"))
+    yield SqliteDriver(f"PyTest{uuid.uuid4().hex}", "0")
+    if initialized:
+        await SqliteDriver.teardown()
+
+
+def _ident(driver, category, pkeys, identifiers=()):
+    pkey_len = {"GLOBAL": 0, "GUILD": 1, "MEMBER": 2}[category]
+    return IdentifierData(
+        driver.cog_name, driver.unique_cog_identifier, category, pkeys, identifiers, pkey_len
+    )
+
+
+async def test_sqlite_partial_primary_keys(sqlite_driver):
+    await sqlite_driver.set(_ident(sqlite_driver, "MEMBER", ("1", "2"), ("foo",)), 1)
+    await sqlite_driver.set(_ident(sqlite_driver, "MEMBER", ("1", "3"), ("foo",)), 2)
+    await sqlite_driver.set(_ident(sqlite_driver, "MEMBER", ("10", "2"), ("foo",)), 3)
+
+    assert await sqlite_driver.get(_ident(sqlite_driver, "MEMBER", ("1",))) == {
+        "2": {"foo": 1},
+        "3": {"foo": 2},
+    }
+    await sqlite_driver.clear(_ident(sqlite_driver, "MEMBER", ("1",)))
+    with pytest.raises(KeyError):
+        await sqlite_driver.get(_ident(sqlite_driver, "MEMBER", ("1",)))
+    assert await sqlite_driver.get(_ident(sqlite_driver, "MEMBER", ())) == {
+        "10": {"2": {"foo": 3}}
+    }
+
+
+async def test_sqlite_concurrent_writes_share_transaction(sqlite_driver):
+    await asyncio.gather(
+        *(
+            sqlite_driver.set(_ident(sqlite_driver, "GUILD", (str(idx),), ("foo",)), idx)
+            for idx in range(50)
+        ),
+        sqlite_driver.set(_ident(sqlite_driver, "GLOBAL", (), ("bar",)), 1),
+    )
+    with pytest.raises(errors.CannotSetSubfield):
+        await sqlite_driver.set(_ident(sqlite_driver, "GLOBAL", (), ("bar", "baz")), 2)
+
+    guilds = await sqlite_driver.get(_ident(sqlite_driver, "GUILD", ()))
+    assert guilds == {str(idx): {"foo": idx} for idx in range(50)}
+    assert await sqlite_driver.get(_ident(sqlite_driver, "GLOBAL", ())) == {"bar": 1}
+
+
+async def test_sqlite_import_from_json(sqlite_driver, tmp_path):
+    json_driver = JsonDriver(sqlite_driver.cog_name, "0", data_path_override=tmp_path / "json")
+    await json_driver.set(_ident(json_driver, "GLOBAL", (), ("foo",)), True)
+    await json_driver.set(_ident(json_driver, "MEMBER", ("1", "2"), ("bar",)), [1, 2])
+
+    exported = await json_driver.export_data({})
+    await sqlite_driver.import_data(exported, {})
+    assert await sqlite_driver.export_data({}) == exported
+    assert (sqlite_driver.cog_name, "0") in [c async for c in SqliteDriver.aiter_cogs()]
+
+
+async def test_sqlite_backup(sqlite_driver, tmp_path):
+    await sqlite_driver.set(_ident(sqlite_driver, "GUILD", ("1",), ("foo",)), "bar")
+    destination = tmp_path / "backup.sqlite3"
+    await SqliteDriver.backup(destination)
+
+    conn = sqlite3.connect(str(destination))
+    try:
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM red_config WHERE cog_name = ?", (sqlite_driver.cog_name,)
+        ).fetchone()
+    finally:
+        conn.close()
+    assert count == 1
@@ -258,3 +258,77 @@ def test_pagify_length_hint():
         assert operator.length_hint(it) == remaining
 
     assert operator.length_hint(it) == 0
+
+
+def test_antispam(monkeypatch):
+    from datetime import timedelta
+
+    from redbot.core.utils import antispam
+
+    now = 1000.0
+    monkeypatch.setattr(antispam.time, "monotonic", lambda: now)
+    intervals = [(timedelta(seconds=5), 2), (timedelta(minutes=1), 3)]
+
+    single = antispam.AntiSpam(intervals)
+    keyed = antispam.KeyedAntiSpam(intervals)
+    for _ in range(2):
+        assert not single.spammy
+        assert not keyed.spammy("a")
+        single.stamp()
+        keyed.stamp("a")
+    assert single.spammy
+    assert keyed.spammy("a")
+    assert not keyed.spammy("b")
+
+    now += 5
+    assert not single.spammy
+    assert not keyed.spammy("a")
+    single.stamp()
+    keyed.stamp("a")
+    assert single.spammy
+    assert keyed.spammy("a")
+
+    keyed.stamp("b")
+    now += 60
+    assert not single.spammy
+    assert "a" in keyed
+    now += 5
+    assert not keyed.spammy("a")
+    assert len(keyed) == 0
+
+
+async def test_expiry_scheduler():
+    import time
+
+    from redbot.core.utils.scheduler import ExpiryScheduler
+
+    batches = []
+    done = asyncio.Event()
+
+    async def callback(keys):
+        batches.append(sorted(keys))
+        done.set()
+
+    scheduler = ExpiryScheduler(callback, leeway=0.05)
+    now = time.time()
+    scheduler.schedule("a", now + 0.1)
+    scheduler.schedule("b", now + 0.12)
+    scheduler.schedule("c", now + 0.1)
+    scheduler.schedule("d", now + 3600)
+    assert scheduler.cancel("c")
+    assert not scheduler.cancel("c")
+    assert len(scheduler) == 3
+    scheduler.start()
+    try:
+        await asyncio.wait_for(done.wait(), 5)
+        assert batches == [["a", "b"]]
+        assert "d" in scheduler and len(scheduler) == 1
+
+        # Scheduling an earlier key wakes the sleeping scheduler up.
+        done.clear()
+        scheduler.schedule("d", time.time())
+        await asyncio.wait_for(done.wait(), 5)
+        assert batches[-1] == ["d"]
+        assert len(scheduler) == 0
+    finally:
+        scheduler.stop()
@@ -0,0 +1,16 @@
+"""Setup shared by the benchmarks which use Config."""
+import asyncio
+import copy
+import tempfile
+from typing import Any, Awaitable, Callable
+
+from redbot.core import data_manager
+
+
+def run_with_temporary_config(func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    """Run the coroutine function with Config stored in a temporary JSON backend."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_manager.basic_config = copy.deepcopy(data_manager.basic_config_default)
+        data_manager.basic_config["DATA_PATH"] = tmpdir
+        data_manager.basic_config["STORAGE_TYPE"] = "JSON"
+        asyncio.run(func(*args))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3.8
+"""Benchmark copying and copy-free reads of big Config scopes.
+
+Populates a temporary JSON backend with the given number of members (in a single guild)
+and users, and then compares time and peak memory allocated by:
+
+- ``Group.all()`` on the group holding all members of the guild,
+- ``Config._all_from_scope()`` on the user scope,
+
+with ``copy=True`` (the default), ``copy=False`` and ``copy="lazy"``.
+"""
+import time
+import tracemalloc
+
+import click
+
+from redbot.core import Config
+
+from _common import run_with_temporary_config
+
+
+async def _populate(config: Config, count: int) -> None:
+    entry = {"balance": 100, "name": "Some Name", "history": [1, 2, 3]}
+    await config._get_base_group(Config.MEMBER, "1").set(
+        {str(idx): dict(entry) for idx in range(count)}
+    )
+    await config._get_base_group(Config.USER).set({str(idx): dict(entry) for idx in range(count)})
+
+
+async def _measure(coro_func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    await coro_func()
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def _run(count: int) -> None:
+    config = Config.get_conf(None, identifier=1, cog_name="ConfigReadsBenchmark")
+    config.register_member(balance=0, name="", history=[], created_at=0)
+    config.register_user(balance=0, name="", history=[], created_at=0)
+    await _populate(config, count)
+
+    members_group = config._get_base_group(Config.MEMBER, "1")
+    cases = {
+        "Group.all()": lambda copy: members_group.all(copy=copy),
+        "Config._all_from_scope()": lambda copy: config._all_from_scope(Config.USER, copy=copy),
+    }
+    for name, func in cases.items():
+        click.echo(f"{name} with {count} entries:")
+        for copy in (True, False, "lazy"):
+            elapsed, peak = await _measure(lambda: func(copy))
+            click.echo(f"  copy={copy!r:<7} {elapsed * 1000:10.2f} ms {peak / 1024:12.1f} KiB")
+
+
+@click.command()
+@click.option("--count", default=100_000, show_default=True, help="Number of entries.")
+def main(count: int) -> None:
+    run_with_temporary_config(_run, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3.8
+"""Benchmark the per-message overhead of `Red.allowed_by_whitelist_blacklist()`.
+
+Populates a temporary JSON backend with allowlists and blocklists and runs the check
+for the given number of synthetic guild members, in the following scenarios:
+
+- no lists configured anywhere (the common case),
+- a global blocklist,
+- a guild allowlist matched through roles.
+
+For comparison, each scenario is also run through an equivalent of the previous
+implementation, which copied the cached lists on every call.
+"""
+import random
+import time
+
+import click
+import discord
+
+from redbot.core import Config
+from redbot.core._settings_caches import WhitelistBlacklistManager
+from redbot.core.bot import Red
+
+from _common import run_with_temporary_config
+
+
+class _Guild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.owner_id = 1
+
+
+class _Member:
+    def __init__(self, member_id: int, guild: _Guild, roles):
+        self.id = member_id
+        self.guild = guild
+        self._roles = roles
+
+
+class _Bot:
+    # Only what `Red.allowed_by_whitelist_blacklist()` uses.
+    def __init__(self, config: Config):
+        self.owner_ids = set()
+        self._whiteblacklist_cache = WhitelistBlacklistManager(config)
+
+    is_owner = Red.is_owner
+    allowed_by_whitelist_blacklist = Red.allowed_by_whitelist_blacklist
+
+    async def legacy_check(self, who) -> bool:
+        if await self.is_owner(who):
+            return True
+        cache = self._whiteblacklist_cache
+        global_whitelist = await cache.get_whitelist()
+        if global_whitelist:
+            if who.id not in global_whitelist:
+                return False
+        elif who.id in await cache.get_blacklist():
+            return False
+        guild = who.guild
+        if guild.owner_id == who.id:
+            return True
+        ids = {i for i in (who.id, *who._roles) if i != guild.id}
+        guild_whitelist = await cache.get_whitelist(guild)
+        if guild_whitelist:
+            if ids.isdisjoint(guild_whitelist):
+                return False
+        elif not ids.isdisjoint(await cache.get_blacklist(guild)):
+            return False
+        return True
+
+
+async def _measure(check, members) -> float:
+    start = time.perf_counter()
+    for member in members:
+        await check(member)
+    return time.perf_counter() - start
+
+
+async def _run(count: int) -> None:
+    config = Config.get_conf(None, identifier=1, cog_name="WhitelistBlacklistBenchmark")
+    config.register_global(whitelist=[], blacklist=[])
+    config.register_guild(whitelist=[], blacklist=[])
+
+    rng = random.Random(0)
+    guilds = [_Guild(guild_id) for guild_id in range(1000, 1010)]
+    members = [
+        _Member(
+            rng.randrange(10**6, 10**7),
+            rng.choice(guilds),
+            [rng.randrange(100, 200) for _ in range(rng.randrange(0, 10))],
+        )
+        for _ in range(count)
+    ]
+
+    async def global_blocklist(bot: _Bot) -> None:
+        await bot._whiteblacklist_cache.add_to_blacklist(None, range(10**6, 10**6 + 1000))
+
+    async def guild_allowlist(bot: _Bot) -> None:
+        for guild in guilds:
+            await bot._whiteblacklist_cache.add_to_whitelist(discord.Object(guild.id), [150])
+
+    scenarios = {
+        "no lists": None,
+        "global blocklist": global_blocklist,
+        "guild allowlists": guild_allowlist,
+    }
+    click.echo(f"{count} messages:")
+    for name, setup in scenarios.items():
+        await config.clear_all()
+        bot = _Bot(config)
+        if setup is not None:
+            await setup(bot)
+        # Warm up the caches.
+        await _measure(bot.allowed_by_whitelist_blacklist, members[:100])
+        await _measure(bot.legacy_check, members[:100])
+
+        compiled = await _measure(bot.allowed_by_whitelist_blacklist, members)
+        legacy = await _measure(bot.legacy_check, members)
+        click.echo(
+            f"  {name:<17} compiled: {compiled / count * 10**6:7.2f} us/message"
+            f"   legacy: {legacy / count * 10**6:7.2f} us/message"
+        )
+
+
+@click.command()
+@click.option("--count", default=10_000, show_default=True, help="Number of messages.")
+def main(count: int) -> None:
+    run_with_temporary_config(_run, count)
+
+
+if __name__ == "__main__":
+    main()